@@ -0,0 +1,134 @@
+"""
+Backtester demo.
+
+Prints a report from mock results when no trained LSTM model is present,
+otherwise shows how to run a real backtest.
+
+Run from the project root:
+    python -m examples.backtest_demo
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+from loguru import logger
+
+from src.ml.backtest import Backtester
+
+
+def main():
+    """Run the backtester demo."""
+    # Configure logging
+    logger.remove()
+    logger.add(sys.stdout, level="INFO")
+    
+    print("\n=== Backtester Example ===\n")
+    
+    # Check if ensemble model exists
+    lstm_path = "models/lstm_model.h5"
+    
+    if not Path(lstm_path).exists():
+        print(f"LSTM model not found: {lstm_path}")
+        print("Please train an LSTM model first")
+        print("\nGenerating mock backtest results...")
+        
+        # Create mock backtest results
+        mock_results = {
+            'symbol': 'PLTR',
+            'start_date': '2024-01-01',
+            'end_date': '2024-12-31',
+            'initial_capital': 10000.0,
+            'final_capital': 12500.0,
+            'trades': [
+                {
+                    'symbol': 'PLTR',
+                    'entry_date': pd.Timestamp('2024-01-15'),
+                    'exit_date': pd.Timestamp('2024-01-20'),
+                    'entry_price': 30.0,
+                    'exit_price': 32.0,
+                    'shares': 100,
+                    'pnl': 200.0,
+                    'pnl_pct': 6.67,
+                    'exit_reason': 'signal',
+                    'holding_days': 5
+                },
+                {
+                    'symbol': 'PLTR',
+                    'entry_date': pd.Timestamp('2024-02-01'),
+                    'exit_date': pd.Timestamp('2024-02-05'),
+                    'entry_price': 31.0,
+                    'exit_price': 29.5,
+                    'shares': 100,
+                    'pnl': -150.0,
+                    'pnl_pct': -4.84,
+                    'exit_reason': 'stop_loss',
+                    'holding_days': 4
+                }
+            ],
+            'daily_values': [
+                {'date': pd.Timestamp('2024-01-15'), 'portfolio_value': 10000, 'cash': 7000, 'position_value': 3000},
+                {'date': pd.Timestamp('2024-01-16'), 'portfolio_value': 10100, 'cash': 7000, 'position_value': 3100},
+            ],
+            'metrics': {
+                'total_return_pct': 25.0,
+                'total_trades': 2,
+                'winning_trades': 1,
+                'losing_trades': 1,
+                'win_rate': 0.5,
+                'avg_win': 200.0,
+                'avg_loss': -150.0,
+                'largest_win': 200.0,
+                'largest_loss': -150.0,
+                'sharpe_ratio': 1.2,
+                'max_drawdown_pct': 5.0,
+                'profit_factor': 1.33,
+                'avg_holding_days': 4.5
+            }
+        }
+        
+        # Generate report
+        backtester = Backtester()
+        report = backtester.generate_report(mock_results)
+        print(report)
+        
+    else:
+        print("To run a full backtest, you need:")
+        print("1. A trained LSTM model")
+        print("2. Historical data (will be fetched automatically)")
+        print("3. Valid Alpaca API keys for data fetching")
+        print("\nExample code:")
+        print("""
+from src.ml.ensemble import EnsemblePredictor
+from src.ml.backtest import Backtester
+
+# Initialize predictor
+predictor = EnsemblePredictor(
+    lstm_model_path="models/lstm_model.h5"
+)
+
+# Run backtest
+backtester = Backtester(
+    initial_capital=10000,
+    position_size_pct=0.20,
+    stop_loss_pct=0.03,
+    confidence_threshold=0.70
+)
+
+results = backtester.run_backtest(
+    symbol="PLTR",
+    start_date="2023-01-01",
+    end_date="2024-01-01",
+    predictor=predictor
+)
+
+# Generate report
+report = backtester.generate_report(results)
+print(report)
+        """)
+    
+    print("\n=== Demo Complete ===")
+
+
+if __name__ == "__main__":
+    main()
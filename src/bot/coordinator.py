@@ -5,8 +5,10 @@ Central coordinator that wires all bot components together.
 Provides unified interface for bot operations while delegating to specialized orchestrators.
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime, time as dtime
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from datetime import date, datetime, time as dtime
 from loguru import logger
 
 from src.bot.lifecycle import BotLifecycle
@@ -16,6 +18,9 @@ from src.orchestrators.position_monitor import PositionMonitorOrchestrator
 from src.orchestrators.risk_monitor import RiskMonitorOrchestrator
 from src.orchestrators.market_close import MarketCloseHandler
 
+# How long an is_market_hours() answer is reused by callers in the same tick
+_MARKET_HOURS_TTL_SECONDS = 1.0
+
 
 class BotCoordinator:
     """
@@ -52,6 +57,17 @@ class BotCoordinator:
         self.risk_monitor: Optional[RiskMonitorOrchestrator] = None
         self.market_close: Optional[MarketCloseHandler] = None
         
+        # Today's market session, fetched once per trading day
+        self._session_date: Optional[date] = None
+        self._session: Optional[Tuple[datetime, datetime]] = None
+        self._session_known = False
+        
+        # Last is_market_hours() answer as (monotonic expiry, value)
+        self._market_hours_cache: Tuple[float, bool] = (0.0, False)
+        
+        # Set when the bot stops, so waiters block without polling
+        self._shutdown = threading.Event()
+        
         self._initialized = True
     
     def initialize(self) -> bool:
@@ -77,8 +93,6 @@ class BotCoordinator:
             
             # Step 3: Create orchestrators with dependency injection
             logger.info("Creating orchestrators...")
-            self.trading_cycle = TradingCycleOrchestrator(modules, config, db)
-            self.position_monitor = PositionMonitorOrchestrator(modules, config, db)
             self.risk_monitor = RiskMonitorOrchestrator(
                 modules['portfolio_monitor'], 
                 config, 
@@ -86,16 +100,24 @@ class BotCoordinator:
                 position_manager=modules['position_manager'],
                 executor=modules['executor']
             )
+            self.trading_cycle = TradingCycleOrchestrator(
+                modules, config, db, risk_monitor=self.risk_monitor
+            )
+            self.position_monitor = PositionMonitorOrchestrator(modules, config, db)
             self.market_close = MarketCloseHandler(modules, config, db)
             logger.debug("Orchestrators created successfully")
             
+            # Cache today's market session so market-hours checks stay local
+            self._refresh_market_session(datetime.now(self.lifecycle.eastern_tz).date())
+            
             # Step 4: Create and configure task scheduler
             logger.info("Setting up task scheduler...")
             self.scheduler = TaskScheduler(timezone_str='America/New_York')
             self.scheduler.configure_jobs(
                 trading_cycle_func=self._run_trading_cycle_with_checks,
                 position_monitor_func=self._run_position_monitor_with_checks,
-                market_close_func=self.market_close.handle_market_close
+                market_close_func=self._run_market_close,
+                config_watch_func=self.reload_config
             )
             
             logger.success("Bot coordinator initialized successfully!")
@@ -123,7 +145,16 @@ class BotCoordinator:
         try:
             logger.info("Starting bot...")
             
+            # Starting is the operator's reset of a tripped circuit breaker,
+            # but only once the daily loss limit is no longer breached
+            if self.risk_monitor.circuit_breaker_active:
+                self.risk_monitor.reset_circuit_breaker()
+                if not self.risk_monitor.check_risk_limits():
+                    logger.error("Risk limits still breached - not starting")
+                    return False
+            
             # Update lifecycle state
+            self._shutdown.clear()
             self.lifecycle.is_running = True
             
             # Update bot state in database
@@ -172,6 +203,21 @@ class BotCoordinator:
             if self.scheduler:
                 self.scheduler.stop()
             
+            # Close the live price feed
+            if self.position_monitor:
+                self.position_monitor.stop_streaming()
+            
+            # Drain background work (queued DB writes, stop-loss exits) and
+            # release worker threads; each owner keeps fresh pools for a restart
+            for component in (
+                self.trading_cycle,
+                self.position_monitor,
+                self.risk_monitor,
+                self.lifecycle.ensemble
+            ):
+                if component:
+                    component.shutdown()
+            
             # Update lifecycle state
             self.lifecycle.is_running = False
             
@@ -187,6 +233,21 @@ class BotCoordinator:
         except Exception as e:
             logger.exception(f"Error stopping bot: {e}")
             return False
+        finally:
+            if not self.is_running:
+                self._shutdown.set()
+    
+    def wait_for_shutdown(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the bot stops.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            bool: True if the bot stopped, False if the timeout expired
+        """
+        return self._shutdown.wait(timeout)
     
     def _run_trading_cycle_with_checks(self):
         """Run trading cycle with market hours check."""
@@ -194,12 +255,14 @@ class BotCoordinator:
             logger.debug("Skipping trading cycle - bot not running")
             return
         
-        if not self.is_market_hours():
+        # Read the clock once and share it with the cycle
+        now = datetime.now(self.lifecycle.eastern_tz)
+        if not self.is_market_hours(now):
             logger.debug("Skipping trading cycle - outside market hours")
             return
         
         # Run trading cycle
-        self.trading_cycle.run()
+        self.trading_cycle.run(now)
         
         # Check risk limits after trading cycle
         risk_ok = self.risk_monitor.check_risk_limits()
@@ -207,6 +270,14 @@ class BotCoordinator:
             logger.critical("Circuit breaker triggered - stopping bot")
             self.stop()
     
+    def _run_market_close(self):
+        """Stop the live price feed, then run end-of-day tasks."""
+        self.position_monitor.stop_streaming()
+        self.market_close.handle_market_close()
+        
+        # The daily loss limit starts over with the next trading day
+        self.risk_monitor.reset_circuit_breaker()
+    
     def _run_position_monitor_with_checks(self):
         """Run position monitor with market hours check."""
         if not self.is_running:
@@ -218,23 +289,110 @@ class BotCoordinator:
         # Update positions
         self.position_monitor.update_positions()
     
-    def is_market_hours(self) -> bool:
+    def _refresh_market_session(self, today: date):
+        """
+        Fetch and cache the market session (open/close times) for a day.
+        
+        Args:
+            today: Eastern Time calendar date to load
+        """
+        self._session_date = today
+        try:
+            session = self.lifecycle.executor.get_market_session(today)
+            if session is not None:
+                tz = self.lifecycle.eastern_tz
+                session = (session[0].replace(tzinfo=tz), session[1].replace(tzinfo=tz))
+            self._session = session
+            self._session_known = True
+            
+            if session is None:
+                logger.info(f"Market closed on {today}")
+            else:
+                logger.info(
+                    f"Market session for {today}: "
+                    f"{session[0]:%H:%M} - {session[1]:%H:%M} ET"
+                )
+        except Exception as e:
+            logger.warning(f"Could not load market calendar for {today}: {e}")
+            self._session = None
+            self._session_known = False
+    
+    def is_market_hours(self, now: Optional[datetime] = None) -> bool:
         """
-        Check if current time is during market hours (9:30 AM - 4:00 PM ET).
+        Check if current time is during market hours.
+        
+        Uses the cached market calendar session for today (refreshed on date
+        rollover), so the check is local; falls back to 9:30 AM - 4:00 PM ET
+        on weekdays if the calendar could not be loaded. Without an explicit
+        time, the answer is reused for about a second so several callers in
+        the same tick share it.
+        
+        Args:
+            now: Current Eastern Time, if the caller already has it
         
         Returns:
             bool: True if market is open, False otherwise
         """
+        if now is not None:
+            return self._check_market_hours(now)
+        
+        expires, is_open = self._market_hours_cache
+        if time.monotonic() < expires:
+            return is_open
+        
+        is_open = self._check_market_hours(datetime.now(self.lifecycle.eastern_tz))
+        self._market_hours_cache = (time.monotonic() + _MARKET_HOURS_TTL_SECONDS, is_open)
+        return is_open
+    
+    def _check_market_hours(self, now: datetime) -> bool:
+        """
+        Check market hours for a given Eastern Time.
+        
+        Args:
+            now: Eastern Time to check
+        
+        Returns:
+            bool: True if market is open at that time, False otherwise
+        """
         try:
-            return self.lifecycle.data_fetcher.is_market_open()
+            if self._session_date != now.date():
+                self._refresh_market_session(now.date())
+            
+            if self._session_known:
+                session = self._session
+                return session is not None and session[0] <= now <= session[1]
+            
+            return self.lifecycle.data_fetcher.is_market_open(now)
         except Exception as e:
             logger.warning(f"Error checking market hours: {e}")
             # Fallback to manual check
-            now = datetime.now(self.lifecycle.eastern_tz)
             market_open = dtime(9, 30)
             market_close = dtime(16, 0)
             return market_open <= now.time() <= market_close and now.weekday() < 5
     
+    def reload_config(self) -> bool:
+        """
+        Hot-reload configuration if config.yaml or .env changed.
+        
+        Returns:
+            bool: True if a new configuration was applied
+        """
+        try:
+            if not self.lifecycle or not self.lifecycle.reload_configuration():
+                return False
+            
+            config = self.lifecycle.config
+            self.trading_cycle.update_config(config)
+            for orchestrator in (self.position_monitor, self.risk_monitor, self.market_close):
+                orchestrator.config = config
+            
+            logger.success("Configuration reloaded")
+            return True
+            
+        except Exception as e:
+            logger.exception(f"Error reloading configuration: {e}")
+            return False
+    
     def sync_with_alpaca(self) -> Dict[str, Any]:
         """
         Manually trigger database-Alpaca synchronization.
@@ -8,12 +8,14 @@ Separates lifecycle concerns from orchestration logic.
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 import yaml
 from dotenv import load_dotenv
 from loguru import logger
-import pytz
+from zoneinfo import ZoneInfo
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 # Data pipeline modules
 from src.data.data_fetcher import DataFetcher
@@ -41,6 +43,40 @@ from src.database.db_manager import DatabaseManager
 # Type definitions
 from src.bot_types.trading_types import TradingMode, BotConfig
 
+CONFIG_PATH = Path("config/config.yaml")
+ENV_PATH = Path(".env")
+
+# Settings only applied when modules are created; changing them needs a restart
+_RESTART_REQUIRED_FIELDS = ('model_path', 'database_url', 'log_level', 'log_dir', 'initial_capital')
+
+# Use libyaml's C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed config files keyed by path -> (mtime_ns, parsed dict)
+_config_cache: Dict[Path, tuple] = {}
+
+
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, reusing the previous parse if it hasn't changed.
+    
+    Args:
+        config_path: Path to YAML file
+    
+    Returns:
+        Parsed configuration dict (empty if the file is empty)
+    """
+    mtime_ns = config_path.stat().st_mtime_ns
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with open(config_path, 'r') as f:
+        config_dict = yaml.load(f, Loader=_YamlLoader) or {}
+    
+    _config_cache[config_path] = (mtime_ns, config_dict)
+    return config_dict
+
 
 class BotLifecycle:
     """
@@ -58,7 +94,11 @@ class BotLifecycle:
         
         # Configuration
         self.config: Optional[BotConfig] = None
-        self.eastern_tz = pytz.timezone('America/New_York')
+        self._config_mtimes: Optional[Tuple[int, int]] = None
+        self.eastern_tz = ZoneInfo('America/New_York')
+        
+        # Shared HTTP connection pool (created in create_modules())
+        self.http_session: Optional[Session] = None
         
         # Module instances (created in create_modules())
         self.data_fetcher: Optional[DataFetcher] = None
@@ -135,6 +175,9 @@ class BotLifecycle:
                     f"{sync_results['trades_archived']} archived"
                 )
             
+            # Step 8: Open market-data connections before the first cycle
+            self._prewarm_data_connections()
+            
             logger.success("Bot initialization complete!")
             return True
             
@@ -153,17 +196,25 @@ class BotLifecycle:
             bool: True if successful, False otherwise
         """
         try:
-            # Load environment variables
-            load_dotenv()
+            mtimes = self._get_config_mtimes()
+            
+            # Load environment variables (on reload, only if .env changed)
+            if self._config_mtimes is None:
+                load_dotenv()
+            elif mtimes[1] != self._config_mtimes[1]:
+                load_dotenv(ENV_PATH, override=True)
             
             # Load config.yaml
-            config_path = Path("config/config.yaml")
+            config_path = CONFIG_PATH
             if not config_path.exists():
                 logger.error(f"Configuration file not found: {config_path}")
                 return False
             
-            with open(config_path, 'r') as f:
-                config_dict = yaml.safe_load(f)
+            config_dict = _read_config_file(config_path)
+            trading_cfg = config_dict.get('trading') or {}
+            risk_cfg = config_dict.get('risk') or {}
+            ml_cfg = config_dict.get('ml') or {}
+            logging_cfg = config_dict.get('logging') or {}
             
             # Get environment variables
             alpaca_api_key = os.getenv('ALPACA_API_KEY')
@@ -175,7 +226,7 @@ class BotLifecycle:
                 return False
             
             # Parse trading mode
-            trading_mode_str = config_dict.get('trading', {}).get('mode', 'hybrid')
+            trading_mode_str = trading_cfg.get('mode', 'hybrid')
             try:
                 trading_mode = TradingMode[trading_mode_str.upper()]
             except KeyError:
@@ -186,30 +237,34 @@ class BotLifecycle:
             self.config = BotConfig(
                 # Trading configuration
                 trading_mode=trading_mode,
-                symbols=config_dict.get('trading', {}).get('symbols', ['PLTR']),
-                initial_capital=config_dict.get('trading', {}).get('initial_capital', 10000),
-                max_positions=config_dict.get('trading', {}).get('max_positions', 5),
-                close_positions_eod=config_dict.get('trading', {}).get('close_positions_eod', True),
+                symbols=trading_cfg.get('symbols', ['PLTR']),
+                initial_capital=trading_cfg.get('initial_capital', 10000),
+                max_positions=trading_cfg.get('max_positions', 5),
+                close_positions_eod=trading_cfg.get('close_positions_eod', True),
                 # Risk management
-                risk_per_trade=config_dict.get('risk', {}).get('risk_per_trade', 0.02),
-                max_position_size=config_dict.get('risk', {}).get('max_position_size', 0.20),
-                max_portfolio_exposure=config_dict.get('risk', {}).get('max_portfolio_exposure', 0.20),
-                daily_loss_limit=config_dict.get('risk', {}).get('daily_loss_limit', 0.05),
-                stop_loss_percent=config_dict.get('risk', {}).get('stop_loss_percent', 0.03),
-                trailing_stop_percent=config_dict.get('risk', {}).get('trailing_stop_percent', 0.02),
-                trailing_stop_activation=config_dict.get('risk', {}).get('trailing_stop_activation', 0.05),
+                risk_per_trade=risk_cfg.get('risk_per_trade', 0.02),
+                max_position_size=risk_cfg.get('max_position_size', 0.20),
+                max_portfolio_exposure=risk_cfg.get('max_portfolio_exposure', 0.20),
+                daily_loss_limit=risk_cfg.get('daily_loss_limit', 0.05),
+                stop_loss_percent=risk_cfg.get('stop_loss_percent', 0.03),
+                trailing_stop_percent=risk_cfg.get('trailing_stop_percent', 0.02),
+                trailing_stop_activation=risk_cfg.get('trailing_stop_activation', 0.05),
                 # ML configuration
-                model_path=config_dict.get('ml', {}).get('model_path', 'models/lstm_model.h5'),
-                sequence_length=config_dict.get('ml', {}).get('sequence_length', 60),
-                prediction_confidence_threshold=config_dict.get('ml', {}).get('prediction_confidence_threshold', 0.70),
-                auto_execute_threshold=config_dict.get('ml', {}).get('auto_execute_threshold', 0.80),
+                model_path=ml_cfg.get('model_path', 'models/lstm_model.h5'),
+                sequence_length=ml_cfg.get('sequence_length', 60),
+                prediction_confidence_threshold=ml_cfg.get('prediction_confidence_threshold', 0.70),
+                auto_execute_threshold=ml_cfg.get('auto_execute_threshold', 0.80),
                 # Database
                 database_url=os.getenv('DATABASE_URL', 'sqlite:///trading_bot.db'),
                 # Logging
-                log_level=config_dict.get('logging', {}).get('level', 'INFO'),
-                log_dir=config_dict.get('logging', {}).get('log_dir', 'logs/')
+                log_level=logging_cfg.get('level', 'INFO'),
+                log_dir=logging_cfg.get('log_dir', 'logs/')
             )
             
+            # Recorded only once the files parsed and validated, so a failed
+            # reload (e.g. a half-written config.yaml) is retried next check
+            self._config_mtimes = mtimes
+            
             logger.info(f"Configuration loaded: mode={trading_mode_str}, symbols={self.config.symbols}")
             return True
             
@@ -217,8 +272,62 @@ class BotLifecycle:
             logger.exception(f"Error loading configuration: {e}")
             return False
     
+    @staticmethod
+    def _get_config_mtimes() -> Tuple[int, int]:
+        """Get modification times of config.yaml and .env (0 if missing)."""
+        return tuple(
+            path.stat().st_mtime_ns if path.exists() else 0
+            for path in (CONFIG_PATH, ENV_PATH)
+        )
+    
+    def reload_configuration(self) -> bool:
+        """
+        Reload configuration if config.yaml or .env changed since last load.
+        
+        The new config is pushed to the modules that hold one. Settings that
+        only take effect at startup are reported but not applied. A failed
+        reload keeps the previous configuration and is retried on the next
+        check.
+        
+        Returns:
+            bool: True if a new configuration was loaded, False otherwise
+        """
+        if self.config is None or self._get_config_mtimes() == self._config_mtimes:
+            return False
+        
+        logger.info("Configuration files changed - reloading...")
+        old_config = self.config
+        
+        if not self.load_configuration():
+            logger.error("Configuration reload failed - keeping previous configuration")
+            self.config = old_config
+            return False
+        
+        for field_name in _RESTART_REQUIRED_FIELDS:
+            if getattr(self.config, field_name) != getattr(old_config, field_name):
+                logger.warning(f"Config '{field_name}' changed - restart the bot to apply")
+        
+        # Push the new config into modules that keep a reference to it
+        for module in (self.risk_calculator, self.portfolio_monitor, self.stop_loss_manager):
+            if module is not None:
+                module.config = self.config
+        
+        if self.signal_generator is not None:
+            self.signal_generator.confidence_threshold = self.config.prediction_confidence_threshold
+            self.signal_generator.auto_threshold = self.config.auto_execute_threshold
+            self.signal_generator.trading_mode = self.config.trading_mode
+        
+        return True
+    
     def _setup_logging(self):
-        """Configure loguru logging with rotation and multiple outputs."""
+        """
+        Configure loguru logging with rotation and multiple outputs.
+        
+        Every sink is enqueued: callers only push the record onto loguru's
+        queue and a background thread writes it out, so console and disk
+        I/O stay off the trading and monitoring threads. Loguru drains
+        the queue at interpreter exit.
+        """
         # Remove default handler
         logger.remove()
         
@@ -227,7 +336,8 @@ class BotLifecycle:
             sys.stdout,
             colorize=True,
             format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-            level="INFO"
+            level="INFO",
+            enqueue=True
         )
         
         # Main log file (all INFO+ messages, daily rotation)
@@ -236,7 +346,8 @@ class BotLifecycle:
             rotation="1 day",
             retention="30 days",
             level="INFO",
-            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
+            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
+            enqueue=True
         )
         
         # Error log (ERROR+ only)
@@ -247,7 +358,8 @@ class BotLifecycle:
             retention="30 days",
             backtrace=True,
             diagnose=True,
-            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}\n{exception}"
+            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}\n{exception}",
+            enqueue=True
         )
         
         logger.info("Logging configured successfully")
@@ -260,23 +372,40 @@ class BotLifecycle:
             bool: True if successful, False otherwise
         """
         try:
+            # One keep-alive HTTP pool shared by every Alpaca client, sized
+            # for the concurrent per-symbol workers
+            self.http_session = Session()
+            self.http_session.mount(
+                'https://',
+                HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=max(32, 2 * len(self.config.symbols))
+                )
+            )
+            
             # Data pipeline
-            self.data_fetcher = DataFetcher()
+            self.data_fetcher = DataFetcher(http_session=self.http_session)
             self.feature_engineer = FeatureEngineer()
             self.data_validator = DataValidator()
             logger.debug("Data pipeline modules created")
             
             # ML modules
             if Path(self.config.model_path).exists():
-                self.predictor = LSTMPredictor(model_path=self.config.model_path)
+                self.predictor = LSTMPredictor(
+                    model_path=self.config.model_path,
+                    sequence_length=self.config.sequence_length,
+                    confidence_threshold=self.config.prediction_confidence_threshold
+                )
                 logger.info(f"Loaded LSTM model from {self.config.model_path}")
             else:
                 logger.warning(f"Model file not found: {self.config.model_path}")
                 logger.warning("Bot will run without ML predictions - manual mode only")
                 self.predictor = None
             
+            # Share the already-loaded LSTM so the model is only loaded once
             self.ensemble = EnsemblePredictor(
                 lstm_model_path=self.config.model_path,
+                lstm_predictor=self.predictor,
                 lstm_weight=0.5,
                 rf_weight=0.3,
                 momentum_weight=0.2,
@@ -301,7 +430,7 @@ class BotLifecycle:
                 trading_mode=self.config.trading_mode
             )
             self.signal_queue = SignalQueue()
-            self.executor = AlpacaExecutor()
+            self.executor = AlpacaExecutor(http_session=self.http_session)
             self.position_manager = PositionManager(self.executor)
             self.order_manager = OrderManager(
                 executor=self.executor,
@@ -316,6 +445,20 @@ class BotLifecycle:
             logger.exception(f"Error creating modules: {e}")
             return False
     
+    def _prewarm_data_connections(self):
+        """
+        Issue one cheap market-data request so the first trading cycle
+        reuses an established TLS connection to the data API.
+        
+        The trading API connection is already warm from the account check.
+        Failures are ignored; the cycle will simply connect on demand.
+        """
+        try:
+            self.data_fetcher.fetch_latest_prices(list(self.config.symbols))
+            logger.debug("Market data connection pre-warmed")
+        except Exception as e:
+            logger.debug("Market data pre-warm skipped: {}", e)
+    
     def verify_api_connection(self) -> bool:
         """
         Verify Alpaca API connection and account access.
@@ -395,18 +538,16 @@ class BotLifecycle:
             trades_archived = 0
             
             # Step 1: Sync Alpaca positions → Database
+            # Existing positions are collected and updated in one batch
+            price_updates = []
             for alpaca_pos in alpaca_positions:
-                db_pos = self.db_manager.get_position_by_symbol(alpaca_pos.symbol)
-
-                if db_pos:
-                    # Update existing position using correct repository method
-                    self.db_manager.positions.update_position_price(
-                        symbol=alpaca_pos.symbol,
-                        current_price=alpaca_pos.current_price,
-                        unrealized_pnl=alpaca_pos.unrealized_pnl,
-                        unrealized_pnl_percent=alpaca_pos.unrealized_pnl_percent
-                    )
-                    positions_synced += 1
+                if alpaca_pos.symbol in db_symbols:
+                    price_updates.append((
+                        alpaca_pos.symbol,
+                        alpaca_pos.current_price,
+                        alpaca_pos.unrealized_pnl,
+                        alpaca_pos.unrealized_pnl_percent
+                    ))
                 else:
                     # Import new position
                     logger.info(f"Importing new position from Alpaca: {alpaca_pos.symbol}")
@@ -433,6 +574,8 @@ class BotLifecycle:
                     
                     positions_imported += 1
             
+            positions_synced = self.db_manager.update_position_prices(price_updates)
+            
             # Step 2: Archive database positions that don't exist in Alpaca
             for db_pos in db_positions:
                 if db_pos['symbol'] not in alpaca_symbols:
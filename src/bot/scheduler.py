@@ -5,10 +5,13 @@ Wrapper around APScheduler for managing bot's scheduled tasks.
 Separates scheduling concerns from business logic.
 """
 
-from typing import Callable
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.combining import OrTrigger
+from apscheduler.triggers.cron import CronTrigger
 from loguru import logger
-import pytz
 
 
 class TaskScheduler:
@@ -26,15 +29,20 @@ class TaskScheduler:
         Args:
             timezone_str: Timezone for scheduling (default: Eastern Time for market hours)
         """
-        self.eastern_tz = pytz.timezone(timezone_str)
-        self.scheduler = BackgroundScheduler(timezone=self.eastern_tz)
+        self.eastern_tz = ZoneInfo(timezone_str)
+        # One worker per job is enough: each job runs at most once at a time
+        self.scheduler = BackgroundScheduler(
+            timezone=self.eastern_tz,
+            executors={'default': ThreadPoolExecutor(max_workers=4)}
+        )
         self._jobs_configured = False
     
     def configure_jobs(
         self,
         trading_cycle_func: Callable,
         position_monitor_func: Callable,
-        market_close_func: Callable
+        market_close_func: Callable,
+        config_watch_func: Optional[Callable] = None
     ):
         """
         Configure all scheduled jobs.
@@ -43,42 +51,42 @@ class TaskScheduler:
             trading_cycle_func: Function to run trading cycle
             position_monitor_func: Function to monitor positions
             market_close_func: Function to handle market close
+            config_watch_func: Function that reloads config if it changed (optional)
         """
         if self._jobs_configured:
             logger.warning("Jobs already configured - skipping")
             return
         
-        # Trading cycle: Every 5 minutes during market hours (9:30 AM - 4:00 PM ET)
+        # Trading cycle: Every 5 minutes during market hours (9:30 AM - 4:00 PM ET).
+        # A single job covering 9:30-9:55 and 10:00-15:55 so no slot fires twice
+        trading_cycle_trigger = OrTrigger([
+            CronTrigger(day_of_week='mon-fri', hour=9, minute='30-55/5', timezone=self.eastern_tz),
+            CronTrigger(day_of_week='mon-fri', hour='10-15', minute='*/5', timezone=self.eastern_tz),
+        ])
         self.scheduler.add_job(
             func=trading_cycle_func,
-            trigger='cron',
-            day_of_week='mon-fri',
-            hour='9-15',
-            minute='*/5',
+            trigger=trading_cycle_trigger,
             id='trading_cycle',
             name='Trading Cycle',
+            max_instances=1,  # Never overlap cycles (duplicate orders)
+            coalesce=True,
             misfire_grace_time=60  # Allow 60s grace for missed executions
         )
         
-        # Special handling for market open (9:30-9:55)
-        self.scheduler.add_job(
-            func=trading_cycle_func,
-            trigger='cron',
-            day_of_week='mon-fri',
-            hour=9,
-            minute='30,35,40,45,50,55',
-            id='trading_cycle_open',
-            name='Trading Cycle (Market Open)',
-            misfire_grace_time=60
-        )
-        
-        # Position monitoring: Every 30 seconds (runs continuously, checks market hours internally)
+        # Position monitoring: Every 30 seconds during market hours only, so the
+        # scheduler sleeps through nights and weekends instead of waking every
+        # 30s (holidays/early closes are still filtered by the market-hours check)
+        position_monitor_trigger = OrTrigger([
+            CronTrigger(day_of_week='mon-fri', hour=9, minute='30-59', second='*/30', timezone=self.eastern_tz),
+            CronTrigger(day_of_week='mon-fri', hour='10-15', second='*/30', timezone=self.eastern_tz),
+        ])
         self.scheduler.add_job(
             func=position_monitor_func,
-            trigger='interval',
-            seconds=30,
+            trigger=position_monitor_trigger,
             id='position_monitor',
             name='Position Monitor',
+            max_instances=1,
+            coalesce=True,
             misfire_grace_time=30
         )
         
@@ -94,8 +102,20 @@ class TaskScheduler:
             misfire_grace_time=300  # 5 minute grace for market close
         )
         
+        # Config watch: Reload config.yaml/.env when they change (cheap mtime check)
+        if config_watch_func is not None:
+            self.scheduler.add_job(
+                func=config_watch_func,
+                trigger='interval',
+                seconds=60,
+                id='config_watch',
+                name='Config Watch',
+                coalesce=True,
+                misfire_grace_time=60
+            )
+        
         self._jobs_configured = True
-        logger.info("Task scheduler configured with 4 jobs")
+        logger.info(f"Task scheduler configured with {len(self.scheduler.get_jobs())} jobs")
     
     def start(self):
         """Start the scheduler."""
@@ -70,11 +70,14 @@ class TradingSignal:
     stop_loss: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Active trading position.
     
+    Slotted: the position monitor and stop-loss checks read these fields
+    for every held position on every tick.
+    
     Attributes:
         symbol: Stock ticker symbol
         quantity: Number of shares held
@@ -241,12 +244,13 @@ class PerformanceMetrics:
     longest_loss_streak: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BotConfig:
     """
     Trading bot configuration.
     
-    Loaded from config.yaml and environment variables.
+    Loaded from config.yaml and environment variables. Immutable and slotted:
+    it is read on every cycle but never changed after loading.
     """
     # Trading configuration
     trading_mode: TradingMode
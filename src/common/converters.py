@@ -5,11 +5,18 @@ This module provides converter classes that eliminate duplicate conversion logic
 throughout the codebase, particularly for Alpaca API responses and database entities.
 """
 
-from datetime import datetime
+import json
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-from src.bot_types.trading_types import Position, OrderStatus
+from src.bot_types.trading_types import Position, OrderStatus, ModelPrediction, TradingSignal
 from src.common.converter_types import AlpacaPositionDTO, AlpacaOrderDTO
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class AlpacaConverter:
     """
@@ -273,6 +280,83 @@ class DatabaseConverter:
                 base_dict[field] = kwargs[field]
         
         return base_dict
+    
+    @staticmethod
+    def to_json(value: Any) -> str:
+        """
+        Serialize a value for a JSON text column.
+        
+        Uses orjson when installed (handles NumPy scalars/arrays natively),
+        otherwise the stdlib json module. Unknown types fall back to str().
+        
+        Args:
+            value: JSON-compatible value (dict, list, ...)
+            
+        Returns:
+            JSON string
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                value,
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        return json.dumps(value, default=str)
+    
+    @staticmethod
+    def prediction_to_dict(prediction: ModelPrediction) -> Dict[str, Any]:
+        """
+        Convert ModelPrediction to a predictions table row.
+        
+        Args:
+            prediction: ModelPrediction to convert
+            
+        Returns:
+            Dictionary suitable for database insertion
+        """
+        return {
+            'symbol': prediction.symbol,
+            'predicted_price': prediction.predicted_price,
+            'direction': prediction.direction,
+            'confidence': prediction.confidence,
+            'model_name': prediction.model_name,
+            'features_used': DatabaseConverter.to_json(prediction.features_used),
+            'prediction_time': prediction.timestamp,
+            'target_date': prediction.timestamp + timedelta(days=1),
+            'prediction_metadata': DatabaseConverter.to_json(prediction.metadata),
+        }
+    
+    @staticmethod
+    def signal_to_dict(
+        signal: TradingSignal,
+        status: str,
+        rejected_reason: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Convert TradingSignal to a signals table row.
+        
+        Args:
+            signal: TradingSignal to convert
+            status: Signal status ('pending', 'rejected', 'executed')
+            rejected_reason: Why the signal was rejected, if it was
+            
+        Returns:
+            Dictionary suitable for database insertion
+        """
+        return {
+            'symbol': signal.symbol,
+            'signal_type': signal.signal_type.value,
+            'confidence': signal.confidence,
+            'predicted_direction': signal.predicted_direction,
+            'status': status,
+            'quantity': signal.quantity,
+            'entry_price': signal.entry_price,
+            'stop_loss': signal.stop_loss,
+            'features': DatabaseConverter.to_json(signal.features),
+            'created_at': signal.timestamp,
+            'executed_at': datetime.now() if status == "executed" else None,
+            'rejected_reason': rejected_reason,
+        }
 
 
 class ConverterRegistry:
@@ -255,7 +255,7 @@ def log_execution_time(
                     f"{func.__name__} took {elapsed:.2f}s (threshold: {threshold_seconds}s)"
                 )
             else:
-                logger.debug(f"{func.__name__} took {elapsed:.2f}s")
+                logger.debug("{} took {:.2f}s", func.__name__, elapsed)
             
             return result
         
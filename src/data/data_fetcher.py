@@ -7,9 +7,11 @@ Provides historical and real-time stock price data.
 
 import os
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Dict
+from zoneinfo import ZoneInfo
 import pandas as pd
 from loguru import logger
+from requests import Session
 
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest, StockLatestQuoteRequest
@@ -18,6 +20,9 @@ import yfinance as yf
 
 from src.common.decorators import handle_data_error
 
+# US equity market timezone
+_EASTERN_TZ = ZoneInfo('America/New_York')
+
 
 class DataFetcher:
     """Fetches market data from Alpaca and Yahoo Finance APIs."""
@@ -25,7 +30,8 @@ class DataFetcher:
     def __init__(
         self,
         alpaca_api_key: Optional[str] = None,
-        alpaca_secret_key: Optional[str] = None
+        alpaca_secret_key: Optional[str] = None,
+        http_session: Optional[Session] = None
     ):
         """
         Initialize DataFetcher with API credentials.
@@ -33,9 +39,12 @@ class DataFetcher:
         Args:
             alpaca_api_key: Alpaca API key (defaults to env var)
             alpaca_secret_key: Alpaca secret key (defaults to env var)
+            http_session: Shared keep-alive HTTP session for the Alpaca client
+                (defaults to the client's own session)
         """
         self.alpaca_api_key = alpaca_api_key or os.getenv('ALPACA_API_KEY')
         self.alpaca_secret_key = alpaca_secret_key or os.getenv('ALPACA_SECRET_KEY')
+        self.http_session = http_session
         
         if not self.alpaca_api_key or not self.alpaca_secret_key:
             logger.warning("Alpaca API credentials not provided, will fall back to Yahoo Finance")
@@ -50,6 +59,16 @@ class DataFetcher:
             api_key=self.alpaca_api_key,
             secret_key=self.alpaca_secret_key
         )
+        if self.http_session is not None:
+            # alpaca-py has no public hook for the session; skip the shared
+            # pool rather than break if a release renames the attribute
+            if hasattr(client, '_session'):
+                client._session = self.http_session
+            else:
+                logger.warning(
+                    "Alpaca data client has no _session attribute, "
+                    "not using the shared HTTP session"
+                )
         logger.info("Alpaca data client initialized successfully")
         return client
     
@@ -120,21 +139,10 @@ class DataFetcher:
         Returns:
             DataFrame or None if fetch fails
         """
-        # Map timeframe string to TimeFrame object
-        if timeframe == 'day':
-            tf = TimeFrame(amount=1, unit=TimeFrameUnit.Day)
-        elif timeframe == 'hour':
-            tf = TimeFrame(amount=1, unit=TimeFrameUnit.Hour)
-        elif timeframe == 'minute':
-            tf = TimeFrame(amount=1, unit=TimeFrameUnit.Minute)
-        else:
-            logger.warning(f"Unknown timeframe '{timeframe}', defaulting to day")
-            tf = TimeFrame(amount=1, unit=TimeFrameUnit.Day)
-        
         # Create request
         request = StockBarsRequest(
             symbol_or_symbols=[symbol],
-            timeframe=tf,
+            timeframe=self._to_timeframe(timeframe),
             start=start_date,
             end=end_date
         )
@@ -171,6 +179,101 @@ class DataFetcher:
         
         return df
     
+    def fetch_historical_data_multi(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: Optional[datetime] = None,
+        timeframe: str = 'day'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical OHLCV data for several symbols in one request.
+        
+        Alpaca returns bars for all symbols in a single round-trip; any symbol
+        missing from the batch falls back to fetch_historical_data().
+        
+        Args:
+            symbols: Stock symbols (e.g., ['PLTR', 'AAPL'])
+            start_date: Start date for historical data
+            end_date: End date (defaults to now)
+            timeframe: Bar timeframe ('day', 'hour', 'minute')
+        
+        Returns:
+            Dict of symbol -> DataFrame (empty DataFrame if all sources failed)
+        """
+        if end_date is None:
+            end_date = datetime.now()
+        
+        logger.info(f"Fetching historical data for {len(symbols)} symbols from {start_date} to {end_date}")
+        
+        data: Dict[str, pd.DataFrame] = {}
+        
+        # One batched request for all symbols
+        if self.alpaca_client:
+            batch = self._fetch_multi_from_alpaca(symbols, start_date, end_date, timeframe)
+            if batch:
+                data.update({sym: df for sym, df in batch.items() if not df.empty})
+                logger.info(f"Successfully fetched bars for {len(data)} symbols from Alpaca")
+        
+        # Per-symbol fallback for anything the batch missed
+        for symbol in symbols:
+            if symbol not in data:
+                data[symbol] = self.fetch_historical_data(symbol, start_date, end_date, timeframe)
+        
+        return data
+    
+    @handle_data_error(fallback_value=None)
+    def _fetch_multi_from_alpaca(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str
+    ) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Fetch bars for several symbols from Alpaca in a single request.
+        
+        Args:
+            symbols: Stock symbols
+            start_date: Start date
+            end_date: End date
+            timeframe: Bar timeframe
+        
+        Returns:
+            Dict of symbol -> DataFrame, or None if fetch fails
+        """
+        request = StockBarsRequest(
+            symbol_or_symbols=list(symbols),
+            timeframe=self._to_timeframe(timeframe),
+            start=start_date,
+            end=end_date
+        )
+        
+        df = self.alpaca_client.get_stock_bars(request).df
+        
+        if df.empty:
+            logger.warning(f"Alpaca returned empty data for {symbols}")
+            return None
+        
+        # Response is indexed by (symbol, timestamp); split it per symbol
+        return {
+            symbol: group.droplevel('symbol')
+            for symbol, group in df.groupby(level='symbol')
+        }
+    
+    @staticmethod
+    def _to_timeframe(timeframe: str) -> TimeFrame:
+        """Map timeframe string to Alpaca TimeFrame object."""
+        if timeframe == 'day':
+            return TimeFrame(amount=1, unit=TimeFrameUnit.Day)
+        if timeframe == 'hour':
+            return TimeFrame(amount=1, unit=TimeFrameUnit.Hour)
+        if timeframe == 'minute':
+            return TimeFrame(amount=1, unit=TimeFrameUnit.Minute)
+        
+        logger.warning(f"Unknown timeframe '{timeframe}', defaulting to day")
+        return TimeFrame(amount=1, unit=TimeFrameUnit.Day)
+    
     @handle_data_error(fallback_value=None)
     def _fetch_from_yahoo(
         self,
@@ -221,7 +324,7 @@ class DataFetcher:
         if symbol in response:
             quote = response[symbol]
             price = (quote.bid_price + quote.ask_price) / 2  # Mid price
-            logger.debug(f"Latest price for {symbol}: ${price:.2f} (Alpaca)")
+            logger.debug("Latest price for {}: ${:.2f} (Alpaca)", symbol, price)
             return float(price)
         return None
     
@@ -232,7 +335,7 @@ class DataFetcher:
         data = ticker.history(period='1d', interval='1m')
         if not data.empty:
             price = data['Close'].iloc[-1]
-            logger.debug(f"Latest price for {symbol}: ${price:.2f} (Yahoo)")
+            logger.debug("Latest price for {}: ${:.2f} (Yahoo)", symbol, price)
             return float(price)
         return None
     
@@ -246,7 +349,7 @@ class DataFetcher:
         Returns:
             Latest price or None if fetch fails
         """
-        logger.debug(f"Fetching latest price for {symbol}")
+        logger.debug("Fetching latest price for {}", symbol)
         
         # Try Alpaca first
         if self.alpaca_client:
@@ -262,6 +365,42 @@ class DataFetcher:
         logger.error(f"Failed to fetch latest price for {symbol}")
         return None
     
+    @handle_data_error(fallback_value=None)
+    def _fetch_latest_prices_alpaca(self, symbols: List[str]) -> Optional[Dict[str, float]]:
+        """Fetch latest mid prices for several symbols from Alpaca in one request."""
+        request = StockLatestQuoteRequest(symbol_or_symbols=list(symbols))
+        response = self.alpaca_client.get_stock_latest_quote(request)
+        
+        return {
+            symbol: float((quote.bid_price + quote.ask_price) / 2)  # Mid price
+            for symbol, quote in response.items()
+        }
+    
+    def fetch_latest_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Fetch the latest prices for several symbols in one request.
+        
+        Symbols missing from the batched Alpaca response fall back to
+        fetch_latest_price().
+        
+        Args:
+            symbols: Stock symbols
+        
+        Returns:
+            Dict of symbol -> latest price (None if all sources failed)
+        """
+        logger.debug("Fetching latest prices for {} symbols", len(symbols))
+        
+        prices: Dict[str, Optional[float]] = {}
+        if self.alpaca_client:
+            prices.update(self._fetch_latest_prices_alpaca(symbols) or {})
+        
+        for symbol in symbols:
+            if symbol not in prices:
+                prices[symbol] = self.fetch_latest_price(symbol)
+        
+        return prices
+    
     @handle_data_error(fallback_value=None)
     def _fetch_realtime_data_alpaca(self, symbol: str) -> Optional[dict]:
         """Fetch real-time data from Alpaca."""
@@ -279,7 +418,7 @@ class DataFetcher:
                 'ask_size': quote.ask_size,
                 'timestamp': quote.timestamp
             }
-            logger.debug(f"Real-time data for {symbol}: ${data['price']:.2f} (Alpaca)")
+            logger.debug("Real-time data for {}: ${:.2f} (Alpaca)", symbol, data['price'])
             return data
         return None
     
@@ -296,7 +435,7 @@ class DataFetcher:
             'volume': info.get('volume'),
             'timestamp': datetime.now()
         }
-        logger.debug(f"Real-time data for {symbol}: ${data['price']:.2f} (Yahoo)")
+        logger.debug("Real-time data for {}: ${:.2f} (Yahoo)", symbol, data['price'])
         return data
     
     def fetch_realtime_data(self, symbol: str) -> Optional[dict]:
@@ -309,7 +448,7 @@ class DataFetcher:
         Returns:
             Dict with current price, volume, bid, ask, or None if fetch fails
         """
-        logger.debug(f"Fetching real-time data for {symbol}")
+        logger.debug("Fetching real-time data for {}", symbol)
         
         # Try Alpaca first
         if self.alpaca_client:
@@ -325,18 +464,19 @@ class DataFetcher:
         logger.error(f"Failed to fetch real-time data for {symbol}")
         return None
     
-    def is_market_open(self) -> bool:
+    def is_market_open(self, now: Optional[datetime] = None) -> bool:
         """
         Check if the US stock market is currently open.
         
+        Args:
+            now: Current Eastern Time, if the caller already has it
+        
         Returns:
             True if market is open, False otherwise
         """
-        from pytz import timezone
-        
         # Convert current time to Eastern Time
-        et = timezone('US/Eastern')
-        now = datetime.now(et)
+        if now is None:
+            now = datetime.now(_EASTERN_TZ)
         
         # Check if it's a weekday (Monday=0, Sunday=6)
         if now.weekday() >= 5:  # Saturday or Sunday
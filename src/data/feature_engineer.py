@@ -2,12 +2,13 @@
 Feature Engineer Module
 
 Responsible for calculating technical indicators and preparing features for ML models.
-Uses TA-Lib for technical analysis and pandas for data manipulation.
+Uses TA-Lib for technical analysis when available, with NumPy fallbacks.
 """
 
-from typing import Optional
+from typing import List, Optional, Tuple
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from loguru import logger
 
 try:
@@ -17,9 +18,52 @@ except ImportError:
     logger.warning("TA-Lib not available, using pandas-based indicators")
     TALIB_AVAILABLE = False
 
+# Raw columns that are model inputs' source data rather than features
+_NON_FEATURE_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'target')
+
+
+def _shift(values: np.ndarray, periods: int) -> np.ndarray:
+    """Shift an array forward by `periods`, padding the front with NaN."""
+    out = np.full(len(values), np.nan)
+    if periods < len(values):
+        out[periods:] = values[:-periods]
+    return out
+
+
+def _pct_change(values: np.ndarray, periods: int) -> np.ndarray:
+    """Fractional change over `periods` rows (NaN where undefined)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return values / _shift(values, periods) - 1
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Trailing rolling mean; NaN until a full window is available."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = sliding_window_view(values, period).mean(axis=1)
+    return out
+
+
+def _rolling_std(values: np.ndarray, period: int) -> np.ndarray:
+    """Trailing rolling sample standard deviation (ddof=1)."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = sliding_window_view(values, period).std(axis=1, ddof=1)
+    return out
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average (recursive form, adjust=False)."""
+    return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+
 
 class FeatureEngineer:
-    """Calculates technical indicators and prepares ML features from OHLCV data."""
+    """
+    Calculates technical indicators and prepares ML features from OHLCV data.
+    
+    Holds no per-call state (inputs are never modified and every result is
+    a new array or frame), so one instance can be shared across threads.
+    """
     
     def __init__(self):
         """Initialize FeatureEngineer."""
@@ -29,6 +73,10 @@ class FeatureEngineer:
         """
         Calculate all technical indicators from OHLCV data.
         
+        Price columns are converted to NumPy arrays once and every indicator is
+        computed on raw arrays, then joined onto the input in a single concat.
+        The input frame is never modified, so callers need not copy it.
+        
         Args:
             df: DataFrame with columns: open, high, low, close, volume
         
@@ -41,57 +89,66 @@ class FeatureEngineer:
         
         logger.info(f"Calculating technical indicators for {len(df)} rows")
         
-        # Create a copy to avoid modifying original
-        result = df.copy()
-        
         # Ensure we have required columns
         required_cols = ['open', 'high', 'low', 'close', 'volume']
-        if not all(col in result.columns for col in required_cols):
+        if not all(col in df.columns for col in required_cols):
             logger.error(f"Missing required columns. Need: {required_cols}")
             return df
         
         try:
+            close = df['close'].to_numpy(dtype=np.float64)
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
+            volume = df['volume'].to_numpy(dtype=np.float64)
+            
+            indicators = {}
+            
             # RSI (Relative Strength Index)
-            result['rsi'] = self._calculate_rsi(result['close'])
+            indicators['rsi'] = self._calculate_rsi(close)
             
             # MACD (Moving Average Convergence Divergence)
-            macd_result = self._calculate_macd(result['close'])
-            result['macd'] = macd_result['macd']
-            result['macd_signal'] = macd_result['signal']
-            result['macd_hist'] = macd_result['histogram']
+            macd_result = self._calculate_macd(close)
+            indicators['macd'] = macd_result['macd']
+            indicators['macd_signal'] = macd_result['signal']
+            indicators['macd_hist'] = macd_result['histogram']
             
             # Bollinger Bands
-            bb_result = self._calculate_bollinger_bands(result['close'])
-            result['bb_upper'] = bb_result['upper']
-            result['bb_middle'] = bb_result['middle']
-            result['bb_lower'] = bb_result['lower']
-            result['bb_width'] = bb_result['width']
+            bb_result = self._calculate_bollinger_bands(close)
+            indicators['bb_upper'] = bb_result['upper']
+            indicators['bb_middle'] = bb_result['middle']
+            indicators['bb_lower'] = bb_result['lower']
+            indicators['bb_width'] = bb_result['width']
             
             # Moving Averages
-            result['sma_20'] = self._calculate_sma(result['close'], period=20)
-            result['sma_50'] = self._calculate_sma(result['close'], period=50)
-            result['ema_12'] = self._calculate_ema(result['close'], period=12)
-            result['ema_26'] = self._calculate_ema(result['close'], period=26)
+            indicators['sma_20'] = self._calculate_sma(close, period=20)
+            indicators['sma_50'] = self._calculate_sma(close, period=50)
+            indicators['ema_12'] = self._calculate_ema(close, period=12)
+            indicators['ema_26'] = self._calculate_ema(close, period=26)
             
             # Volume indicators
-            result['volume_sma'] = self._calculate_sma(result['volume'], period=20)
-            result['volume_ratio'] = result['volume'] / result['volume_sma']
+            indicators['volume_sma'] = self._calculate_sma(volume, period=20)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                indicators['volume_ratio'] = volume / indicators['volume_sma']
             
             # Price changes
-            result['price_change'] = result['close'].pct_change()
-            result['price_change_5d'] = result['close'].pct_change(periods=5)
-            result['price_change_20d'] = result['close'].pct_change(periods=20)
+            indicators['price_change'] = _pct_change(close, 1)
+            indicators['price_change_5d'] = _pct_change(close, 5)
+            indicators['price_change_20d'] = _pct_change(close, 20)
             
             # Volatility (20-day standard deviation of returns)
-            result['volatility'] = result['price_change'].rolling(window=20).std()
+            indicators['volatility'] = _rolling_std(indicators['price_change'], 20)
             
             # Average True Range (ATR)
-            result['atr'] = self._calculate_atr(result)
+            indicators['atr'] = self._calculate_atr(high, low, close)
             
             # Momentum
-            result['momentum'] = result['close'] - result['close'].shift(10)
+            indicators['momentum'] = close - _shift(close, 10)
+            
+            # Replace any indicator columns already present, then join in one step
+            base = df.drop(columns=df.columns.intersection(list(indicators)))
+            result = pd.concat([base, pd.DataFrame(indicators, index=df.index)], axis=1)
             
-            logger.info(f"Successfully calculated {len(result.columns) - len(df.columns)} technical indicators")
+            logger.info(f"Successfully calculated {len(indicators)} technical indicators")
             
             return result
         
@@ -99,36 +156,37 @@ class FeatureEngineer:
             logger.error(f"Error calculating technical indicators: {e}")
             return df
     
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
+    def _calculate_rsi(self, prices: np.ndarray, period: int = 14) -> np.ndarray:
         """
         Calculate Relative Strength Index.
         
         Args:
-            prices: Series of closing prices
+            prices: Array of closing prices
             period: RSI period (default 14)
         
         Returns:
-            Series of RSI values
+            Array of RSI values
         """
         if self.talib_available:
             try:
-                return pd.Series(talib.RSI(prices.values, timeperiod=period), index=prices.index)
+                return talib.RSI(prices, timeperiod=period)
             except Exception as e:
-                logger.warning(f"TA-Lib RSI failed: {e}, using pandas implementation")
+                logger.warning(f"TA-Lib RSI failed: {e}, using NumPy implementation")
         
-        # Pandas-based RSI calculation
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        # NumPy-based RSI calculation
+        delta = np.diff(prices, prepend=np.nan)
+        gain = _rolling_mean(np.where(delta > 0, delta, 0.0), period)
+        loss = _rolling_mean(np.where(delta < 0, -delta, 0.0), period)
         
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = gain / loss
+            rsi = 100 - (100 / (1 + rs))
         
         return rsi
     
     def _calculate_macd(
         self,
-        prices: pd.Series,
+        prices: np.ndarray,
         fast: int = 12,
         slow: int = 26,
         signal: int = 9
@@ -137,35 +195,33 @@ class FeatureEngineer:
         Calculate MACD (Moving Average Convergence Divergence).
         
         Args:
-            prices: Series of closing prices
+            prices: Array of closing prices
             fast: Fast EMA period
             slow: Slow EMA period
             signal: Signal line period
         
         Returns:
-            Dict with 'macd', 'signal', and 'histogram' Series
+            Dict with 'macd', 'signal', and 'histogram' arrays
         """
         if self.talib_available:
             try:
                 macd, signal_line, hist = talib.MACD(
-                    prices.values,
+                    prices,
                     fastperiod=fast,
                     slowperiod=slow,
                     signalperiod=signal
                 )
                 return {
-                    'macd': pd.Series(macd, index=prices.index),
-                    'signal': pd.Series(signal_line, index=prices.index),
-                    'histogram': pd.Series(hist, index=prices.index)
+                    'macd': macd,
+                    'signal': signal_line,
+                    'histogram': hist
                 }
             except Exception as e:
-                logger.warning(f"TA-Lib MACD failed: {e}, using pandas implementation")
+                logger.warning(f"TA-Lib MACD failed: {e}, using NumPy implementation")
         
-        # Pandas-based MACD calculation
-        ema_fast = prices.ewm(span=fast, adjust=False).mean()
-        ema_slow = prices.ewm(span=slow, adjust=False).mean()
-        macd = ema_fast - ema_slow
-        signal_line = macd.ewm(span=signal, adjust=False).mean()
+        # NumPy-based MACD calculation
+        macd = _ema(prices, fast) - _ema(prices, slow)
+        signal_line = _ema(macd, signal)
         histogram = macd - signal_line
         
         return {
@@ -176,7 +232,7 @@ class FeatureEngineer:
     
     def _calculate_bollinger_bands(
         self,
-        prices: pd.Series,
+        prices: np.ndarray,
         period: int = 20,
         std_dev: float = 2.0
     ) -> dict:
@@ -184,41 +240,34 @@ class FeatureEngineer:
         Calculate Bollinger Bands.
         
         Args:
-            prices: Series of closing prices
+            prices: Array of closing prices
             period: Moving average period
             std_dev: Number of standard deviations
         
         Returns:
-            Dict with 'upper', 'middle', 'lower', 'width' Series
+            Dict with 'upper', 'middle', 'lower', 'width' arrays
         """
+        upper = middle = lower = None
         if self.talib_available:
             try:
                 upper, middle, lower = talib.BBANDS(
-                    prices.values,
+                    prices,
                     timeperiod=period,
                     nbdevup=std_dev,
                     nbdevdn=std_dev
                 )
-                upper = pd.Series(upper, index=prices.index)
-                middle = pd.Series(middle, index=prices.index)
-                lower = pd.Series(lower, index=prices.index)
-                width = ((upper - lower) / middle) * 100
-                
-                return {
-                    'upper': upper,
-                    'middle': middle,
-                    'lower': lower,
-                    'width': width
-                }
             except Exception as e:
-                logger.warning(f"TA-Lib Bollinger Bands failed: {e}, using pandas implementation")
+                logger.warning(f"TA-Lib Bollinger Bands failed: {e}, using NumPy implementation")
         
-        # Pandas-based Bollinger Bands calculation
-        middle = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
-        width = ((upper - lower) / middle) * 100
+        if middle is None:
+            # NumPy-based Bollinger Bands calculation
+            middle = _rolling_mean(prices, period)
+            std = _rolling_std(prices, period)
+            upper = middle + (std * std_dev)
+            lower = middle - (std * std_dev)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            width = ((upper - lower) / middle) * 100
         
         return {
             'upper': upper,
@@ -227,76 +276,78 @@ class FeatureEngineer:
             'width': width
         }
     
-    def _calculate_sma(self, prices: pd.Series, period: int) -> pd.Series:
+    def _calculate_sma(self, prices: np.ndarray, period: int) -> np.ndarray:
         """
         Calculate Simple Moving Average.
         
         Args:
-            prices: Series of prices
+            prices: Array of prices
             period: Moving average period
         
         Returns:
-            Series of SMA values
+            Array of SMA values
         """
         if self.talib_available:
             try:
-                return pd.Series(talib.SMA(prices.values, timeperiod=period), index=prices.index)
+                return talib.SMA(prices, timeperiod=period)
             except Exception as e:
-                logger.warning(f"TA-Lib SMA failed: {e}, using pandas implementation")
+                logger.warning(f"TA-Lib SMA failed: {e}, using NumPy implementation")
         
-        return prices.rolling(window=period).mean()
+        return _rolling_mean(prices, period)
     
-    def _calculate_ema(self, prices: pd.Series, period: int) -> pd.Series:
+    def _calculate_ema(self, prices: np.ndarray, period: int) -> np.ndarray:
         """
         Calculate Exponential Moving Average.
         
         Args:
-            prices: Series of prices
+            prices: Array of prices
             period: Moving average period
         
         Returns:
-            Series of EMA values
+            Array of EMA values
         """
         if self.talib_available:
             try:
-                return pd.Series(talib.EMA(prices.values, timeperiod=period), index=prices.index)
+                return talib.EMA(prices, timeperiod=period)
             except Exception as e:
-                logger.warning(f"TA-Lib EMA failed: {e}, using pandas implementation")
+                logger.warning(f"TA-Lib EMA failed: {e}, using NumPy implementation")
         
-        return prices.ewm(span=period, adjust=False).mean()
+        return _ema(prices, period)
     
-    def _calculate_atr(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
+    def _calculate_atr(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        period: int = 14
+    ) -> np.ndarray:
         """
         Calculate Average True Range.
         
         Args:
-            df: DataFrame with high, low, close columns
+            high: Array of high prices
+            low: Array of low prices
+            close: Array of closing prices
             period: ATR period
         
         Returns:
-            Series of ATR values
+            Array of ATR values
         """
         if self.talib_available:
             try:
-                atr = talib.ATR(
-                    df['high'].values,
-                    df['low'].values,
-                    df['close'].values,
-                    timeperiod=period
-                )
-                return pd.Series(atr, index=df.index)
+                return talib.ATR(high, low, close, timeperiod=period)
             except Exception as e:
-                logger.warning(f"TA-Lib ATR failed: {e}, using pandas implementation")
+                logger.warning(f"TA-Lib ATR failed: {e}, using NumPy implementation")
         
-        # Pandas-based ATR calculation
-        high_low = df['high'] - df['low']
-        high_close = (df['high'] - df['close'].shift()).abs()
-        low_close = (df['low'] - df['close'].shift()).abs()
+        # NumPy-based ATR calculation (fmax skips the NaN on the first row)
+        prev_close = _shift(close, 1)
+        high_low = high - low
+        high_close = np.abs(high - prev_close)
+        low_close = np.abs(low - prev_close)
         
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean()
+        true_range = np.fmax(high_low, np.fmax(high_close, low_close))
         
-        return atr
+        return _rolling_mean(true_range, period)
     
     def create_ml_features(
         self,
@@ -317,29 +368,62 @@ class FeatureEngineer:
         """
         logger.info(f"Creating ML features with sequence length {sequence_length}")
         
-        # Calculate target (next day price direction)
-        df = df.copy()
-        df['target'] = (df['close'].shift(-1) > df['close']).astype(int)
+        # Calculate target (next day price direction); it is never missing,
+        # so it is kept beside df rather than added to a copy of it
+        target = (df['close'].shift(-1) > df['close']).astype(int)
         
         # Drop rows with NaN values
-        df_clean = df.dropna()
-        
-        if len(df_clean) < sequence_length:
-            logger.error(f"Not enough data points ({len(df_clean)}) for sequence length {sequence_length}")
+        missing = df.isna()
+        if 'target' in missing.columns:
+            missing = missing.drop(columns='target')
+        complete = ~missing.any(axis=1).to_numpy()
+        n_complete = int(np.count_nonzero(complete))
+        
+        if n_complete < sequence_length:
+            logger.error(f"Not enough data points ({n_complete}) for sequence length {sequence_length}")
             return None, None
         
         # Select feature columns (exclude OHLCV and target)
-        feature_cols = [col for col in df_clean.columns if col not in 
-                       ['open', 'high', 'low', 'close', 'volume', 'target']]
+        feature_cols = [col for col in df.columns if col not in _NON_FEATURE_COLUMNS]
         
-        X = df_clean[feature_cols].values
-        y = df_clean['target'].values
+        X = df[feature_cols].to_numpy()[complete]
+        y = target.to_numpy()[complete]
         
         logger.info(f"Created feature matrix: {X.shape}, target: {y.shape}")
         logger.info(f"Features: {feature_cols}")
         
         return X, y
     
+    def create_feature_rows(
+        self,
+        df: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Build the feature matrix together with each row's position in df.
+        
+        Rows are selected exactly as create_ml_features selects them (rows
+        with a missing value in any column but 'target' are dropped), but
+        their positions are kept, so callers can map a feature row back to
+        the bar it describes.
+        Indicators only look backwards, so the rows for a prefix of df are
+        the matching prefix of these rows.
+        
+        Args:
+            df: DataFrame with technical indicators
+        
+        Returns:
+            Tuple of (X, positions, feature_names) where X has shape
+            (complete rows, features) and positions are integer row indices
+        """
+        feature_cols = [col for col in df.columns if col not in _NON_FEATURE_COLUMNS]
+        missing = df.isna()
+        if 'target' in missing.columns:
+            missing = missing.drop(columns='target')
+        complete = ~missing.any(axis=1).to_numpy()
+        positions = np.flatnonzero(complete)
+        X = df[feature_cols].to_numpy(dtype=np.float64)[positions]
+        return X, positions, feature_cols
+    
     def create_sequences(
         self,
         X: np.ndarray,
@@ -0,0 +1,117 @@
+"""
+Price Stream Module
+
+Streams live trade prices from Alpaca's market-data websocket for a changing
+set of symbols, so price-sensitive logic (stop losses) can react as trades
+print instead of waiting for the next poll.
+"""
+
+import os
+import threading
+from typing import Callable, Iterable, Optional, Set
+
+from loguru import logger
+
+from alpaca.data.live import StockDataStream
+
+
+class PriceStream:
+    """
+    Live trade-price feed over a single websocket connection.
+    
+    The connection runs on a daemon thread and is only opened once there is
+    something to subscribe to. Subscriptions are diffed on each update, so
+    callers can pass the full desired symbol set every time.
+    """
+    
+    def __init__(
+        self,
+        on_price: Callable[[str, float], None],
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None
+    ):
+        """
+        Initialize price stream.
+        
+        Args:
+            on_price: Callback invoked as on_price(symbol, price) for each trade
+                (runs on the stream thread, so it must be quick)
+            api_key: Alpaca API key (defaults to env var)
+            secret_key: Alpaca secret key (defaults to env var)
+        """
+        self._on_price = on_price
+        self._api_key = api_key or os.getenv('ALPACA_API_KEY')
+        self._secret_key = secret_key or os.getenv('ALPACA_SECRET_KEY')
+        self._enabled = bool(self._api_key and self._secret_key)
+        if not self._enabled:
+            logger.warning("Alpaca API credentials not provided - price stream disabled")
+        
+        self._stream: Optional[StockDataStream] = None
+        self._thread: Optional[threading.Thread] = None
+        self._symbols: Set[str] = set()
+        self._lock = threading.Lock()
+    
+    def set_symbols(self, symbols: Iterable[str]):
+        """
+        Stream trades for exactly these symbols.
+        
+        Args:
+            symbols: Symbols to receive prices for
+        """
+        if not self._enabled:
+            return
+        
+        wanted = set(symbols)
+        
+        with self._lock:
+            added = wanted - self._symbols
+            removed = self._symbols - wanted
+            if not added and not removed:
+                return
+            
+            try:
+                if added:
+                    if self._stream is None:
+                        self._start()
+                    self._stream.subscribe_trades(self._handle_trade, *added)
+                if removed and self._stream is not None:
+                    self._stream.unsubscribe_trades(*removed)
+                
+                self._symbols = wanted
+                logger.info(f"Price stream symbols: {sorted(wanted) or 'none'}")
+            except Exception as e:
+                logger.warning(f"Could not update price stream subscriptions: {e}")
+    
+    def stop(self):
+        """Close the websocket connection and forget subscriptions."""
+        with self._lock:
+            if self._stream is None:
+                return
+            
+            try:
+                self._stream.stop()
+            except Exception as e:
+                logger.debug("Price stream stop: {}", e)
+            
+            self._stream = None
+            self._thread = None
+            self._symbols = set()
+            logger.info("Price stream stopped")
+    
+    def _start(self):
+        """Create the stream and run it on a daemon thread."""
+        self._stream = StockDataStream(self._api_key, self._secret_key)
+        self._thread = threading.Thread(
+            target=self._stream.run,
+            name='price-stream',
+            daemon=True
+        )
+        self._thread.start()
+        logger.info("Price stream started")
+    
+    async def _handle_trade(self, trade):
+        """Forward a trade print to the price callback."""
+        try:
+            self._on_price(trade.symbol, float(trade.price))
+        except Exception as e:
+            logger.error(f"Error handling streamed price for {trade.symbol}: {e}")
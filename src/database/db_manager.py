@@ -5,18 +5,18 @@ Provides a clean interface to all database operations through specialized reposi
 Follows Repository pattern and Single Responsibility Principle.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert, text
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import os
 import shutil
 from pathlib import Path
 from loguru import logger
 from dotenv import load_dotenv
 
-from src.database.schema import Base
+from src.database.schema import Base, Prediction, Signal, BotState
 from src.database.repositories import (
     TradeRepository,
     PositionRepository,
@@ -31,6 +31,34 @@ from src.database.repositories import (
 load_dotenv()
 
 
+def _create_engine(database_url: str):
+    """
+    Create the SQLAlchemy engine, tuning SQLite for frequent small commits.
+    
+    SQLite runs in WAL mode with synchronous=NORMAL, so a commit appends to
+    the write-ahead log without an fsync; fsyncs happen only at checkpoints.
+    Committed data survives an application crash, and at worst the last few
+    transactions are lost on power failure.
+    
+    Args:
+        database_url: Database connection string
+        
+    Returns:
+        Engine instance
+    """
+    engine = create_engine(database_url, echo=False)
+    
+    if database_url.startswith('sqlite:///'):
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+    
+    return engine
+
+
 class DatabaseManager:
     """
     Simplified database manager that coordinates repository access.
@@ -50,7 +78,7 @@ class DatabaseManager:
             database_url = os.getenv('DATABASE_URL', 'sqlite:///trading_bot.db')
         
         self.database_url = database_url
-        self.engine = create_engine(database_url, echo=False)
+        self.engine = _create_engine(database_url)
         self.SessionLocal = sessionmaker(bind=self.engine)
         
         # Create tables if they don't exist
@@ -140,6 +168,10 @@ class DatabaseManager:
             symbol, current_price, unrealized_pnl, unrealized_pnl_percent
         )
     
+    def update_position_prices(self, price_updates: List[Tuple[str, float, float, float]]) -> int:
+        """Batch-update position prices. Delegates to PositionRepository."""
+        return self.positions.update_position_prices(price_updates)
+    
     def get_active_positions(self):
         """Get active positions. Delegates to PositionRepository."""
         return self.positions.get_active_positions()
@@ -225,6 +257,62 @@ class DatabaseManager:
         """Get performance summary. Delegates to AnalyticsService."""
         return self.analytics.get_performance_summary(days)
     
+    # ==================== BATCH OPERATIONS ====================
+    
+    def flush_batch(self, writes: List[Tuple[str, Dict[str, Any]]]) -> bool:
+        """
+        Apply a batch of queued writes in a single transaction.
+        
+        Prediction and signal rows are inserted with one executemany per
+        table; bot state updates are merged in order and applied once.
+        
+        Args:
+            writes: List of (table, row) tuples, where table is one of
+                'predictions', 'signals' or 'bot_state'
+            
+        Returns:
+            bool: True if the batch was committed
+        """
+        if not writes:
+            return True
+        
+        rows: Dict[str, List[Dict[str, Any]]] = {'predictions': [], 'signals': []}
+        bot_state_updates: Dict[str, Any] = {}
+        
+        for table, row in writes:
+            if table == 'bot_state':
+                bot_state_updates.update(row)
+            elif table in rows:
+                rows[table].append(row)
+            else:
+                logger.warning(f"Ignoring batched write for unknown table: {table}")
+        
+        try:
+            with self.get_session() as session:
+                if rows['predictions']:
+                    session.execute(insert(Prediction), rows['predictions'])
+                if rows['signals']:
+                    session.execute(insert(Signal), rows['signals'])
+                
+                if bot_state_updates:
+                    state = session.query(BotState).first()
+                    if state:
+                        for key, value in bot_state_updates.items():
+                            setattr(state, key, value)
+                        state.updated_at = datetime.utcnow()
+                    else:
+                        logger.warning("Bot state not found")
+            
+            logger.debug(
+                "Flushed batch: {} predictions, {} signals, {} bot state fields",
+                len(rows['predictions']), len(rows['signals']), len(bot_state_updates)
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to flush batched writes: {e}")
+            return False
+    
     # ==================== DATABASE MAINTENANCE ====================
     
     def backup_database(self, backup_dir: str = "backups") -> str:
@@ -257,6 +345,10 @@ class DatabaseManager:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_file = backup_path / f"trading_bot_{timestamp}.db"
         
+        # Fold the write-ahead log into the main file so the copy is complete
+        with self.engine.connect() as conn:
+            conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        
         # Copy database file
         shutil.copy2(db_path, backup_file)
         
@@ -288,11 +380,15 @@ class DatabaseManager:
         # Close all connections
         self.engine.dispose()
         
+        # Drop any leftover write-ahead log so it isn't replayed onto the backup
+        for suffix in ('-wal', '-shm'):
+            Path(db_path + suffix).unlink(missing_ok=True)
+        
         # Restore backup
         shutil.copy2(backup_file, db_path)
         
         # Reconnect
-        self.engine = create_engine(self.database_url, echo=False)
+        self.engine = _create_engine(self.database_url)
         self.SessionLocal = sessionmaker(bind=self.engine)
         
         # Reinitialize repositories
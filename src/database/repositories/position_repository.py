@@ -5,8 +5,9 @@ Handles all CRUD operations for Position entities.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
+from sqlalchemy import bindparam, update
 
 from src.database.repositories.base_repository import BaseRepository
 from src.database.schema import Position
@@ -80,6 +81,53 @@ class PositionRepository(BaseRepository):
             
             return True
     
+    def update_position_prices(
+        self,
+        price_updates: List[Tuple[str, float, float, float]]
+    ) -> int:
+        """
+        Update prices and P&L for many positions in one transaction.
+        
+        Issues a single executemany UPDATE instead of one query and commit
+        per position.
+        
+        Args:
+            price_updates: List of (symbol, current_price, unrealized_pnl,
+                unrealized_pnl_percent) tuples
+            
+        Returns:
+            int: Number of position rows updated
+        """
+        if not price_updates:
+            return 0
+        
+        table = Position.__table__
+        stmt = (
+            update(table)
+            .where(table.c.symbol == bindparam('b_symbol'))
+            .values(
+                current_price=bindparam('b_price'),
+                unrealized_pnl=bindparam('b_pnl'),
+                unrealized_pnl_percent=bindparam('b_pnl_percent'),
+                updated_at=bindparam('b_updated_at')
+            )
+        )
+        now = datetime.utcnow()
+        rows = [
+            {
+                'b_symbol': symbol,
+                'b_price': current_price,
+                'b_pnl': unrealized_pnl,
+                'b_pnl_percent': unrealized_pnl_percent,
+                'b_updated_at': now
+            }
+            for symbol, current_price, unrealized_pnl, unrealized_pnl_percent in price_updates
+        ]
+        
+        with self.get_session() as session:
+            result = session.execute(stmt, rows)
+            return result.rowcount
+    
     def get_active_positions(self) -> List[Dict[str, Any]]:
         """
         Get all active positions.
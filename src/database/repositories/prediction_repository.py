@@ -31,7 +31,7 @@ class PredictionRepository(BaseRepository):
             session.add(prediction)
             session.flush()
             prediction_id = prediction.id
-            logger.debug(f"Saved prediction {prediction_id}: {prediction.symbol}")
+            logger.debug("Saved prediction {}: {}", prediction_id, prediction.symbol)
             return prediction_id
     
     def update_prediction_actual(
@@ -68,7 +68,7 @@ class PredictionRepository(BaseRepository):
             # Calculate error
             prediction.error = abs(actual_price - prediction.predicted_price)
             
-            logger.debug(f"Updated prediction {prediction_id} with actual: {actual_price}")
+            logger.debug("Updated prediction {} with actual: {}", prediction_id, actual_price)
             return True
     
     def get_predictions_by_symbol(
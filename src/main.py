@@ -6,7 +6,6 @@ All orchestration logic has been moved to specialized components.
 """
 
 import sys
-import time
 import signal
 from loguru import logger
 
@@ -25,8 +24,9 @@ def main():
     def signal_handler(signum, frame):
         """Handle shutdown signals gracefully."""
         logger.info(f"Received signal {signum} - shutting down...")
-        bot.stop()
-        sys.exit(0)
+        # A successful stop wakes the main thread, which then exits normally
+        if not bot.stop():
+            sys.exit(1)
     
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
@@ -44,11 +44,11 @@ def main():
         logger.error("Failed to start bot - exiting")
         sys.exit(1)
     
-    # Keep main thread alive
+    # Keep main thread alive until the bot stops (signal, circuit breaker
+    # or dashboard); sleeps without periodic wake-ups
     logger.info("Bot running - Press Ctrl+C to stop")
     try:
-        while bot.is_running:
-            time.sleep(1)
+        bot.wait_for_shutdown()
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt - stopping bot...")
         bot.stop()
@@ -7,15 +7,474 @@ This module handles:
 - Generating detailed reports
 """
 
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime
 from loguru import logger
 
-from src.ml.ensemble import EnsemblePredictor
-from src.data.data_fetcher import MarketDataFetcher
-from src.data.feature_engineer import FeatureEngineer
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: leave the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+# Predictor and data fetcher are imported where a backtest actually runs, so
+# importing this module for calculate_metrics/generate_report stays light
+if TYPE_CHECKING:
+    from src.ml.ensemble import EnsemblePredictor
+
+
+# Exit reasons by the codes the simulation kernel records
+_EXIT_REASONS = ('stop_loss', 'signal', 'end_of_test')
+_EXIT_STOP_LOSS, _EXIT_SIGNAL, _EXIT_END_OF_TEST = 0, 1, 2
+
+# Backtest report layout, filled from the results and metrics dicts
+_REPORT_RULE = "=" * 60
+_REPORT_TEMPLATE = (
+    "\n" + _REPORT_RULE + "\n"
+    "BACKTEST REPORT: {symbol}\n"
+    + _REPORT_RULE + "\n"
+    "\n"
+    "Period: {start_date} to {end_date}\n"
+    "Initial Capital: ${initial_capital:,.2f}\n"
+    "Final Capital: ${final_capital:,.2f}\n"
+    "Total Return: {total_return_pct:.2f}%\n"
+    "\n" + f"{'TRADE STATISTICS':-^60}" + "\n"
+    "Total Trades: {total_trades}\n"
+    "Winning Trades: {winning_trades}\n"
+    "Losing Trades: {losing_trades}\n"
+    "Win Rate: {win_rate:.1%}\n"
+    "Average Win: ${avg_win:.2f}\n"
+    "Average Loss: ${avg_loss:.2f}\n"
+    "Largest Win: ${largest_win:.2f}\n"
+    "Largest Loss: ${largest_loss:.2f}\n"
+    "Avg Holding Days: {avg_holding_days:.1f}\n"
+    "\n" + f"{'RISK METRICS':-^60}" + "\n"
+    "Sharpe Ratio: {sharpe_ratio:.2f}\n"
+    "Max Drawdown: {max_drawdown_pct:.2f}%\n"
+    "Profit Factor: {profit_factor:.2f}\n"
+    "\n" + f"{'RECENT TRADES':-^60}"
+)
+_REPORT_TRADE_LINE = (
+    "\n{entry_date} → {exit_date}: "
+    "${entry_price:.2f} → ${exit_price:.2f} "
+    "| P&L: ${pnl:.2f} ({pnl_pct:+.1f}%) "
+    "| Reason: {exit_reason}"
+)
+_REPORT_FOOTER = "\n" + _REPORT_RULE + "\n"
+
+# Predicted direction per bar
+_UP, _FLAT, _DOWN = 1, 0, -1
+
+
+class _ColumnRecords(Sequence):
+    """
+    Read-only list of per-row dicts over columnar data.
+    
+    Keeps the list-of-dicts result format (results['trades'] and
+    results['daily_values']) without holding a dict per row: each row's
+    dict is built when it is accessed.
+    Values are boxed to native Python scalars, as DataFrame.to_dict does.
+    """
+    
+    def __init__(self, columns: Dict[str, Any]):
+        """
+        Args:
+            columns: Column name -> equal-length positionally indexable
+                array (numpy array, DatetimeIndex, pandas array)
+        """
+        self._columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+        
+        record = {}
+        for name, column in self._columns.items():
+            value = column[index]
+            record[name] = value.item() if isinstance(value, np.generic) else value
+        return record
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _signal_masks(
+    probabilities: np.ndarray,
+    confidences: np.ndarray,
+    confidence_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Turn per-bar predictions into entry/exit masks for the simulation kernel.
+    
+    Works elementwise, so probabilities/confidences may be 1-D (one run) or
+    2-D (n_sims, n_bars).
+    
+    Args:
+        probabilities: Up-probability per bar (NaN = no prediction)
+        confidences: Confidence per bar
+        confidence_threshold: Minimum confidence to act on a prediction
+        
+    Returns:
+        Tuple of (entry_mask, exit_mask) bool arrays: a confident UP
+        prediction enters, a confident DOWN prediction exits
+    """
+    directions = np.where(probabilities > 0.5, _UP, _DOWN).astype(np.int8)
+    directions[np.isnan(probabilities)] = _FLAT
+    confident = confidences >= confidence_threshold
+    
+    return (directions == _UP) & confident, (directions == _DOWN) & confident
+
+
+@njit(cache=True)
+def _simulate(
+    close,
+    entry_mask,
+    exit_mask,
+    start,
+    stop,
+    initial_capital,
+    position_size_pct,
+    stop_loss_pct,
+    commission_rate
+):
+    """
+    Run the long-only entry/exit/stop-loss state machine over price arrays.
+    
+    Plain scalar code over NumPy arrays so Numba can compile it; without
+    Numba it runs unchanged as Python. Each bar is handled in one pass that
+    values the portfolio, checks the stop, and acts on the signal, with the
+    results written to preallocated arrays (a day can close at most one
+    trade, and row start + j is day j).
+    
+    Args:
+        close: Close price per row
+        entry_mask: Rows with a signal to enter (see _signal_masks)
+        exit_mask: Rows with a signal to exit
+        start: First row position to simulate
+        stop: Row position one past the end of the test range
+        initial_capital: Starting capital
+        position_size_pct: Max position size as a fraction of capital
+        stop_loss_pct: Stop loss as a fraction of the entry price
+        commission_rate: Commission per trade as a fraction of its value
+        
+    Returns:
+        Tuple of (n_trades, entry_idx, exit_idx, entry_price, exit_price,
+        shares, exit_code, portfolio_value, cash, position_value,
+        final_capital); only the first n_trades entries of the trade arrays
+        are filled
+    """
+    n = max(stop - start, 0)
+    entry_idx = np.empty(n + 1, np.int64)
+    exit_idx = np.empty(n + 1, np.int64)
+    entry_prices = np.empty(n + 1, np.float64)
+    exit_prices = np.empty(n + 1, np.float64)
+    trade_shares = np.empty(n + 1, np.int64)
+    exit_codes = np.empty(n + 1, np.int8)
+    day_values = np.empty(n, np.float64)
+    day_cash = np.empty(n, np.float64)
+    day_positions = np.empty(n, np.float64)
+    
+    n_trades = 0
+    capital = initial_capital
+    in_position = False
+    entry_price = 0.0
+    shares = 0
+    stop_price = 0.0
+    entered_at = 0
+    
+    for i in range(start, stop):
+        price = close[i]
+        
+        # Record daily portfolio value (shares is 0 while flat)
+        j = i - start
+        position_value = shares * price
+        day_values[j] = capital + position_value
+        day_cash[j] = capital
+        day_positions[j] = position_value
+        
+        # Check stop loss if in position
+        if in_position and price <= stop_price:
+            exit_value = shares * price
+            capital += exit_value - exit_value * commission_rate
+            
+            entry_idx[n_trades] = entered_at
+            exit_idx[n_trades] = i
+            entry_prices[n_trades] = entry_price
+            exit_prices[n_trades] = price
+            trade_shares[n_trades] = shares
+            exit_codes[n_trades] = _EXIT_STOP_LOSS
+            n_trades += 1
+            
+            in_position = False
+            shares = 0
+            continue  # Don't generate new signal same day
+        
+        if not in_position:
+            # No position - enter on an UP prediction
+            if entry_mask[i]:
+                new_shares = int(capital * position_size_pct / price)
+                
+                if new_shares > 0:
+                    entry_value = new_shares * price
+                    commission = entry_value * commission_rate
+                    
+                    if entry_value + commission <= capital:
+                        capital -= (entry_value + commission)
+                        in_position = True
+                        entry_price = price
+                        shares = new_shares
+                        stop_price = price * (1 - stop_loss_pct)
+                        entered_at = i
+        
+        elif exit_mask[i]:
+            # In position - exit on a DOWN prediction
+            exit_value = shares * price
+            capital += exit_value - exit_value * commission_rate
+            
+            entry_idx[n_trades] = entered_at
+            exit_idx[n_trades] = i
+            entry_prices[n_trades] = entry_price
+            exit_prices[n_trades] = price
+            trade_shares[n_trades] = shares
+            exit_codes[n_trades] = _EXIT_SIGNAL
+            n_trades += 1
+            
+            in_position = False
+            shares = 0
+    
+    # Close any remaining position at the last available price
+    if in_position:
+        last = len(close) - 1
+        capital += shares * close[last]
+        
+        entry_idx[n_trades] = entered_at
+        exit_idx[n_trades] = last
+        entry_prices[n_trades] = entry_price
+        exit_prices[n_trades] = close[last]
+        trade_shares[n_trades] = shares
+        exit_codes[n_trades] = _EXIT_END_OF_TEST
+        n_trades += 1
+    
+    return (
+        n_trades, entry_idx, exit_idx, entry_prices, exit_prices, trade_shares,
+        exit_codes, day_values, day_cash, day_positions, capital
+    )
+
+
+@njit(parallel=True, cache=True)
+def _simulate_many(
+    close,
+    entry_masks,
+    exit_masks,
+    start,
+    stop,
+    initial_capital,
+    position_size_pct,
+    stop_loss_pct,
+    commission_rate
+):
+    """
+    Run _simulate for every row of (n_sims, n_bars) arrays in parallel.
+    
+    Returns:
+        Tuple of (final_capital, n_trades) arrays, one entry per simulation
+    """
+    n_sims = entry_masks.shape[0]
+    final_capital = np.empty(n_sims, np.float64)
+    n_trades = np.empty(n_sims, np.int64)
+    
+    for k in prange(n_sims):
+        result = _simulate(
+            close[k], entry_masks[k], exit_masks[k], start, stop,
+            initial_capital, position_size_pct, stop_loss_pct, commission_rate
+        )
+        n_trades[k] = result[0]
+        final_capital[k] = result[10]
+    
+    return final_capital, n_trades
+
+
+def _metrics_core(
+    pnl: np.ndarray,
+    holding_days: np.ndarray,
+    portfolio_values: np.ndarray,
+    initial_capital: float
+) -> Dict:
+    """
+    Performance metrics from trade P&L, holding periods and daily values.
+    
+    Args:
+        pnl: P&L per trade (at least one trade)
+        holding_days: Holding period per trade in days
+        portfolio_values: Daily portfolio values
+        initial_capital: Starting capital
+        
+    Returns:
+        Dictionary with performance metrics
+    """
+    total_trades = pnl.size
+    
+    # Basic stats
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl < 0]
+    winning_trades = wins.size
+    losing_trades = losses.size
+    win_rate = winning_trades / total_trades if total_trades > 0 else 0
+    
+    # P&L stats
+    avg_win = wins.mean() if wins.size else 0
+    avg_loss = losses.mean() if losses.size else 0
+    largest_win = wins.max() if wins.size else 0
+    largest_loss = losses.min() if losses.size else 0
+    
+    # Return
+    final_value = portfolio_values[-1] if portfolio_values.size else initial_capital
+    total_return_pct = (final_value / initial_capital - 1) * 100
+    
+    # Sharpe Ratio (daily returns)
+    if portfolio_values.size > 1:
+        returns = np.diff(portfolio_values) / portfolio_values[:-1]
+        
+        if len(returns) > 0 and np.std(returns) > 0:
+            sharpe_ratio = np.mean(returns) / np.std(returns) * np.sqrt(252)  # Annualized
+        else:
+            sharpe_ratio = 0.0
+    else:
+        sharpe_ratio = 0.0
+    
+    # Maximum Drawdown (running peak via a cumulative max)
+    if portfolio_values.size:
+        peak = np.maximum.accumulate(portfolio_values)
+        max_drawdown_pct = ((peak - portfolio_values) / peak).max() * 100
+    else:
+        max_drawdown_pct = 0.0
+    
+    # Profit Factor
+    total_wins = wins.sum()
+    total_losses = abs(losses.sum())
+    profit_factor = total_wins / total_losses if total_losses > 0 else 0.0
+    
+    return {
+        'total_return_pct': float(total_return_pct),
+        'total_trades': int(total_trades),
+        'winning_trades': int(winning_trades),
+        'losing_trades': int(losing_trades),
+        'win_rate': float(win_rate),
+        'avg_win': float(avg_win),
+        'avg_loss': float(avg_loss),
+        'largest_win': float(largest_win),
+        'largest_loss': float(largest_loss),
+        'sharpe_ratio': float(sharpe_ratio),
+        'max_drawdown_pct': float(max_drawdown_pct),
+        'profit_factor': float(profit_factor),
+        'avg_holding_days': float(holding_days.mean())
+    }
+
+
+def _array_digest(*arrays: np.ndarray) -> bytes:
+    """Content hash of float64 arrays, used as a metrics cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        digest.update(array.size.to_bytes(8, 'little'))
+        digest.update(array.tobytes())
+    return digest.digest()
+
+
+# Metrics by (array digest, initial capital), least recently used first.
+# Walk-forward runs score heavily overlapping folds, often the same ones.
+_METRICS_CACHE_SIZE = 1024
+_metrics_cache: 'OrderedDict[Tuple[bytes, float], Dict]' = OrderedDict()
+_metrics_cache_lock = threading.Lock()
+
+
+def _cached_metrics(
+    pnl: np.ndarray,
+    holding_days: np.ndarray,
+    portfolio_values: np.ndarray,
+    initial_capital: float
+) -> Dict:
+    """_metrics_core, memoized on the content of its inputs."""
+    key = (_array_digest(pnl, holding_days, portfolio_values), initial_capital)
+    
+    with _metrics_cache_lock:
+        metrics = _metrics_cache.get(key)
+        if metrics is not None:
+            _metrics_cache.move_to_end(key)
+            return dict(metrics)
+    
+    # Computed outside the lock; Backtesters on other threads may compute
+    # the same key, and the last one to store it wins
+    metrics = _metrics_core(pnl, holding_days, portfolio_values, initial_capital)
+    with _metrics_cache_lock:
+        _metrics_cache[key] = metrics
+        _metrics_cache.move_to_end(key)
+        if len(_metrics_cache) > _METRICS_CACHE_SIZE:
+            _metrics_cache.popitem(last=False)
+    
+    return dict(metrics)
+
+
+# Ensemble predictor loaded once per backtest worker process
+_worker_predictor: Optional['EnsemblePredictor'] = None
+
+
+def _init_backtest_worker(predictor_kwargs: Dict[str, Any]):
+    """Load the ensemble predictor once when a backtest worker starts."""
+    from src.ml.ensemble import EnsemblePredictor
+    
+    global _worker_predictor
+    _worker_predictor = EnsemblePredictor(**predictor_kwargs)
+
+
+def _run_backtest_worker(
+    backtester: 'Backtester',
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    sequence_length: int
+) -> Dict:
+    """Backtest one symbol with this worker's predictor."""
+    return backtester.run_backtest(
+        symbol=symbol,
+        start_date=start_date,
+        end_date=end_date,
+        predictor=_worker_predictor,
+        sequence_length=sequence_length
+    )
 
 
 class Backtester:
@@ -55,7 +514,7 @@ class Backtester:
         symbol: str,
         start_date: str,
         end_date: str,
-        predictor: EnsemblePredictor,
+        predictor: 'EnsemblePredictor',
         sequence_length: int = 60
     ) -> Dict:
         """
@@ -75,11 +534,13 @@ class Backtester:
             f"Running backtest for {symbol}: {start_date} to {end_date}"
         )
         
+        from src.data.data_fetcher import DataFetcher
+        
         # Fetch historical data (need extra for sequence)
-        data_fetcher = MarketDataFetcher()
-        start_extended = (
-            pd.to_datetime(start_date) - timedelta(days=sequence_length + 30)
-        ).strftime('%Y-%m-%d')
+        data_fetcher = DataFetcher()
+        start_extended = str(
+            np.datetime64(start_date, 'D') - np.timedelta64(sequence_length + 30, 'D')
+        )
         
         df = data_fetcher.fetch_historical_data(
             symbol=symbol,
@@ -92,166 +553,93 @@ class Backtester:
         
         logger.info(f"Fetched {len(df)} days of historical data")
         
-        # Initialize tracking
-        capital = self.initial_capital
-        position = None  # (entry_price, shares, stop_loss, entry_date)
-        trades = []
-        daily_values = []
+        # Predict every bar up front: one feature pass and one batched model
+        # call instead of a full ensemble_predict on a growing history slice per
+        # simulated day (which made the backtest quadratic in its length)
+        probabilities, confidences = predictor.ensemble_predict_rolling(df, symbol=symbol)
         
-        # Backtest date range
-        test_dates = df.loc[start_date:end_date].index
+        # Backtest date range, resolved to row positions once; the simulation
+        # then reads plain arrays instead of slicing the frame every day
+        test_range = df.index.slice_indexer(start_date, end_date)
+        dates = df.index
+        close_arr = df['close'].to_numpy(dtype=np.float64)
         
-        for current_date in test_dates:
-            # Get historical data up to current date
-            history = df.loc[:current_date]
-            
-            if len(history) < sequence_length:
-                continue  # Not enough history yet
-            
-            current_price = history.iloc[-1]['close']
-            
-            # Update daily portfolio value
-            if position is not None:
-                entry_price, shares, stop_loss, entry_date = position
-                position_value = shares * current_price
-                total_value = capital + position_value
-            else:
-                total_value = capital
-            
-            daily_values.append({
-                'date': current_date,
-                'portfolio_value': total_value,
-                'cash': capital,
-                'position_value': position_value if position else 0
-            })
-            
-            # Check stop loss if in position
-            if position is not None:
-                entry_price, shares, stop_loss, entry_date = position
-                
-                if current_price <= stop_loss:
-                    # Stop loss triggered
-                    exit_value = shares * current_price
-                    commission = exit_value * self.commission_rate
-                    capital += exit_value - commission
-                    
-                    pnl = exit_value - (entry_price * shares)
-                    pnl_pct = (current_price / entry_price - 1) * 100
-                    
-                    trades.append({
-                        'symbol': symbol,
-                        'entry_date': entry_date,
-                        'exit_date': current_date,
-                        'entry_price': entry_price,
-                        'exit_price': current_price,
-                        'shares': shares,
-                        'pnl': pnl,
-                        'pnl_pct': pnl_pct,
-                        'exit_reason': 'stop_loss',
-                        'holding_days': (current_date - entry_date).days
-                    })
-                    
-                    logger.debug(
-                        f"Stop loss triggered: {symbol} at ${current_price:.2f}, "
-                        f"P&L=${pnl:.2f} ({pnl_pct:.1f}%)"
-                    )
-                    
-                    position = None
-                    continue  # Don't generate new signal same day
-            
-            # Generate prediction
-            try:
-                prediction = predictor.ensemble_predict(history, symbol=symbol)
-            except Exception as e:
-                logger.error(f"Prediction failed on {current_date}: {e}")
-                continue
-            
-            # Trading logic
-            if position is None:
-                # No position - check for entry signal
-                if (prediction.direction == "UP" and 
-                    prediction.confidence >= self.confidence_threshold):
-                    
-                    # Calculate position size
-                    max_position_value = capital * self.position_size_pct
-                    shares = int(max_position_value / current_price)
-                    
-                    if shares > 0:
-                        entry_value = shares * current_price
-                        commission = entry_value * self.commission_rate
-                        
-                        if entry_value + commission <= capital:
-                            # Enter position
-                            capital -= (entry_value + commission)
-                            stop_loss_price = current_price * (1 - self.stop_loss_pct)
-                            position = (current_price, shares, stop_loss_price, current_date)
-                            
-                            logger.debug(
-                                f"Entered position: {shares} shares of {symbol} at "
-                                f"${current_price:.2f}, stop=${stop_loss_price:.2f}"
-                            )
-            
-            else:
-                # In position - check for exit signal
-                entry_price, shares, stop_loss, entry_date = position
-                
-                if (prediction.direction == "DOWN" and 
-                    prediction.confidence >= self.confidence_threshold):
-                    
-                    # Exit position
-                    exit_value = shares * current_price
-                    commission = exit_value * self.commission_rate
-                    capital += exit_value - commission
-                    
-                    pnl = exit_value - (entry_price * shares)
-                    pnl_pct = (current_price / entry_price - 1) * 100
-                    
-                    trades.append({
-                        'symbol': symbol,
-                        'entry_date': entry_date,
-                        'exit_date': current_date,
-                        'entry_price': entry_price,
-                        'exit_price': current_price,
-                        'shares': shares,
-                        'pnl': pnl,
-                        'pnl_pct': pnl_pct,
-                        'exit_reason': 'signal',
-                        'holding_days': (current_date - entry_date).days
-                    })
-                    
-                    logger.debug(
-                        f"Exited position: {symbol} at ${current_price:.2f}, "
-                        f"P&L=${pnl:.2f} ({pnl_pct:.1f}%)"
-                    )
-                    
-                    position = None
-        
-        # Close any remaining position at end
-        if position is not None:
-            entry_price, shares, stop_loss, entry_date = position
-            final_price = df.iloc[-1]['close']
-            exit_value = shares * final_price
-            capital += exit_value
-            
-            pnl = exit_value - (entry_price * shares)
-            pnl_pct = (final_price / entry_price - 1) * 100
-            
-            trades.append({
-                'symbol': symbol,
-                'entry_date': entry_date,
-                'exit_date': df.index[-1],
-                'entry_price': entry_price,
-                'exit_price': final_price,
-                'shares': shares,
-                'pnl': pnl,
-                'pnl_pct': pnl_pct,
-                'exit_reason': 'end_of_test',
-                'holding_days': (df.index[-1] - entry_date).days
-            })
+        # Rows before sequence_length - 1 lack the history to trade
+        first = max(test_range.start, sequence_length - 1)
+        stop = max(test_range.stop, first)
+        
+        tradable = probabilities[first:stop]
+        missing = int(np.count_nonzero(np.isnan(tradable)))
+        if missing:
+            logger.warning(f"No prediction available for {missing} backtest days; they are not traded")
+        
+        entry_mask, exit_mask = _signal_masks(
+            np.asarray(probabilities, dtype=np.float64),
+            np.asarray(confidences, dtype=np.float64),
+            self.confidence_threshold
+        )
+        
+        (
+            n_trades, entry_idx, exit_idx, entry_prices, exit_prices, trade_shares,
+            exit_codes, day_values, day_cash, day_positions, capital
+        ) = _simulate(
+            close_arr,
+            entry_mask,
+            exit_mask,
+            first,
+            stop,
+            float(self.initial_capital),
+            float(self.position_size_pct),
+            float(self.stop_loss_pct),
+            float(self.commission_rate)
+        )
+        
+        # Trades as one columnar frame built from the kernel's arrays; the
+        # legacy list of dicts is a view over its columns for the report format
+        entry_prices = entry_prices[:n_trades]
+        exit_prices = exit_prices[:n_trades]
+        trade_shares = trade_shares[:n_trades]
+        entry_dates = dates[entry_idx[:n_trades]]
+        exit_dates = dates[exit_idx[:n_trades]]
+        
+        trades_df = pd.DataFrame({
+            'symbol': symbol,
+            'entry_date': entry_dates,
+            'exit_date': exit_dates,
+            'entry_price': entry_prices,
+            'exit_price': exit_prices,
+            'shares': trade_shares,
+            'pnl': trade_shares * exit_prices - entry_prices * trade_shares,
+            'pnl_pct': (exit_prices / entry_prices - 1) * 100,
+            'exit_reason': pd.Categorical.from_codes(exit_codes[:n_trades], _EXIT_REASONS),
+            'holding_days': (exit_dates - entry_dates).days
+        })
+        trades = _ColumnRecords({name: trades_df[name].array for name in trades_df.columns})
+        
+        for trade in trades_df.itertuples(index=False):
+            logger.debug(
+                "Trade closed ({}): {} shares of {} ${:.2f} -> ${:.2f}, P&L=${:.2f} ({:.1f}%)",
+                trade.exit_reason, trade.shares, symbol, trade.entry_price,
+                trade.exit_price, trade.pnl, trade.pnl_pct
+            )
+        
+        # Daily series stay as the kernel's columns; per-day dicts are only
+        # built when 'daily_values' rows are read, which long backtests avoid
+        daily_arrays = {
+            'date': dates[first:stop],
+            'portfolio_value': day_values,
+            'cash': day_cash,
+            'position_value': day_positions
+        }
         
         # Calculate metrics
         final_value = capital
-        metrics = self.calculate_metrics(trades, daily_values, self.initial_capital)
+        metrics = self.calculate_metrics(
+            trades_df,
+            [],
+            self.initial_capital,
+            portfolio_values=daily_arrays['portfolio_value']
+        )
         
         logger.info(
             f"Backtest complete: {len(trades)} trades, "
@@ -266,28 +654,168 @@ class Backtester:
             'initial_capital': self.initial_capital,
             'final_capital': final_value,
             'trades': trades,
-            'daily_values': daily_values,
+            'trades_df': trades_df,
+            'daily_values': _ColumnRecords(daily_arrays),
+            'daily_values_arrays': daily_arrays,
             'metrics': metrics
         }
     
+    def run_backtest_multi(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        predictor_kwargs: Optional[Dict[str, Any]] = None,
+        sequence_length: int = 60,
+        n_jobs: Optional[int] = None
+    ) -> Dict[str, Dict]:
+        """
+        Run backtests for several symbols in parallel worker processes.
+        
+        Each worker loads its own EnsemblePredictor once (models are not
+        pickled across processes) and backtests symbols independently.
+        
+        Args:
+            symbols: Stock symbols to backtest
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            predictor_kwargs: Keyword arguments for EnsemblePredictor
+                (e.g. lstm_model_path, rf_model_path)
+            sequence_length: Days of history needed for prediction
+            n_jobs: Worker processes (default: CPU count); 1 runs every
+                symbol in this process, which is easier to debug
+            
+        Returns:
+            Dict of symbol -> backtest results (symbols that failed are omitted)
+        """
+        predictor_kwargs = predictor_kwargs or {}
+        n_jobs = min(n_jobs or os.cpu_count() or 1, len(symbols)) or 1
+        
+        logger.info(f"Running backtests for {len(symbols)} symbols with {n_jobs} worker(s)")
+        
+        results = {}
+        
+        if n_jobs == 1:
+            from src.ml.ensemble import EnsemblePredictor
+            
+            predictor = EnsemblePredictor(**predictor_kwargs)
+            for symbol in symbols:
+                try:
+                    results[symbol] = self.run_backtest(
+                        symbol, start_date, end_date, predictor, sequence_length
+                    )
+                except Exception as e:
+                    logger.error(f"Backtest failed for {symbol}: {e}")
+            return results
+        
+        # Spawn rather than fork: TensorFlow state does not survive a fork
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_backtest_worker,
+            initargs=(predictor_kwargs,)
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _run_backtest_worker, self, symbol, start_date, end_date, sequence_length
+                ): symbol
+                for symbol in symbols
+            }
+            
+            for done, future in enumerate(as_completed(futures), start=1):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                    logger.info(f"Backtest {done}/{len(symbols)} complete: {symbol}")
+                except Exception as e:
+                    logger.error(f"Backtest failed for {symbol}: {e}")
+        
+        return results
+    
+    @staticmethod
+    def daily_value_records(results: Dict) -> List[Dict]:
+        """
+        Daily portfolio values of a backtest as one dict per day.
+        
+        Args:
+            results: Result of run_backtest
+            
+        Returns:
+            List of {'date', 'portfolio_value', 'cash', 'position_value'} dicts
+        """
+        return list(results['daily_values'])
+    
+    def simulate_paths(
+        self,
+        close: np.ndarray,
+        probabilities: np.ndarray,
+        confidences: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run the trading rules over many simulated prediction paths at once.
+        
+        Meant for Monte-Carlo / bootstrap studies: each row is one
+        simulation over the same bars, run by the compiled kernel in
+        parallel when Numba is installed.
+        
+        Args:
+            close: Close prices, shape (n_bars,) shared by every simulation
+                or (n_sims, n_bars)
+            probabilities: Up-probabilities, shape (n_sims, n_bars)
+            confidences: Confidences, shape (n_sims, n_bars)
+        
+        Returns:
+            Dict with 'final_capital', 'total_return_pct' and 'total_trades'
+            arrays, one entry per simulation
+        """
+        probabilities = np.atleast_2d(np.asarray(probabilities, dtype=np.float64))
+        confidences = np.atleast_2d(np.asarray(confidences, dtype=np.float64))
+        close = np.broadcast_to(np.asarray(close, dtype=np.float64), probabilities.shape)
+        
+        entry_masks, exit_masks = _signal_masks(
+            probabilities, confidences, self.confidence_threshold
+        )
+        
+        final_capital, n_trades = _simulate_many(
+            close,
+            entry_masks,
+            exit_masks,
+            0,
+            probabilities.shape[1],
+            float(self.initial_capital),
+            float(self.position_size_pct),
+            float(self.stop_loss_pct),
+            float(self.commission_rate)
+        )
+        
+        return {
+            'final_capital': final_capital,
+            'total_return_pct': (final_capital / self.initial_capital - 1) * 100,
+            'total_trades': n_trades
+        }
+    
     def calculate_metrics(
         self,
-        trades: List[Dict],
+        trades: Union[List[Dict], pd.DataFrame],
         daily_values: List[Dict],
-        initial_capital: float
+        initial_capital: float,
+        portfolio_values: Optional[np.ndarray] = None
     ) -> Dict:
         """
         Calculate performance metrics.
         
         Args:
-            trades: List of trade dictionaries
-            daily_values: List of daily portfolio values
+            trades: List of trade dictionaries, or the trades DataFrame
+            daily_values: List of daily portfolio values (ignored when
+                portfolio_values is given)
             initial_capital: Starting capital
+            portfolio_values: Daily portfolio values as an array; when given,
+                used instead of extracting them from daily_values
             
         Returns:
             Dictionary with performance metrics
         """
-        if not trades:
+        if len(trades) == 0:
             return {
                 'total_return_pct': 0.0,
                 'total_trades': 0,
@@ -303,74 +831,25 @@ class Backtester:
                 'profit_factor': 0.0
             }
         
-        # Basic stats
+        # One float array per series instead of a list per statistic
         total_trades = len(trades)
-        winning_trades = sum(1 for t in trades if t['pnl'] > 0)
-        losing_trades = sum(1 for t in trades if t['pnl'] < 0)
-        win_rate = winning_trades / total_trades if total_trades > 0 else 0
-        
-        # P&L stats
-        total_pnl = sum(t['pnl'] for t in trades)
-        wins = [t['pnl'] for t in trades if t['pnl'] > 0]
-        losses = [t['pnl'] for t in trades if t['pnl'] < 0]
-        
-        avg_win = np.mean(wins) if wins else 0
-        avg_loss = np.mean(losses) if losses else 0
-        largest_win = max(wins) if wins else 0
-        largest_loss = min(losses) if losses else 0
-        
-        # Return
-        final_value = daily_values[-1]['portfolio_value'] if daily_values else initial_capital
-        total_return_pct = (final_value / initial_capital - 1) * 100
-        
-        # Sharpe Ratio (daily returns)
-        if len(daily_values) > 1:
-            portfolio_values = [d['portfolio_value'] for d in daily_values]
-            returns = np.diff(portfolio_values) / portfolio_values[:-1]
-            
-            if len(returns) > 0 and np.std(returns) > 0:
-                sharpe_ratio = np.mean(returns) / np.std(returns) * np.sqrt(252)  # Annualized
-            else:
-                sharpe_ratio = 0.0
+        if isinstance(trades, pd.DataFrame):
+            pnl = trades['pnl'].to_numpy(dtype=np.float64)
+            holding_days = trades['holding_days'].to_numpy(dtype=np.float64)
         else:
-            sharpe_ratio = 0.0
-        
-        # Maximum Drawdown
-        if daily_values:
-            portfolio_values = [d['portfolio_value'] for d in daily_values]
-            peak = portfolio_values[0]
-            max_drawdown = 0
-            
-            for value in portfolio_values:
-                if value > peak:
-                    peak = value
-                drawdown = (peak - value) / peak
-                max_drawdown = max(max_drawdown, drawdown)
-            
-            max_drawdown_pct = max_drawdown * 100
-        else:
-            max_drawdown_pct = 0.0
-        
-        # Profit Factor
-        total_wins = sum(wins) if wins else 0
-        total_losses = abs(sum(losses)) if losses else 0
-        profit_factor = total_wins / total_losses if total_losses > 0 else 0.0
+            pnl = np.fromiter((t['pnl'] for t in trades), dtype=np.float64, count=total_trades)
+            holding_days = np.fromiter(
+                (t['holding_days'] for t in trades), dtype=np.float64, count=total_trades
+            )
+        if portfolio_values is None:
+            portfolio_values = np.fromiter(
+                (d['portfolio_value'] for d in daily_values),
+                dtype=np.float64,
+                count=len(daily_values)
+            )
         
-        return {
-            'total_return_pct': float(total_return_pct),
-            'total_trades': int(total_trades),
-            'winning_trades': int(winning_trades),
-            'losing_trades': int(losing_trades),
-            'win_rate': float(win_rate),
-            'avg_win': float(avg_win),
-            'avg_loss': float(avg_loss),
-            'largest_win': float(largest_win),
-            'largest_loss': float(largest_loss),
-            'sharpe_ratio': float(sharpe_ratio),
-            'max_drawdown_pct': float(max_drawdown_pct),
-            'profit_factor': float(profit_factor),
-            'avg_holding_days': float(np.mean([t['holding_days'] for t in trades]))
-        }
+        # Identical inputs (overlapping walk-forward folds) come from the cache
+        return _cached_metrics(pnl, holding_days, portfolio_values, float(initial_capital))
     
     def generate_report(self, results: Dict) -> str:
         """
@@ -382,161 +861,16 @@ class Backtester:
         Returns:
             Formatted report string
         """
-        metrics = results['metrics']
-        
-        report = [
-            "\n" + "="*60,
-            f"BACKTEST REPORT: {results['symbol']}",
-            "="*60,
-            f"\nPeriod: {results['start_date']} to {results['end_date']}",
-            f"Initial Capital: ${results['initial_capital']:,.2f}",
-            f"Final Capital: ${results['final_capital']:,.2f}",
-            f"Total Return: {metrics['total_return_pct']:.2f}%",
-            f"\n{'TRADE STATISTICS':-^60}",
-            f"Total Trades: {metrics['total_trades']}",
-            f"Winning Trades: {metrics['winning_trades']}",
-            f"Losing Trades: {metrics['losing_trades']}",
-            f"Win Rate: {metrics['win_rate']:.1%}",
-            f"Average Win: ${metrics['avg_win']:.2f}",
-            f"Average Loss: ${metrics['avg_loss']:.2f}",
-            f"Largest Win: ${metrics['largest_win']:.2f}",
-            f"Largest Loss: ${metrics['largest_loss']:.2f}",
-            f"Avg Holding Days: {metrics['avg_holding_days']:.1f}",
-            f"\n{'RISK METRICS':-^60}",
-            f"Sharpe Ratio: {metrics['sharpe_ratio']:.2f}",
-            f"Max Drawdown: {metrics['max_drawdown_pct']:.2f}%",
-            f"Profit Factor: {metrics['profit_factor']:.2f}",
-            f"\n{'RECENT TRADES':-^60}"
-        ]
+        # One format_map over the whole template instead of a string per line
+        report = _REPORT_TEMPLATE.format_map({**results, **results['metrics']})
         
         # Show last 5 trades
         recent_trades = results['trades'][-5:] if results['trades'] else []
-        for trade in recent_trades:
-            report.append(
-                f"{trade['entry_date'].strftime('%Y-%m-%d')} → "
-                f"{trade['exit_date'].strftime('%Y-%m-%d')}: "
-                f"${trade['entry_price']:.2f} → ${trade['exit_price']:.2f} "
-                f"| P&L: ${trade['pnl']:.2f} ({trade['pnl_pct']:+.1f}%) "
-                f"| Reason: {trade['exit_reason']}"
-            )
-        
-        report.append("="*60 + "\n")
-        
-        return "\n".join(report)
-
-
-# Example usage
-if __name__ == "__main__":
-    from loguru import logger
-    import sys
-    
-    # Configure logging
-    logger.remove()
-    logger.add(sys.stdout, level="INFO")
-    
-    print("\n=== Backtester Example ===\n")
-    
-    # Check if ensemble model exists
-    from pathlib import Path
-    lstm_path = "models/lstm_model.h5"
-    
-    if not Path(lstm_path).exists():
-        print(f"LSTM model not found: {lstm_path}")
-        print("Please train an LSTM model first")
-        print("\nGenerating mock backtest results...")
-        
-        # Create mock backtest results
-        mock_results = {
-            'symbol': 'PLTR',
-            'start_date': '2024-01-01',
-            'end_date': '2024-12-31',
-            'initial_capital': 10000.0,
-            'final_capital': 12500.0,
-            'trades': [
-                {
-                    'symbol': 'PLTR',
-                    'entry_date': pd.Timestamp('2024-01-15'),
-                    'exit_date': pd.Timestamp('2024-01-20'),
-                    'entry_price': 30.0,
-                    'exit_price': 32.0,
-                    'shares': 100,
-                    'pnl': 200.0,
-                    'pnl_pct': 6.67,
-                    'exit_reason': 'signal',
-                    'holding_days': 5
-                },
-                {
-                    'symbol': 'PLTR',
-                    'entry_date': pd.Timestamp('2024-02-01'),
-                    'exit_date': pd.Timestamp('2024-02-05'),
-                    'entry_price': 31.0,
-                    'exit_price': 29.5,
-                    'shares': 100,
-                    'pnl': -150.0,
-                    'pnl_pct': -4.84,
-                    'exit_reason': 'stop_loss',
-                    'holding_days': 4
-                }
-            ],
-            'daily_values': [
-                {'date': pd.Timestamp('2024-01-15'), 'portfolio_value': 10000, 'cash': 7000, 'position_value': 3000},
-                {'date': pd.Timestamp('2024-01-16'), 'portfolio_value': 10100, 'cash': 7000, 'position_value': 3100},
-            ],
-            'metrics': {
-                'total_return_pct': 25.0,
-                'total_trades': 2,
-                'winning_trades': 1,
-                'losing_trades': 1,
-                'win_rate': 0.5,
-                'avg_win': 200.0,
-                'avg_loss': -150.0,
-                'largest_win': 200.0,
-                'largest_loss': -150.0,
-                'sharpe_ratio': 1.2,
-                'max_drawdown_pct': 5.0,
-                'profit_factor': 1.33,
-                'avg_holding_days': 4.5
-            }
-        }
-        
-        # Generate report
-        backtester = Backtester()
-        report = backtester.generate_report(mock_results)
-        print(report)
+        entry_dates = pd.DatetimeIndex([t['entry_date'] for t in recent_trades]).strftime('%Y-%m-%d')
+        exit_dates = pd.DatetimeIndex([t['exit_date'] for t in recent_trades]).strftime('%Y-%m-%d')
+        trade_lines = "".join(
+            _REPORT_TRADE_LINE.format_map({**trade, 'entry_date': entry_date, 'exit_date': exit_date})
+            for trade, entry_date, exit_date in zip(recent_trades, entry_dates, exit_dates)
+        )
         
-    else:
-        print("To run a full backtest, you need:")
-        print("1. A trained LSTM model")
-        print("2. Historical data (will be fetched automatically)")
-        print("3. Valid Alpaca API keys for data fetching")
-        print("\nExample code:")
-        print("""
-from src.ml.ensemble import EnsemblePredictor
-from src.ml.backtest import Backtester
-
-# Initialize predictor
-predictor = EnsemblePredictor(
-    lstm_model_path="models/lstm_model.h5"
-)
-
-# Run backtest
-backtester = Backtester(
-    initial_capital=10000,
-    position_size_pct=0.20,
-    stop_loss_pct=0.03,
-    confidence_threshold=0.70
-)
-
-results = backtester.run_backtest(
-    symbol="PLTR",
-    start_date="2023-01-01",
-    end_date="2024-01-01",
-    predictor=predictor
-)
-
-# Generate report
-report = backtester.generate_report(results)
-print(report)
-        """)
-    
-    print("\n=== Demo Complete ===")
+        return report + trade_lines + _REPORT_FOOTER
@@ -7,52 +7,348 @@ This module handles:
 - Weighted voting for final prediction
 """
 
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 from loguru import logger
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: leave the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 import joblib
 from pathlib import Path
 
 from src.bot_types.trading_types import ModelPrediction
-from src.ml.predictor import LSTMPredictor
 from src.data.feature_engineer import FeatureEngineer
 
+if TYPE_CHECKING:
+    from src.ml.predictor import LSTMPredictor
+
+
+# FeatureEngineer columns read by the momentum signal, in order, with the
+# value used when a column is absent or not yet defined (None = the bar's
+# close) and the scale applied to it (price_change is a fraction, the
+# signal expects a percentage)
+_MOMENTUM_COLUMNS = (
+    ('close', None, 1.0),
+    ('sma_20', None, 1.0),
+    ('sma_50', None, 1.0),
+    ('rsi', 50.0, 1.0),
+    ('macd', 0.0, 1.0),
+    ('macd_signal', 0.0, 1.0),
+    ('volume_ratio', 1.0, 1.0),
+    ('price_change', 0.0, 100.0)
+)
+
+
+def _momentum_inputs(df_features: pd.DataFrame) -> np.ndarray:
+    """
+    Collect the momentum signal's inputs as one float array.
+    
+    Args:
+        df_features: DataFrame with technical indicators
+        
+    Returns:
+        Array of shape (rows, len(_MOMENTUM_COLUMNS)), missing columns
+        and values (e.g. sma_50 before 50 bars) filled with their defaults
+    """
+    close = df_features['close'].to_numpy(dtype=np.float64)
+    inputs = np.empty((len(df_features), len(_MOMENTUM_COLUMNS)))
+    
+    for j, (column, default, scale) in enumerate(_MOMENTUM_COLUMNS):
+        fill = close if default is None else default
+        if column in df_features.columns:
+            values = df_features[column].to_numpy(dtype=np.float64) * scale
+            inputs[:, j] = np.where(np.isnan(values), fill, values)
+        else:
+            inputs[:, j] = fill
+    
+    return inputs
+
+
+@njit(cache=True)
+def _confidence_kernel(probs):
+    """
+    Agreement and extremity of component probabilities, and their blend.
+    
+    Straight loops over a handful of floats: compiled, this avoids the
+    NumPy call overhead that dominates np.std/np.mean at this size.
+    
+    Args:
+        probs: Component probabilities (float64 array, at least one)
+        
+    Returns:
+        Tuple of (agreement_score, avg_extremity, confidence)
+    """
+    n = probs.shape[0]
+    
+    mean = 0.0
+    for p in probs:
+        mean += p
+    mean /= n
+    
+    variance = 0.0
+    extremity = 0.0
+    for p in probs:
+        variance += (p - mean) * (p - mean)
+        extremity += abs(p - 0.5) * 2
+    std = np.sqrt(variance / n)
+    
+    # Lower spread = more agreement; more extreme probabilities = more conviction
+    agreement_score = 1.0 - min(std * 2, 1.0)
+    avg_extremity = extremity / n
+    
+    # Agreement is more important than extremity
+    confidence = (agreement_score * 0.6) + (avg_extremity * 0.4)
+    
+    return agreement_score, avg_extremity, confidence
+
+
+# Recent ensemble predictions kept per predictor, keyed on their input data
+_PREDICTION_CACHE_SIZE = 256
+
+# Slots of the ensemble components in probability/weight vectors
+_LSTM, _RF, _MOMENTUM = 0, 1, 2
+_COMPONENT_NAMES = ('lstm', 'rf', 'momentum')
+
+
+def _frame_digest(df: pd.DataFrame) -> bytes:
+    """Content hash of the close and volume columns of df."""
+    digest = hashlib.blake2b(digest_size=16)
+    for column in ('close', 'volume'):
+        digest.update(df[column].to_numpy(dtype=np.float64).tobytes())
+    return digest.digest()
+
+
+# Momentum sub-signal weights: price trend, RSI, MACD, volume, price change
+# (normalized once here, so combining the sub-signals is a single product)
+_MOMENTUM_WEIGHTS = np.array([0.3, 0.2, 0.25, 0.15, 0.1])
+_MOMENTUM_WEIGHTS /= _MOMENTUM_WEIGHTS.sum()
+
+
+@njit(parallel=True, cache=True)
+def _momentum_kernel(inputs, weights):
+    """
+    Compiled momentum signal, rows scored in parallel.
+    
+    Same rules as _momentum_probabilities, written as per-bar branches;
+    np.minimum/np.maximum keep its NaN propagation.
+    
+    Args:
+        inputs: Float64 array of shape (rows, len(_MOMENTUM_COLUMNS))
+        weights: Normalized sub-signal weights (_MOMENTUM_WEIGHTS)
+        
+    Returns:
+        Probability of up movement (0-1) per row
+    """
+    n = inputs.shape[0]
+    out = np.empty(n)
+    
+    for i in prange(n):
+        close = inputs[i, 0]
+        sma_20 = inputs[i, 1]
+        sma_50 = inputs[i, 2]
+        rsi = inputs[i, 3]
+        macd = inputs[i, 4]
+        macd_signal = inputs[i, 5]
+        volume_ratio = inputs[i, 6]
+        price_change_pct = inputs[i, 7]
+        
+        if close > sma_20:
+            price_signal = 0.8 if sma_20 > sma_50 else 0.65
+        elif close < sma_20:
+            price_signal = 0.2 if sma_20 < sma_50 else 0.35
+        else:
+            price_signal = 0.5
+        
+        if rsi < 30:
+            rsi_signal = 0.7
+        elif rsi > 70:
+            rsi_signal = 0.3
+        elif rsi >= 40 and rsi <= 60:
+            rsi_signal = 0.5
+        elif rsi < 50:
+            rsi_signal = 0.4
+        else:
+            rsi_signal = 0.6
+        
+        if macd > macd_signal:
+            macd_prob = 0.75 if macd > 0 else 0.65
+        elif macd < macd_signal:
+            macd_prob = 0.25 if macd < 0 else 0.35
+        else:
+            macd_prob = 0.5
+        
+        if volume_ratio > 1.5:
+            volume_prob = 0.5 + (price_signal - 0.5) * 1.2
+        elif volume_ratio < 0.7:
+            volume_prob = 0.5 + (price_signal - 0.5) * 0.5
+        else:
+            volume_prob = price_signal
+        volume_prob = np.minimum(np.maximum(volume_prob, 0.0), 1.0)
+        
+        if price_change_pct > 0:
+            change_prob = 0.5 + np.minimum(price_change_pct / 10, 0.3)
+        else:
+            change_prob = 0.5 + np.maximum(price_change_pct / 10, -0.3)
+        
+        probability = (
+            price_signal * weights[0] + rsi_signal * weights[1] + macd_prob * weights[2]
+            + volume_prob * weights[3] + change_prob * weights[4]
+        )
+        out[i] = np.minimum(np.maximum(probability, 0.0), 1.0)
+    
+    return out
+
+
+def _momentum_probabilities(inputs: np.ndarray) -> np.ndarray:
+    """
+    Calculate the momentum signal for rows of _momentum_inputs.
+    
+    Simple momentum strategy:
+    - Recent price trend
+    - Volume confirmation
+    - RSI levels
+    
+    With numba the compiled _momentum_kernel scores the rows in parallel.
+    Otherwise each rule is an ordered np.select over whole columns rather
+    than an if/elif chain per bar. Either way, scoring a single bar and
+    every bar of a backtest is the same call.
+    
+    Args:
+        inputs: Array of shape (rows, len(_MOMENTUM_COLUMNS))
+        
+    Returns:
+        Probability of up movement (0-1) per row
+    """
+    if NUMBA_AVAILABLE:
+        return _momentum_kernel(np.ascontiguousarray(inputs, dtype=np.float64), _MOMENTUM_WEIGHTS)
+    
+    close, sma_20, sma_50, rsi, macd, macd_signal, volume_ratio, price_change_pct = inputs.T
+    
+    # 1. Price momentum: current price against the moving averages
+    above_20 = close > sma_20
+    below_20 = close < sma_20
+    price_signal = np.select(
+        [above_20 & (sma_20 > sma_50), above_20, below_20 & (sma_20 < sma_50), below_20],
+        [0.8, 0.65, 0.2, 0.35],  # Strong/moderate uptrend, strong/moderate downtrend
+        default=0.5
+    )
+    
+    # 2. RSI: oversold likely to bounce, overbought likely to drop
+    rsi_signal = np.select(
+        [rsi < 30, rsi > 70, (rsi >= 40) & (rsi <= 60), rsi < 50],
+        [0.7, 0.3, 0.5, 0.4],
+        default=0.6
+    )
+    
+    # 3. MACD: crossover direction, stronger on the matching side of zero
+    macd_up = macd > macd_signal
+    macd_down = macd < macd_signal
+    macd_prob = np.select(
+        [macd_up & (macd > 0), macd_up, macd_down & (macd < 0), macd_down],
+        [0.75, 0.65, 0.25, 0.35],
+        default=0.5
+    )
+    
+    # 4. Volume confirmation: high volume amplifies the price signal, low dampens it
+    volume_prob = np.clip(
+        np.select(
+            [volume_ratio > 1.5, volume_ratio < 0.7],
+            [0.5 + (price_signal - 0.5) * 1.2, 0.5 + (price_signal - 0.5) * 0.5],
+            default=price_signal
+        ),
+        0, 1
+    )
+    
+    # 5. Recent price change, capped at 0.8 and floored at 0.2
+    change_prob = np.where(
+        price_change_pct > 0,
+        0.5 + np.minimum(price_change_pct / 10, 0.3),
+        0.5 + np.maximum(price_change_pct / 10, -0.3)
+    )
+    
+    signals = np.stack([price_signal, rsi_signal, macd_prob, volume_prob, change_prob], axis=1)
+    momentum_probability = signals @ _MOMENTUM_WEIGHTS
+    
+    return np.clip(momentum_probability, 0, 1)
+
 
 class EnsemblePredictor:
     """Combine multiple prediction methods for robust trading signals."""
     
     def __init__(
         self,
-        lstm_model_path: str,
+        lstm_model_path: Optional[str] = None,
         rf_model_path: Optional[str] = None,
         lstm_weight: float = 0.5,
         rf_weight: float = 0.3,
         momentum_weight: float = 0.2,
         sequence_length: int = 60,
-        confidence_threshold: float = 0.70
+        confidence_threshold: float = 0.70,
+        lstm_predictor: Optional['LSTMPredictor'] = None,
+        lstm_inference_dtype: str = "float32",
+        lstm_use_tflite: bool = False,
+        fast_path_threshold: Optional[float] = None,
+        max_cache_age_bars: int = 1
     ):
         """
         Initialize the ensemble predictor.
         
         Args:
-            lstm_model_path: Path to trained LSTM model
+            lstm_model_path: Path to trained LSTM model (ignored if lstm_predictor given)
             rf_model_path: Path to trained Random Forest model (optional)
             lstm_weight: Weight for LSTM predictions (default: 0.5)
             rf_weight: Weight for Random Forest predictions (default: 0.3)
             momentum_weight: Weight for momentum signals (default: 0.2)
             sequence_length: Number of time steps for LSTM
             confidence_threshold: Minimum confidence for valid prediction
+            lstm_predictor: Already-loaded LSTMPredictor to share instead of
+                loading the model from lstm_model_path again
+            lstm_inference_dtype: Precision for LSTM inference when loading
+                from lstm_model_path ('float32', 'float16' or 'bfloat16')
+            lstm_use_tflite: Serve LSTM predictions from a TensorFlow Lite
+                copy of the model with float16 weights (see LSTMPredictor)
+            fast_path_threshold: When set, a momentum probability further
+                than this from 0.5 that agrees with the symbol's last LSTM
+                direction reuses the last LSTM and Random Forest outputs
+                instead of running them (momentum stays within about
+                0.22-0.78, so useful values are below 0.28; default: off)
+            max_cache_age_bars: Oldest LSTM/Random Forest outputs, in bars,
+                the momentum fast path may reuse
         """
         self.lstm_weight = lstm_weight
         self.rf_weight = rf_weight
         self.momentum_weight = momentum_weight
         self.sequence_length = sequence_length
         self.confidence_threshold = confidence_threshold
+        self.fast_path_threshold = fast_path_threshold
+        self.max_cache_age_bars = max_cache_age_bars
         
         # Validate weights sum to 1
         total_weight = lstm_weight + rf_weight + momentum_weight
@@ -64,133 +360,574 @@ class EnsemblePredictor:
             self.rf_weight /= total_weight
             self.momentum_weight /= total_weight
         
-        # Initialize models
-        self.lstm_predictor: Optional[LSTMPredictor] = None
-        self.rf_model: Optional[RandomForestClassifier] = None
-        self.rf_scaler: Optional[StandardScaler] = None
+        # Models are loaded from disk on first use (see the properties below),
+        # so constructing a predictor costs nothing until it predicts
+        self._lstm_model_path = lstm_model_path
+        self._lstm_inference_dtype = lstm_inference_dtype
+        self._lstm_use_tflite = lstm_use_tflite
+        self._rf_model_path = rf_model_path
+        self._lstm_predictor: Optional['LSTMPredictor'] = lstm_predictor
+        self._lstm_loaded = lstm_predictor is not None
+        self._rf_model: Optional[RandomForestClassifier] = None
+        self._rf_scaling: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._rf_session = None  # ONNX Runtime session for rf_model, when exported
+        self._rf_loaded = False
+        self._load_lock = threading.RLock()
+        
+        # Stateless, so the component threads below can all share it
         self.feature_engineer = FeatureEngineer()
         
-        # Load LSTM model
-        if Path(lstm_model_path).exists():
-            self.lstm_predictor = LSTMPredictor(
-                model_path=lstm_model_path,
-                sequence_length=sequence_length,
-                confidence_threshold=confidence_threshold
-            )
-            logger.info(f"Loaded LSTM model from: {lstm_model_path}")
-        else:
-            logger.warning(f"LSTM model not found: {lstm_model_path}")
-        
-        # Load Random Forest model if provided
-        if rf_model_path and Path(rf_model_path).exists():
-            self.rf_model = joblib.load(rf_model_path)
-            scaler_path = Path(rf_model_path).with_suffix('.scaler')
-            if scaler_path.exists():
-                self.rf_scaler = joblib.load(scaler_path)
-            logger.info(f"Loaded Random Forest model from: {rf_model_path}")
-        else:
-            logger.info("Random Forest model not loaded (optional)")
+        # Predictions are deterministic in the input bars, so a re-evaluation
+        # before a new bar arrives is answered from here. Kept in memory only:
+        # the repeats come from one process's loop, and entries written to
+        # disk could outlive the model files they were computed with
+        self._prediction_cache: 'OrderedDict[tuple, ModelPrediction]' = OrderedDict()
+        self._prediction_cache_lock = threading.Lock()
+        
+        # Per symbol: (last bar, LSTM prediction, RF probability) from the
+        # last full prediction, reused by the momentum fast path
+        self._last_components: Dict[str, Tuple[Any, ModelPrediction, Optional[float]]] = {}
+        
+        # The LSTM, Random Forest and momentum components of a prediction are
+        # independent; TF and NumPy release the GIL, so they run side by side
+        self._executor = self._create_executor()
+        
+        if lstm_predictor is not None:
+            logger.info("Using shared LSTM predictor")
         
         logger.info(
             f"Initialized EnsemblePredictor: lstm_w={self.lstm_weight:.2f}, "
             f"rf_w={self.rf_weight:.2f}, momentum_w={self.momentum_weight:.2f}"
         )
     
+    @staticmethod
+    def _create_executor() -> ThreadPoolExecutor:
+        """Create the component pool (its threads start on first use)."""
+        return ThreadPoolExecutor(max_workers=3, thread_name_prefix='ensemble')
+    
+    def shutdown(self):
+        """
+        Wait for running component predictions and release their threads.
+        
+        A fresh pool replaces the old one, so the predictor stays usable.
+        """
+        self._executor.shutdown(wait=True)
+        self._executor = self._create_executor()
+    
+    @property
+    def lstm_predictor(self) -> Optional['LSTMPredictor']:
+        """LSTM predictor, loaded from lstm_model_path on first access."""
+        if not self._lstm_loaded:
+            self._load_lstm()
+        return self._lstm_predictor
+    
+    @lstm_predictor.setter
+    def lstm_predictor(self, predictor: Optional['LSTMPredictor']):
+        self._lstm_predictor = predictor
+        self._lstm_loaded = True
+    
+    @property
+    def rf_model(self) -> Optional[RandomForestClassifier]:
+        """Random Forest model, loaded from rf_model_path on first access."""
+        if not self._rf_loaded:
+            self._load_random_forest()
+        return self._rf_model
+    
+    @rf_model.setter
+    def rf_model(self, model: Optional[RandomForestClassifier]):
+        self._rf_model = model
+        self._rf_loaded = True
+    
+    @property
+    def rf_scaling(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Random Forest feature scaling as (mean, 1 / scale), loaded along with it."""
+        if not self._rf_loaded:
+            self._load_random_forest()
+        return self._rf_scaling
+    
+    @rf_scaling.setter
+    def rf_scaling(self, scaling: Optional[Tuple[np.ndarray, np.ndarray]]):
+        self._rf_scaling = scaling
+    
+    @property
+    def rf_session(self):
+        """ONNX Runtime session of the Random Forest, loaded along with it."""
+        if not self._rf_loaded:
+            self._load_random_forest()
+        return self._rf_session
+    
+    @rf_session.setter
+    def rf_session(self, session):
+        self._rf_session = session
+    
+    def _load_lstm(self):
+        """Load the LSTM model from disk (once, thread-safe)."""
+        with self._load_lock:
+            if self._lstm_loaded:
+                return
+            
+            if self._lstm_model_path and Path(self._lstm_model_path).exists():
+                # Imported here so TensorFlow loads only when an LSTM is used
+                from src.ml.predictor import LSTMPredictor
+                
+                self._lstm_predictor = LSTMPredictor(
+                    model_path=self._lstm_model_path,
+                    sequence_length=self.sequence_length,
+                    confidence_threshold=self.confidence_threshold,
+                    inference_dtype=self._lstm_inference_dtype,
+                    use_tflite=self._lstm_use_tflite
+                )
+                logger.info(f"Loaded LSTM model from: {self._lstm_model_path}")
+            else:
+                logger.warning(f"LSTM model not found: {self._lstm_model_path}")
+            
+            self._lstm_loaded = True
+    
+    def _load_random_forest(self):
+        """Load the Random Forest model, scaler and ONNX export (once, thread-safe)."""
+        with self._load_lock:
+            if self._rf_loaded:
+                return
+            
+            rf_model_path = self._rf_model_path
+            if rf_model_path and Path(rf_model_path).exists():
+                self._rf_model = joblib.load(rf_model_path)
+                self._rf_scaling = self._load_rf_scaling(Path(rf_model_path))
+                self._rf_session = self._load_rf_session(Path(rf_model_path).with_suffix('.onnx'))
+                logger.info(f"Loaded Random Forest model from: {rf_model_path}")
+            else:
+                logger.info("Random Forest model not loaded (optional)")
+            
+            self._rf_loaded = True
+    
     def ensemble_predict(
         self,
         df: pd.DataFrame,
-        symbol: str = "PLTR"
+        symbol: str = "PLTR",
+        df_features: Optional[pd.DataFrame] = None
     ) -> ModelPrediction:
         """
         Generate ensemble prediction combining all methods.
         
+        A repeat call on the same bars (e.g. a re-evaluation before the
+        next bar arrives) returns the cached prediction, restamped with the
+        current time. The cache is an in-memory LRU per predictor.
+        
         Args:
             df: DataFrame with historical OHLCV data
             symbol: Stock symbol
+            df_features: Technical indicators already calculated for df
+                (optional, calculated here if omitted)
             
         Returns:
             ModelPrediction with ensemble direction and confidence
         """
-        logger.info(f"Generating ensemble prediction for {symbol}")
+        key = self._prediction_key(df, symbol)
+        cached = self._cached_prediction(key)
+        if cached is not None:
+            logger.info("Reusing ensemble prediction for {} (no new data)", symbol)
+            return cached
+        
+        logger.info("Generating ensemble prediction for {}", symbol)
+        
+        # Indicators are calculated once and shared by every component
+        if df_features is None:
+            df_features = self.feature_engineer.calculate_technical_indicators(df)
+        
+        # Momentum is the cheapest component, so it decides whether the
+        # heavy models need to run at all
+        momentum_prob = self._momentum_component(df_features)
+        
+        reused = self._reusable_components(df, symbol, momentum_prob)
+        if reused is not None:
+            lstm_pred, rf_prob = reused
+            logger.info("Strong momentum for {}, reusing last LSTM/Random Forest outputs", symbol)
+        else:
+            lstm_future = self._executor.submit(self._predict_lstm, df, symbol, df_features)
+            rf_future = self._executor.submit(self._rf_component, df_features)
+            lstm_pred, rf_prob = lstm_future.result(), rf_future.result()
+            if lstm_pred is not None:
+                self._last_components[symbol] = (df.index[-1], lstm_pred, rf_prob)
+        
+        prediction = self._combine_predictions(df, symbol, lstm_pred, rf_prob, momentum_prob)
+        self._store_prediction(key, prediction)
+        return prediction
+    
+    def ensemble_predict_batch(
+        self,
+        data: Dict[str, pd.DataFrame],
+        features: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> Dict[str, ModelPrediction]:
+        """
+        Generate ensemble predictions for several symbols.
         
-        predictions = {}
-        weights = {}
+        The LSTM runs once on all symbols stacked into a single batch; the
+        Random Forest and momentum components are then combined per symbol.
+        Symbols on the momentum fast path reuse their last LSTM/RF outputs
+        and are left out of the batch.
         
-        # 1. LSTM Prediction
-        if self.lstm_predictor is not None:
+        Args:
+            data: Dict of symbol -> DataFrame with historical OHLCV data
+            features: Dict of symbol -> technical indicators already
+                calculated for that symbol's data (optional, missing
+                symbols are calculated here)
+            
+        Returns:
+            Dict of symbol -> ModelPrediction (symbols whose prediction
+            failed are omitted)
+        """
+        features = dict(features or {})
+        if len(data) == 1:
+            symbol, df = next(iter(data.items()))
             try:
-                lstm_pred = self.lstm_predictor.predict_next_day(df, symbol)
-                # Get probability from metadata (stored there to match ModelPrediction dataclass)
-                lstm_probability = lstm_pred.metadata.get('probability', 0.5)
-                predictions['lstm'] = lstm_probability
-                weights['lstm'] = self.lstm_weight
-                logger.info(
-                    f"LSTM: direction={lstm_pred.direction}, "
-                    f"prob={lstm_probability:.3f}, "
-                    f"conf={lstm_pred.confidence:.3f}"
+                return {symbol: self.ensemble_predict(df, symbol, features.get(symbol))}
+            except Exception as e:
+                logger.error(f"Ensemble prediction failed for {symbol}: {e}")
+                return {}
+        
+        # Every prediction in the batch is stamped with the same time
+        now = datetime.now()
+        
+        # Symbols whose data has not changed since their last prediction
+        results = {}
+        keys = {}
+        for symbol, df in data.items():
+            keys[symbol] = self._prediction_key(df, symbol)
+            cached = self._cached_prediction(keys[symbol], now)
+            if cached is not None:
+                results[symbol] = cached
+        
+        data = {symbol: df for symbol, df in data.items() if symbol not in results}
+        if not data:
+            logger.info("Reusing ensemble predictions for all symbols (no new data)")
+            return results
+        
+        logger.info(
+            f"Generating ensemble predictions for {len(data)} symbols "
+            f"({len(results)} reused)"
+        )
+        
+        # Indicators are calculated at most once per symbol and shared by
+        # every component
+        for symbol, df in data.items():
+            if symbol not in features:
+                features[symbol] = self.feature_engineer.calculate_technical_indicators(df)
+        
+        # Momentum decides per symbol whether the heavy models need to run,
+        # as in ensemble_predict
+        momentum = {}
+        components: Dict[str, Tuple[Optional[ModelPrediction], Optional[float]]] = {}
+        for symbol, df in data.items():
+            momentum[symbol] = self._momentum_component(features[symbol])
+            reused = self._reusable_components(df, symbol, momentum[symbol])
+            if reused is not None:
+                components[symbol] = reused
+                logger.info("Strong momentum for {}, reusing last LSTM/Random Forest outputs", symbol)
+        
+        # The LSTM batch only holds symbols whose outputs were not reused
+        pending = {symbol: df for symbol, df in data.items() if symbol not in components}
+        
+        lstm_preds: Dict[str, ModelPrediction] = {}
+        if pending and self.lstm_predictor is not None:
+            try:
+                lstm_preds = self.lstm_predictor.predict_next_day_many(
+                    pending, {symbol: features[symbol] for symbol in pending}
                 )
             except Exception as e:
-                logger.error(f"LSTM prediction failed: {e}")
-                weights['lstm'] = 0.0
-        else:
+                logger.error(f"Batched LSTM prediction failed: {e}")
+        elif pending:
             logger.warning("LSTM predictor not available")
-            weights['lstm'] = 0.0
         
-        # 2. Random Forest Prediction
-        if self.rf_model is not None:
+        for symbol, df in pending.items():
+            lstm_pred = lstm_preds.get(symbol)
+            rf_prob = self._rf_component(features[symbol])
+            components[symbol] = (lstm_pred, rf_prob)
+            if lstm_pred is not None:
+                self._last_components[symbol] = (df.index[-1], lstm_pred, rf_prob)
+        
+        for symbol, df in data.items():
             try:
-                rf_prob = self._predict_random_forest(df)
-                predictions['rf'] = rf_prob
-                weights['rf'] = self.rf_weight
-                rf_direction = "UP" if rf_prob > 0.5 else "DOWN"
-                logger.info(
-                    f"Random Forest: direction={rf_direction}, prob={rf_prob:.3f}"
+                lstm_pred, rf_prob = components[symbol]
+                results[symbol] = self._combine_predictions(
+                    df, symbol, lstm_pred, rf_prob, momentum[symbol],
+                    timestamp=now
                 )
+                self._store_prediction(keys[symbol], results[symbol])
             except Exception as e:
-                logger.error(f"Random Forest prediction failed: {e}")
-                weights['rf'] = 0.0
-        else:
+                logger.error(f"Ensemble prediction failed for {symbol}: {e}")
+        
+        return results
+    
+    def _reusable_components(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        momentum_prob: Optional[float]
+    ) -> Optional[Tuple[ModelPrediction, Optional[float]]]:
+        """
+        Last LSTM and Random Forest outputs, if the momentum fast path applies.
+        
+        Applies when fast_path_threshold is set, momentum is beyond it, the
+        outputs are at most max_cache_age_bars old and the LSTM pointed the
+        same way momentum does now.
+        
+        Args:
+            df: DataFrame with historical OHLCV data
+            symbol: Stock symbol
+            momentum_prob: Momentum up probability for the latest bar
+            
+        Returns:
+            Tuple of (LSTM prediction, RF probability), or None to run the models
+        """
+        if self.fast_path_threshold is None or momentum_prob is None:
+            return None
+        if abs(momentum_prob - 0.5) <= self.fast_path_threshold:
+            return None
+        
+        last = self._last_components.get(symbol)
+        if last is None:
+            return None
+        
+        last_bar, lstm_pred, rf_prob = last
+        position = df.index.get_indexer([last_bar])[0]
+        if position < 0 or len(df) - 1 - position > self.max_cache_age_bars:
+            return None
+        
+        lstm_up = lstm_pred.metadata.get('probability', 0.5) > 0.5
+        if lstm_up != (momentum_prob > 0.5):
+            return None
+        
+        return lstm_pred, rf_prob
+    
+    def _prediction_key(self, df: pd.DataFrame, symbol: str) -> tuple:
+        """
+        Cache key identifying the prediction for symbol on exactly this data.
+        
+        Args:
+            df: DataFrame with historical OHLCV data
+            symbol: Stock symbol
+            
+        Returns:
+            Tuple of (symbol, rows, last bar, digest of close/volume)
+        """
+        return (symbol, len(df), df.index[-1] if len(df) else None, _frame_digest(df))
+    
+    def _cached_prediction(
+        self,
+        key: tuple,
+        timestamp: Optional[datetime] = None
+    ) -> Optional[ModelPrediction]:
+        """
+        Look up a cached prediction.
+        
+        Args:
+            key: Result of _prediction_key
+            timestamp: Time to stamp the copy with (default: now)
+            
+        Returns:
+            Copy of the cached prediction stamped with the given time, or
+            None if there is none
+        """
+        with self._prediction_cache_lock:
+            prediction = self._prediction_cache.get(key)
+            if prediction is None:
+                return None
+            self._prediction_cache.move_to_end(key)
+        
+        return dataclasses.replace(
+            prediction,
+            timestamp=timestamp or datetime.now(),
+            metadata=dict(prediction.metadata)
+        )
+    
+    def _store_prediction(self, key: tuple, prediction: ModelPrediction):
+        """Cache a prediction, evicting the least recently used beyond the limit."""
+        # Keep a copy so callers changing their prediction cannot alter the cache
+        prediction = dataclasses.replace(prediction, metadata=dict(prediction.metadata))
+        with self._prediction_cache_lock:
+            self._prediction_cache[key] = prediction
+            self._prediction_cache.move_to_end(key)
+            if len(self._prediction_cache) > _PREDICTION_CACHE_SIZE:
+                self._prediction_cache.popitem(last=False)
+    
+    def _predict_lstm(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        df_features: pd.DataFrame
+    ) -> Optional[ModelPrediction]:
+        """
+        Run the LSTM component.
+        
+        Args:
+            df: DataFrame with historical OHLCV data
+            symbol: Stock symbol
+            df_features: Technical indicators calculated for df
+            
+        Returns:
+            LSTM prediction, or None if the LSTM is unavailable or failed
+        """
+        if self.lstm_predictor is None:
+            logger.warning("LSTM predictor not available")
+            return None
+        
+        try:
+            return self.lstm_predictor.predict_next_day(df, symbol, df_features)
+        except Exception as e:
+            logger.error(f"LSTM prediction failed: {e}")
+            return None
+    
+    def _rf_component(self, df_features: pd.DataFrame) -> Optional[float]:
+        """
+        Run the Random Forest component.
+        
+        Args:
+            df_features: DataFrame with technical indicators
+            
+        Returns:
+            Probability of up movement, or None if the model is unavailable or failed
+        """
+        if self.rf_model is None:
+            return None
+        
+        try:
+            return self._predict_random_forest(df_features)
+        except Exception as e:
+            logger.error(f"Random Forest prediction failed: {e}")
+            return None
+    
+    def _momentum_component(self, df_features: pd.DataFrame) -> Optional[float]:
+        """
+        Run the momentum component.
+        
+        Args:
+            df_features: DataFrame with technical indicators
+            
+        Returns:
+            Probability of up movement, or None if the calculation failed
+        """
+        try:
+            return float(_momentum_probabilities(_momentum_inputs(df_features.iloc[-1:]))[0])
+        except Exception as e:
+            logger.error(f"Momentum calculation failed: {e}")
+            return None
+    
+    def _combine_predictions(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        lstm_pred: Optional[ModelPrediction],
+        rf_prob: Optional[float],
+        momentum_prob: Optional[float],
+        timestamp: Optional[datetime] = None
+    ) -> ModelPrediction:
+        """
+        Combine the LSTM output with Random Forest and momentum signals.
+        
+        Args:
+            df: DataFrame with historical OHLCV data
+            symbol: Stock symbol
+            lstm_pred: LSTM prediction for the symbol, or None if unavailable
+            rf_prob: Random Forest up probability, or None if unavailable
+            momentum_prob: Momentum up probability, or None if unavailable
+            timestamp: When the prediction applies (default: now)
+            
+        Returns:
+            ModelPrediction with ensemble direction and confidence
+        """
+        # Unavailable components keep weight 0 (and a neutral 0.5)
+        probs = np.full(3, 0.5)
+        weights = np.zeros(3)
+        valid = np.zeros(3, dtype=bool)
+        
+        # 1. LSTM Prediction
+        if lstm_pred is not None:
+            # Get probability from metadata (stored there to match ModelPrediction dataclass)
+            probs[_LSTM] = lstm_pred.metadata.get('probability', 0.5)
+            weights[_LSTM] = self.lstm_weight
+            valid[_LSTM] = True
+            logger.info(
+                "LSTM: direction={}, prob={:.3f}, conf={:.3f}",
+                lstm_pred.direction, probs[_LSTM], lstm_pred.confidence
+            )
+        
+        # 2. Random Forest Prediction
+        if rf_prob is not None:
+            probs[_RF] = rf_prob
+            weights[_RF] = self.rf_weight
+            valid[_RF] = True
+            logger.info(
+                "Random Forest: direction={}, prob={:.3f}",
+                "UP" if rf_prob > 0.5 else "DOWN", rf_prob
+            )
+        elif self.rf_model is None:
             logger.info("Random Forest not available, redistributing weight")
-            weights['rf'] = 0.0
         
         # 3. Momentum Signal
-        try:
-            momentum_prob = self._calculate_momentum_signal(df)
-            predictions['momentum'] = momentum_prob
-            weights['momentum'] = self.momentum_weight
-            momentum_direction = "UP" if momentum_prob > 0.5 else "DOWN"
+        if momentum_prob is not None:
+            probs[_MOMENTUM] = momentum_prob
+            weights[_MOMENTUM] = self.momentum_weight
+            valid[_MOMENTUM] = True
             logger.info(
-                f"Momentum: direction={momentum_direction}, prob={momentum_prob:.3f}"
+                "Momentum: direction={}, prob={:.3f}",
+                "UP" if momentum_prob > 0.5 else "DOWN", momentum_prob
             )
-        except Exception as e:
-            logger.error(f"Momentum calculation failed: {e}")
-            weights['momentum'] = 0.0
         
-        # Normalize weights if some models failed
-        total_weight = sum(weights.values())
-        if total_weight == 0:
-            raise RuntimeError("All prediction methods failed")
+        total_weight = weights.sum()
+        if 0 < total_weight < 1.0:
+            logger.warning("Normalizing weights (total={})", total_weight)
         
-        if total_weight < 1.0:
-            logger.warning(f"Normalizing weights (total={total_weight})")
-            for key in weights:
-                weights[key] /= total_weight
+        ensemble_probability, confidence = self._weighted_probability(probs, weights, valid)
+        prediction = self._make_prediction(
+            symbol, ensemble_probability, confidence, weights, df['close'].iat[-1],
+            timestamp=timestamp
+        )
         
-        # Calculate weighted ensemble probability
-        ensemble_probability = sum(
-            predictions.get(key, 0.5) * weights[key]
-            for key in weights
+        logger.info(
+            "Ensemble prediction: {} with probability={:.3f}, confidence={:.3f}",
+            prediction.direction, ensemble_probability, confidence
+        )
+        
+        # Individual contributions (how much each model moved the result),
+        # only built when debug logging is enabled
+        logger.opt(lazy=True).debug(
+            "Contributions: {}",
+            lambda: ", ".join(
+                f"{_COMPONENT_NAMES[k]}: prob={probs[k]:.3f}, weight={weights[k]:.2f}, "
+                f"contribution={(probs[k] - 0.5) * weights[k] * 2:.3f}"
+                for k in np.flatnonzero(valid)
+            )
         )
         
+        return prediction
+    
+    def _make_prediction(
+        self,
+        symbol: str,
+        ensemble_probability: float,
+        confidence: float,
+        weights: np.ndarray,
+        current_price: float,
+        timestamp: Optional[datetime] = None
+    ) -> ModelPrediction:
+        """
+        Build the ensemble ModelPrediction from its combined probability.
+        
+        Args:
+            symbol: Stock symbol
+            ensemble_probability: Weighted probability of an up move
+            confidence: Ensemble confidence
+            weights: Component weights used, by slot (after normalization)
+            current_price: Close of the bar the prediction is made at
+            timestamp: When the prediction applies (default: now)
+            
+        Returns:
+            ModelPrediction with ensemble direction and confidence
+        """
         # Determine direction
         direction = "UP" if ensemble_probability > 0.5 else "DOWN"
         
-        # Calculate confidence
-        # More agreement between models = higher confidence
-        confidence = self._calculate_ensemble_confidence(predictions, weights)
-        
         # Calculate predicted price based on ensemble probability
-        current_price = df.iloc[-1]['close']
         # Use probability to estimate price movement magnitude
         # Higher probability = larger expected move
         if direction == "UP":
@@ -209,168 +946,374 @@ class EnsemblePredictor:
             direction=direction,
             confidence=confidence,
             features_used=["LSTM", "RandomForest", "Momentum"],
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             model_name="Ensemble",
             metadata={
                 'ensemble_probability': ensemble_probability,
-                'lstm_weight': weights.get('lstm', 0),
-                'rf_weight': weights.get('rf', 0),
-                'momentum_weight': weights.get('momentum', 0),
+                'lstm_weight': float(weights[_LSTM]),
+                'rf_weight': float(weights[_RF]),
+                'momentum_weight': float(weights[_MOMENTUM]),
                 'current_price': current_price
             }
         )
         
-        logger.info(
-            f"Ensemble prediction: {direction} with "
-            f"probability={ensemble_probability:.3f}, confidence={confidence:.3f}"
-        )
+        return prediction
+    
+    def _weighted_probability(
+        self,
+        probs: np.ndarray,
+        weights: np.ndarray,
+        valid: np.ndarray
+    ) -> Tuple[float, float]:
+        """
+        Combine component probabilities into the ensemble probability.
+        
+        Args:
+            probs: Probability of an up move per component slot
+            weights: Weight per component slot (0 for unavailable components);
+                normalized in place if some components failed
+            valid: Which slots hold a component prediction
+            
+        Returns:
+            Tuple of (ensemble probability, confidence)
+            
+        Raises:
+            RuntimeError: If every component failed
+        """
+        # Normalize weights if some models failed
+        total_weight = weights.sum()
+        if total_weight == 0:
+            raise RuntimeError("All prediction methods failed")
         
-        # Log individual contributions
-        for model, prob in predictions.items():
-            contribution = (prob - 0.5) * weights[model] * 2  # How much this model influenced result
-            logger.debug(f"  {model}: prob={prob:.3f}, weight={weights[model]:.2f}, contribution={contribution:.3f}")
+        if total_weight < 1.0:
+            weights /= total_weight
         
-        return prediction
+        # Calculate weighted ensemble probability
+        ensemble_probability = float(probs @ weights)
+        
+        # Calculate confidence
+        # More agreement between models = higher confidence
+        confidence = self._calculate_ensemble_confidence(probs[valid])
+        
+        return ensemble_probability, confidence
     
-    def _predict_random_forest(self, df: pd.DataFrame) -> float:
+    def ensemble_predict_rolling(
+        self,
+        df: pd.DataFrame,
+        symbol: str = "PLTR"
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generate Random Forest prediction.
+        Generate the ensemble prediction as of every row of df in one pass.
+        
+        Produces what ensemble_predict(df.iloc[:i + 1]) would for each row i,
+        for backtests: indicators and features are computed once over the
+        whole frame, the LSTM scores every window in a single batch and the
+        Random Forest scores every row in a single call. Work is linear in
+        len(df): no row re-reads the history before it, and nothing after
+        row i feeds into row i's prediction.
         
         Args:
-            df: DataFrame with historical data
+            df: DataFrame with historical OHLCV data
+            symbol: Stock symbol
             
         Returns:
-            Probability of up movement (0-1)
+            Tuple of (ensemble probabilities, confidences) aligned with df's
+            rows; NaN where no prediction could be made
         """
-        # Calculate features
-        df_features = self.feature_engineer.calculate_technical_indicators(df.copy())
-        features_df = self.feature_engineer.create_ml_features(df_features)
+        logger.info(f"Generating rolling ensemble predictions for {symbol} ({len(df)} rows)")
         
-        # Get latest features (no sequences for RF)
-        X = features_df.iloc[-1:].values
+        components = self._rolling_components(df)
+        probabilities = np.full(len(df), np.nan)
+        confidences = np.full(len(df), np.nan)
         
-        # Scale if scaler available
-        if self.rf_scaler is not None:
-            X = self.rf_scaler.transform(X)
+        for i in range(len(df)):
+            combined = self._combine_row(components, i)
+            if combined is not None:
+                probabilities[i], confidences[i], _ = combined
         
-        # Predict
-        probability = self.rf_model.predict_proba(X)[0, 1]  # Probability of class 1 (UP)
+        logger.info(
+            f"Rolling predictions complete: {int(np.count_nonzero(~np.isnan(probabilities)))} rows"
+        )
         
-        return float(probability)
+        return probabilities, confidences
     
-    def _calculate_momentum_signal(self, df: pd.DataFrame) -> float:
+    def ensemble_predict_many(
+        self,
+        df: pd.DataFrame,
+        indices: Sequence[int],
+        symbol: str = "PLTR"
+    ) -> List[Optional[ModelPrediction]]:
         """
-        Calculate momentum-based signal.
+        Generate ensemble predictions as of several rows of df at once.
         
-        Simple momentum strategy:
-        - Recent price trend
-        - Volume confirmation
-        - RSI levels
+        Equivalent to ensemble_predict(df.iloc[:i + 1]) for each position i
+        in indices, with every component evaluated in one batched pass over
+        df (see ensemble_predict_rolling).
         
         Args:
-            df: DataFrame with historical data
+            df: DataFrame with historical OHLCV data
+            indices: Integer row positions to predict as of
+            symbol: Stock symbol
             
         Returns:
-            Probability of up movement (0-1)
+            List of ModelPrediction aligned with indices (None where no
+            prediction could be made)
         """
-        # Calculate technical indicators
-        df_features = self.feature_engineer.calculate_technical_indicators(df.copy())
-        latest = df_features.iloc[-1]
+        logger.info(f"Generating {len(indices)} ensemble predictions for {symbol}")
+        
+        components = self._rolling_components(df)
+        close = df['close'].to_numpy(dtype=np.float64)
+        timestamps = df.index if isinstance(df.index, pd.DatetimeIndex) else None
+        
+        results: List[Optional[ModelPrediction]] = []
+        for i in indices:
+            combined = self._combine_row(components, i)
+            if combined is None:
+                results.append(None)
+                continue
+            
+            probability, confidence, weights = combined
+            results.append(self._make_prediction(
+                symbol,
+                probability,
+                confidence,
+                weights,
+                float(close[i]),
+                timestamp=timestamps[i].to_pydatetime() if timestamps is not None else None
+            ))
+        
+        return results
+    
+    def _rolling_components(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Every component's up-probability as of each row of df.
         
-        signals = []
+        Args:
+            df: DataFrame with historical OHLCV data
+            
+        Returns:
+            Dict of component name -> probabilities aligned with df's rows
+            (NaN where the component has no prediction); components that
+            failed or are not loaded are left out
+        """
+        components: Dict[str, np.ndarray] = {}
         
-        # 1. Price momentum (20% weight)
-        # Compare current price to moving averages
-        close = latest['close']
-        sma_20 = latest.get('SMA_20', close)
-        sma_50 = latest.get('SMA_50', close)
+        df_features = self.feature_engineer.calculate_technical_indicators(df)
         
-        if close > sma_20 > sma_50:
-            price_signal = 0.8  # Strong uptrend
-        elif close > sma_20:
-            price_signal = 0.65  # Moderate uptrend
-        elif close < sma_20 < sma_50:
-            price_signal = 0.2  # Strong downtrend
-        elif close < sma_20:
-            price_signal = 0.35  # Moderate downtrend
+        if self.lstm_predictor is not None:
+            try:
+                components['lstm'] = self.lstm_predictor.predict_rolling(df, df_features=df_features)
+            except Exception as e:
+                logger.error(f"Rolling LSTM prediction failed: {e}")
         else:
-            price_signal = 0.5  # Neutral
+            logger.warning("LSTM predictor not available")
         
-        signals.append(('price_momentum', price_signal, 0.3))
+        if self.rf_model is not None:
+            try:
+                X, positions, _ = self.feature_engineer.create_feature_rows(df_features)
+                rf_probs = np.full(len(df), np.nan)
+                if len(X):
+                    X = self._scale_rf_features(X)
+                    rf_probs[positions] = self._rf_up_probabilities(X)
+                # An incomplete row predicts from the last complete row before it
+                components['rf'] = pd.Series(rf_probs).ffill().to_numpy()
+            except Exception as e:
+                logger.error(f"Rolling Random Forest prediction failed: {e}")
         
-        # 2. RSI signal (15% weight)
-        rsi = latest.get('RSI', 50)
+        try:
+            components['momentum'] = _momentum_probabilities(_momentum_inputs(df_features))
+        except Exception as e:
+            logger.error(f"Rolling momentum calculation failed: {e}")
         
-        if rsi < 30:
-            rsi_signal = 0.7  # Oversold, likely to bounce
-        elif rsi > 70:
-            rsi_signal = 0.3  # Overbought, likely to drop
-        elif 40 <= rsi <= 60:
-            rsi_signal = 0.5  # Neutral
-        elif rsi < 50:
-            rsi_signal = 0.4  # Slightly bearish
-        else:
-            rsi_signal = 0.6  # Slightly bullish
+        return components
+    
+    def _combine_row(
+        self,
+        components: Dict[str, np.ndarray],
+        i: int
+    ) -> Optional[Tuple[float, float, np.ndarray]]:
+        """
+        Combine the component probabilities of one row.
         
-        signals.append(('rsi', rsi_signal, 0.2))
+        Args:
+            components: Result of _rolling_components
+            i: Row position
+            
+        Returns:
+            Tuple of (ensemble probability, confidence, weights used by
+            slot), or None if no component has a prediction for the row
+        """
+        probs = np.full(3, 0.5)
+        weights = np.zeros(3)
+        valid = np.zeros(3, dtype=bool)
+        component_weights = (self.lstm_weight, self.rf_weight, self.momentum_weight)
+        
+        for slot, name in enumerate(_COMPONENT_NAMES):
+            values = components.get(name)
+            # Momentum is always combined, as in ensemble_predict
+            if values is not None and (slot == _MOMENTUM or not np.isnan(values[i])):
+                probs[slot] = values[i]
+                weights[slot] = component_weights[slot]
+                valid[slot] = True
+        
+        if weights.sum() == 0:
+            return None
+        
+        probability, confidence = self._weighted_probability(probs, weights, valid)
+        return probability, confidence, weights
+    
+    def _predict_random_forest(self, df_features: pd.DataFrame) -> float:
+        """
+        Generate Random Forest prediction.
         
-        # 3. MACD signal (20% weight)
-        macd = latest.get('MACD', 0)
-        macd_signal = latest.get('MACD_signal', 0)
+        Args:
+            df_features: DataFrame with technical indicators
+            
+        Returns:
+            Probability of up movement (0-1)
+        """
+        # Latest complete feature row (no sequences for RF); the last bar
+        # almost always is one, so the full frame is only scanned otherwise
+        X, _, _ = self.feature_engineer.create_feature_rows(df_features.iloc[-1:])
+        if not len(X):
+            X, _, _ = self.feature_engineer.create_feature_rows(df_features)
+            if not len(X):
+                raise ValueError("No complete feature rows")
+            X = X[-1:]
         
-        if macd > macd_signal and macd > 0:
-            macd_prob = 0.75  # Bullish above zero line
-        elif macd > macd_signal:
-            macd_prob = 0.65  # Bullish below zero line
-        elif macd < macd_signal and macd < 0:
-            macd_prob = 0.25  # Bearish below zero line
-        elif macd < macd_signal:
-            macd_prob = 0.35  # Bearish above zero line
-        else:
-            macd_prob = 0.5  # Neutral
+        X = self._scale_rf_features(X)
         
-        signals.append(('macd', macd_prob, 0.25))
+        # Predict
+        probability = self._rf_up_probabilities(X)[0]
         
-        # 4. Volume confirmation (10% weight)
-        volume_ratio = latest.get('volume_ratio', 1.0)
+        return float(probability)
+    
+    def _scale_rf_features(self, X: np.ndarray) -> np.ndarray:
+        """
+        Standardize feature rows as the Random Forest was trained on them.
         
-        if volume_ratio > 1.5:
-            # High volume - amplifies the price signal
-            volume_prob = 0.5 + (price_signal - 0.5) * 1.2  # Amplify
-        elif volume_ratio < 0.7:
-            # Low volume - dampens the signal
-            volume_prob = 0.5 + (price_signal - 0.5) * 0.5  # Dampen
-        else:
-            volume_prob = price_signal  # Normal volume
+        Args:
+            X: Feature rows
+            
+        Returns:
+            Scaled rows (X itself if the model has no scaler)
+        """
+        scaling = self.rf_scaling
+        if scaling is None:
+            return X
+        
+        mean, inv_scale = scaling
+        return (X - mean) * inv_scale
+    
+    @staticmethod
+    def _load_rf_scaling(model_path: Path) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Load the scaling saved next to a Random Forest model.
         
-        volume_prob = np.clip(volume_prob, 0, 1)
-        signals.append(('volume', volume_prob, 0.15))
+        Args:
+            model_path: Path of the Random Forest model
+            
+        Returns:
+            Tuple of (mean, 1 / scale), or None if the model has no scaler
+        """
+        npz_path = model_path.with_suffix('.scaler.npz')
+        if npz_path.exists():
+            with np.load(npz_path) as saved:
+                return saved['mean'], 1.0 / saved['scale']
+        
+        # Models trained before the .npz format pickled the whole StandardScaler
+        legacy_path = model_path.with_suffix('.scaler')
+        if legacy_path.exists():
+            scaler = joblib.load(legacy_path)
+            return scaler.mean_, 1.0 / scaler.scale_
+        
+        return None
+    
+    def _rf_up_probabilities(self, X: np.ndarray) -> np.ndarray:
+        """
+        Random Forest probability of class 1 (UP) for each (scaled) row of X.
         
-        # 5. Recent price change (10% weight)
-        price_change_pct = latest.get('price_change_pct', 0)
+        Runs through the ONNX Runtime tree-ensemble kernel when an exported
+        model was loaded, otherwise through scikit-learn.
         
-        if price_change_pct > 0:
-            change_prob = 0.5 + min(price_change_pct / 10, 0.3)  # Cap at 0.8
-        else:
-            change_prob = 0.5 + max(price_change_pct / 10, -0.3)  # Floor at 0.2
+        Args:
+            X: Feature rows, already scaled
+            
+        Returns:
+            Array of up-probabilities, one per row
+        """
+        if self.rf_session is not None:
+            outputs = self.rf_session.run(
+                [self.rf_session.get_outputs()[1].name],
+                {self.rf_session.get_inputs()[0].name: np.asarray(X, dtype=np.float32)}
+            )
+            return outputs[0][:, 1]
         
-        signals.append(('price_change', change_prob, 0.1))
+        return self.rf_model.predict_proba(X)[:, 1]
+    
+    @staticmethod
+    def _load_rf_session(onnx_path: Path):
+        """
+        Open an exported Random Forest with ONNX Runtime.
         
-        # Calculate weighted average
-        total_weight = sum(w for _, _, w in signals)
-        momentum_probability = sum(p * w for _, p, w in signals) / total_weight
+        Args:
+            onnx_path: Path of the .onnx export
+            
+        Returns:
+            InferenceSession, or None if there is no export or onnxruntime
+            is not installed
+        """
+        if not onnx_path.exists():
+            return None
+        if not ONNXRUNTIME_AVAILABLE:
+            logger.info("onnxruntime not installed, using scikit-learn for Random Forest inference")
+            return None
         
-        # Log signal breakdown
-        for name, prob, weight in signals:
-            logger.debug(f"  Momentum {name}: {prob:.3f} (weight={weight:.2f})")
+        try:
+            session = ort.InferenceSession(str(onnx_path), providers=['CPUExecutionProvider'])
+            logger.info(f"Loaded ONNX Random Forest from: {onnx_path}")
+            return session
+        except Exception as e:
+            logger.warning(f"Could not load ONNX Random Forest ({e}), using scikit-learn")
+            return None
+    
+    @staticmethod
+    def _export_rf_onnx(rf, n_features: int, onnx_path: Path) -> bool:
+        """
+        Export a trained Random Forest to ONNX for faster inference.
+        
+        Args:
+            rf: Fitted classifier
+            n_features: Number of input features
+            onnx_path: Where to write the export
+            
+        Returns:
+            True if the model was exported
+        """
+        # A stale export must never be served in place of the new model
+        onnx_path.unlink(missing_ok=True)
         
-        return float(np.clip(momentum_probability, 0, 1))
+        try:
+            from skl2onnx import convert_sklearn
+            from skl2onnx.common.data_types import FloatTensorType
+        except ImportError:
+            logger.debug("skl2onnx not installed, skipping ONNX export")
+            return False
+        
+        try:
+            onnx_model = convert_sklearn(
+                rf,
+                initial_types=[('X', FloatTensorType([None, n_features]))],
+                options={id(rf): {'zipmap': False}}  # Probabilities as a plain tensor
+            )
+            onnx_path.write_bytes(onnx_model.SerializeToString())
+            logger.info(f"Random Forest exported to ONNX: {onnx_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"ONNX export of Random Forest failed: {e}")
+            return False
     
-    def _calculate_ensemble_confidence(
-        self,
-        predictions: Dict[str, float],
-        weights: Dict[str, float]
-    ) -> float:
+    def _calculate_ensemble_confidence(self, probs: np.ndarray) -> float:
         """
         Calculate ensemble confidence based on agreement between models.
         
@@ -383,34 +1326,19 @@ class EnsemblePredictor:
         - Individual models are uncertain
         
         Args:
-            predictions: Dictionary of model predictions (probabilities)
-            weights: Dictionary of model weights
+            probs: Probabilities of the components that made a prediction
             
         Returns:
             Confidence score (0-1)
         """
-        if not predictions:
+        if not probs.size:
             return 0.0
         
-        probs = list(predictions.values())
-        
-        # 1. Agreement score - how much do models agree?
-        # Standard deviation of probabilities (lower = more agreement)
-        std = np.std(probs)
-        agreement_score = 1.0 - min(std * 2, 1.0)  # Normalize to [0, 1]
-        
-        # 2. Extremity score - how extreme are the predictions?
-        # More extreme (close to 0 or 1) = higher confidence
-        extremity_scores = [abs(p - 0.5) * 2 for p in probs]
-        avg_extremity = np.mean(extremity_scores)
-        
-        # 3. Weighted combination
-        # Agreement is more important than extremity
-        confidence = (agreement_score * 0.6) + (avg_extremity * 0.4)
+        agreement_score, avg_extremity, confidence = _confidence_kernel(probs)
         
         logger.debug(
-            f"Confidence breakdown: agreement={agreement_score:.3f}, "
-            f"extremity={avg_extremity:.3f}, final={confidence:.3f}"
+            "Confidence breakdown: agreement={:.3f}, extremity={:.3f}, final={:.3f}",
+            agreement_score, avg_extremity, confidence
         )
         
         return float(np.clip(confidence, 0, 1))
@@ -422,7 +1350,8 @@ class EnsemblePredictor:
         save_path: str = 'models/random_forest.pkl',
         n_estimators: int = 100,
         max_depth: int = 10,
-        random_state: int = 42
+        random_state: int = 42,
+        backend: str = 'sklearn'
     ) -> Dict[str, float]:
         """
         Train Random Forest model.
@@ -431,14 +1360,21 @@ class EnsemblePredictor:
             df: DataFrame with features and target
             target_column: Name of target column
             save_path: Path to save trained model
-            n_estimators: Number of trees
+            n_estimators: Number of trees (boosting iterations for 'hist')
             max_depth: Maximum tree depth
             random_state: Random seed
+            backend: 'sklearn' (RandomForestClassifier), 'hist'
+                (HistGradientBoostingClassifier: histogram-based, much faster
+                to fit and to score) or 'cuml' (GPU random forest, requires
+                RAPIDS cuML wherever the model is loaded)
             
         Returns:
             Dictionary with training metrics
         """
-        logger.info("Training Random Forest model")
+        if backend not in ('sklearn', 'hist', 'cuml'):
+            raise ValueError(f"Unknown Random Forest backend: {backend}")
+        
+        logger.info(f"Training Random Forest model (backend={backend})")
         
         # Prepare data
         y = df[target_column].values
@@ -458,12 +1394,31 @@ class EnsemblePredictor:
         X_test_scaled = scaler.transform(X_test)
         
         # Train model
-        rf = RandomForestClassifier(
-            n_estimators=n_estimators,
-            max_depth=max_depth,
-            random_state=random_state,
-            n_jobs=-1
-        )
+        if backend == 'hist':
+            from sklearn.ensemble import HistGradientBoostingClassifier
+            rf = HistGradientBoostingClassifier(
+                max_iter=n_estimators,
+                max_depth=max_depth,
+                early_stopping=True,
+                random_state=random_state
+            )
+        elif backend == 'cuml':
+            from cuml.ensemble import RandomForestClassifier as CumlRandomForestClassifier
+            rf = CumlRandomForestClassifier(
+                n_estimators=n_estimators,
+                max_depth=max_depth,
+                random_state=random_state
+            )
+            # cuML works in float32 and returns NumPy output for NumPy input
+            X_train_scaled = X_train_scaled.astype(np.float32)
+            X_test_scaled = X_test_scaled.astype(np.float32)
+        else:
+            rf = RandomForestClassifier(
+                n_estimators=n_estimators,
+                max_depth=max_depth,
+                random_state=random_state,
+                n_jobs=-1
+            )
         
         rf.fit(X_train_scaled, y_train)
         
@@ -484,7 +1439,8 @@ class EnsemblePredictor:
         # Save model
         Path(save_path).parent.mkdir(parents=True, exist_ok=True)
         joblib.dump(rf, save_path)
-        joblib.dump(scaler, Path(save_path).with_suffix('.scaler'))
+        # Scaling as plain arrays: loading it needs neither pickle nor sklearn
+        np.savez(Path(save_path).with_suffix('.scaler.npz'), mean=scaler.mean_, scale=scaler.scale_)
         
         # Save feature names
         import json
@@ -492,6 +1448,7 @@ class EnsemblePredictor:
             'feature_names': feature_names,
             'n_estimators': n_estimators,
             'max_depth': max_depth,
+            'backend': backend,
             'trained_at': datetime.now().isoformat()
         }
         with open(Path(save_path).with_suffix('.json'), 'w') as f:
@@ -499,8 +1456,17 @@ class EnsemblePredictor:
         
         logger.info(f"Random Forest model saved to: {save_path}")
         
+        onnx_path = Path(save_path).with_suffix('.onnx')
+        self._export_rf_onnx(rf, X_train.shape[1], onnx_path)
+        
         self.rf_model = rf
-        self.rf_scaler = scaler
+        self.rf_scaling = (scaler.mean_, 1.0 / scaler.scale_)
+        self.rf_session = self._load_rf_session(onnx_path)
+        
+        # Cached predictions came from the previous model
+        with self._prediction_cache_lock:
+            self._prediction_cache.clear()
+        self._last_components.clear()
         
         return metrics
 
@@ -11,16 +11,74 @@ This module handles:
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Tuple, Dict, Any, Optional
+from typing import TYPE_CHECKING, Tuple, Dict, Any, Optional
 from datetime import datetime
 from loguru import logger
 
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras import layers
-from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau, ModelCheckpoint
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, confusion_matrix
+# TensorFlow is imported by the methods that use it, so importing this module
+# (e.g. for prepare_training_data) doesn't pay TensorFlow's startup cost
+if TYPE_CHECKING:
+    import tensorflow as tf
+    from tensorflow import keras
+
+
+# LSTM settings the fused cuDNN kernel requires; any other value makes Keras
+# fall back to the generic (several times slower) GPU implementation
+_CUDNN_LSTM_CONFIG = {
+    'activation': 'tanh',
+    'recurrent_activation': 'sigmoid',
+    'recurrent_dropout': 0.0,
+    'unroll': False,
+    'use_bias': True,
+}
+
+# mixed_precision option -> Keras mixed precision policy for the hidden layers
+_MIXED_PRECISION_POLICIES = {
+    'none': None,
+    'float16': 'mixed_float16',
+    'bfloat16': 'mixed_bfloat16',
+}
+
+# distribution_strategy options: 'auto' mirrors across GPUs when there is
+# more than one
+_DISTRIBUTION_STRATEGIES = ('auto', 'mirrored', 'none')
+
+
+def _stratified_index_split(
+    y: np.ndarray,
+    test_size: float,
+    seed: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stratified train/test split of sample indices.
+    
+    Only index arrays are shuffled, so the caller gathers each split from
+    the (possibly large) sample tensor exactly once.
+    
+    Args:
+        y: Class labels (n_samples,)
+        test_size: Fraction of each class to put in the test split
+        seed: Random seed for reproducibility
+        
+    Returns:
+        Tuple of (train_indices, test_indices), each in shuffled order
+    """
+    rng = np.random.default_rng(seed)
+    
+    train_parts, test_parts = [], []
+    for label in np.unique(y):
+        idx = np.flatnonzero(y == label)
+        rng.shuffle(idx)
+        n_test = int(len(idx) * test_size)
+        test_parts.append(idx[:n_test])
+        train_parts.append(idx[n_test:])
+    
+    train_idx = np.concatenate(train_parts)
+    test_idx = np.concatenate(test_parts)
+    rng.shuffle(train_idx)
+    rng.shuffle(test_idx)
+    
+    return train_idx, test_idx
 
 
 class LSTMModelTrainer:
@@ -36,7 +94,12 @@ class LSTMModelTrainer:
         batch_size: int = 32,
         epochs: int = 100,
         validation_split: float = 0.2,
-        random_state: int = 42
+        random_state: int = 42,
+        mixed_precision: str = 'none',
+        checkpoint_path: Optional[str] = 'models/best_model.weights.h5',
+        weight_decay: float = 1e-5,
+        jit_compile: bool = True,
+        distribution_strategy: str = 'auto'
     ):
         """
         Initialize the LSTM model trainer.
@@ -46,12 +109,41 @@ class LSTMModelTrainer:
             lstm_units_1: Number of units in first LSTM layer
             lstm_units_2: Number of units in second LSTM layer
             dropout_rate: Dropout rate for regularization
-            learning_rate: Learning rate for Adam optimizer
+            learning_rate: Initial learning rate for the AdamW optimizer
             batch_size: Batch size for training
             epochs: Maximum number of training epochs
             validation_split: Fraction of data to use for validation
             random_state: Random seed for reproducibility
+            mixed_precision: 'none' (default), or 'float16' / 'bfloat16' to
+                compute the LSTM layers in reduced precision on GPUs with
+                tensor cores (float16 needs Volta+, bfloat16 Ampere+); the
+                output layer stays float32
+            checkpoint_path: Where to checkpoint the best weights during
+                training (must end in .weights.h5, e.g. point it at /dev/shm
+                for faster writes); None disables the checkpoint
+            weight_decay: Decoupled weight decay for the AdamW optimizer
+            jit_compile: Compile the train step with XLA on CPU-only
+                hosts, fusing the LSTM cell, loss and gradient ops into
+                fewer kernels. Ignored when a GPU is visible: Keras can't
+                XLA-compile the fused cuDNN LSTM kernel, which is the
+                faster of the two there
+            distribution_strategy: 'auto' (default: MirroredStrategy when
+                more than one GPU is visible, otherwise a single device),
+                'mirrored' or 'none'.
+                With N replicas the global batch size and learning rate are
+                scaled by N
         """
+        if mixed_precision not in _MIXED_PRECISION_POLICIES:
+            raise ValueError(
+                f"Unsupported mixed_precision: {mixed_precision} "
+                f"(expected one of {sorted(_MIXED_PRECISION_POLICIES)})"
+            )
+        if distribution_strategy not in _DISTRIBUTION_STRATEGIES:
+            raise ValueError(
+                f"Unsupported distribution_strategy: {distribution_strategy} "
+                f"(expected one of {list(_DISTRIBUTION_STRATEGIES)})"
+            )
+        
         self.sequence_length = sequence_length
         self.lstm_units_1 = lstm_units_1
         self.lstm_units_2 = lstm_units_2
@@ -61,10 +153,19 @@ class LSTMModelTrainer:
         self.epochs = epochs
         self.validation_split = validation_split
         self.random_state = random_state
-        
-        self.model: Optional[keras.Model] = None
-        self.history: Optional[keras.callbacks.History] = None
+        self.mixed_precision = mixed_precision
+        self.checkpoint_path = checkpoint_path
+        self.weight_decay = weight_decay
+        self.jit_compile = jit_compile
+        self.distribution_strategy = distribution_strategy
+        
+        self.model: Optional['keras.Model'] = None
+        self.history: Optional['keras.callbacks.History'] = None
         self.feature_names: Optional[list] = None
+        self._predict_fn: Optional[Tuple[Tuple[int, int], 'tf.types.experimental.ConcreteFunction']] = None
+        self._lr_scheduled = False
+        
+        import tensorflow as tf
         
         # Set random seeds for reproducibility
         np.random.seed(random_state)
@@ -74,8 +175,21 @@ class LSTMModelTrainer:
             f"Initialized LSTMModelTrainer: seq_len={sequence_length}, "
             f"lstm=[{lstm_units_1},{lstm_units_2}], dropout={dropout_rate}"
         )
+        
+        policy = _MIXED_PRECISION_POLICIES[mixed_precision]
+        if policy is not None:
+            gpus = tf.config.list_physical_devices('GPU')
+            logger.info(
+                f"Training with {policy} policy "
+                f"({len(gpus)} GPU(s) visible{'' if gpus else ', no tensor core speedup on CPU'})"
+            )
     
-    def build_lstm_model(self, input_shape: Tuple[int, int]) -> keras.Model:
+    def build_lstm_model(
+        self,
+        input_shape: Tuple[int, int],
+        steps_per_epoch: Optional[int] = None,
+        replicas: int = 1
+    ) -> 'keras.Model':
         """
         Build LSTM neural network architecture.
         
@@ -86,53 +200,175 @@ class LSTMModelTrainer:
         - Dropout: 0.2
         - Dense: 1 unit with sigmoid activation (binary classification)
         
+        Both LSTM layers are configured for the fused cuDNN kernel; dropout
+        stays in separate layers between them, outside the recurrent step.
+        
+        With steps_per_epoch the learning rate follows a cosine decay over
+        all epochs, computed inside the training step. Without it (model
+        built before the training set size is known) the rate is constant
+        and train_model reduces it on plateaus instead.
+        
         Args:
             input_shape: Shape of input data (sequence_length, n_features)
+            steps_per_epoch: Training batches per epoch (optional)
+            replicas: Data-parallel replicas the model trains on; the
+                learning rate is scaled by it (linear scaling rule)
             
         Returns:
             Compiled Keras model
         """
+        from tensorflow import keras
+        from tensorflow.keras import layers
+        
         logger.info(f"Building LSTM model with input shape: {input_shape}")
         
+        # Hidden layers take the mixed precision policy (None = float32)
+        policy = _MIXED_PRECISION_POLICIES[self.mixed_precision]
+        
         model = keras.Sequential([
             # First LSTM layer - captures long-term dependencies
             layers.LSTM(
                 self.lstm_units_1,
                 return_sequences=True,
                 input_shape=input_shape,
-                name='lstm_1'
+                name='lstm_1',
+                dtype=policy,
+                **_CUDNN_LSTM_CONFIG
             ),
-            layers.Dropout(self.dropout_rate, name='dropout_1'),
+            layers.Dropout(self.dropout_rate, name='dropout_1', dtype=policy),
             
             # Second LSTM layer - refines patterns
             layers.LSTM(
                 self.lstm_units_2,
                 return_sequences=False,
-                name='lstm_2'
+                name='lstm_2',
+                dtype=policy,
+                **_CUDNN_LSTM_CONFIG
             ),
-            layers.Dropout(self.dropout_rate, name='dropout_2'),
+            layers.Dropout(self.dropout_rate, name='dropout_2', dtype=policy),
             
-            # Output layer - binary classification (up/down)
-            layers.Dense(1, activation='sigmoid', name='output')
+            # Output layer - binary classification (up/down); kept float32 so
+            # the sigmoid and cross-entropy are numerically stable
+            layers.Dense(1, activation='sigmoid', name='output', dtype='float32')
         ])
         
-        # Compile model
+        learning_rate = self.learning_rate * replicas
+        if steps_per_epoch:
+            learning_rate = keras.optimizers.schedules.CosineDecay(
+                initial_learning_rate=learning_rate,
+                decay_steps=self.epochs * steps_per_epoch
+            )
+        
+        optimizer = keras.optimizers.AdamW(
+            learning_rate=learning_rate,
+            weight_decay=self.weight_decay
+        )
+        if policy == 'mixed_float16':
+            # float16 gradients underflow without loss scaling
+            optimizer = keras.mixed_precision.LossScaleOptimizer(optimizer)
+        
+        self._compile_model(model, optimizer, self._use_xla())
+        self._check_cudnn_compatible(model)
+        
+        logger.info("Model architecture:")
+        model.summary(print_fn=logger.info)
+        
+        self.model = model
+        self._predict_fn = None
+        self._lr_scheduled = bool(steps_per_epoch)
+        return model
+    
+    def _resolve_distribution(self) -> Tuple['tf.distribute.Strategy', int]:
+        """
+        Pick the distribution strategy to build and train the model under.
+        
+        Returns:
+            Tuple of (strategy, number of data-parallel replicas)
+        """
+        import tensorflow as tf
+        
+        if self.distribution_strategy == 'mirrored' or (
+            self.distribution_strategy == 'auto'
+            and len(tf.config.list_physical_devices('GPU')) > 1
+        ):
+            strategy = tf.distribute.MirroredStrategy()
+            return strategy, strategy.num_replicas_in_sync
+        
+        return tf.distribute.get_strategy(), 1
+    
+    def _use_xla(self) -> bool:
+        """
+        Whether to compile the train step with XLA.
+        
+        Returns:
+            True if jit_compile is set and no GPU is visible
+        """
+        import tensorflow as tf
+        
+        if not self.jit_compile:
+            return False
+        if tf.config.list_physical_devices('GPU'):
+            # The cuDNN LSTM layers don't support XLA; Keras would silently
+            # drop jit_compile anyway
+            logger.info("GPU visible, training with the cuDNN LSTM kernel instead of XLA")
+            return False
+        return True
+    
+    @staticmethod
+    def _compile_model(model: 'keras.Model', optimizer, jit_compile: bool):
+        """
+        Compile the model with the training loss and metrics.
+        
+        Args:
+            model: Model to compile
+            optimizer: Optimizer to train with
+            jit_compile: Compile the train step with XLA
+        """
+        from tensorflow import keras
+        
         model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=self.learning_rate),
+            optimizer=optimizer,
             loss='binary_crossentropy',
             metrics=[
                 'accuracy',
                 keras.metrics.Precision(name='precision'),
                 keras.metrics.Recall(name='recall'),
                 keras.metrics.AUC(name='auc')
-            ]
+            ],
+            jit_compile=jit_compile
         )
+    
+    @staticmethod
+    def _check_cudnn_compatible(model: 'keras.Model') -> bool:
+        """
+        Warn about LSTM layers that cannot use the fused cuDNN kernel.
         
-        logger.info("Model architecture:")
-        model.summary(print_fn=logger.info)
+        Args:
+            model: Built model
+            
+        Returns:
+            True if every LSTM layer is cuDNN-compatible
+        """
+        from tensorflow.keras import layers
         
-        self.model = model
-        return model
+        compatible = True
+        for layer in model.layers:
+            if not isinstance(layer, layers.LSTM):
+                continue
+            
+            config = layer.get_config()
+            mismatched = {
+                key: config.get(key)
+                for key, required in _CUDNN_LSTM_CONFIG.items()
+                if config.get(key) != required
+            }
+            if mismatched:
+                compatible = False
+                logger.warning(
+                    f"LSTM layer {layer.name} will not use the cuDNN kernel: {mismatched}"
+                )
+        
+        return compatible
     
     def train_model(
         self,
@@ -157,30 +393,58 @@ class LSTMModelTrainer:
         Returns:
             Dictionary with training history and metrics
         """
-        if self.model is None:
-            # Auto-build model from input shape
-            input_shape = (X_train.shape[1], X_train.shape[2])
-            self.build_lstm_model(input_shape)
+        from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau, ModelCheckpoint
         
         self.feature_names = feature_names
         
+        # Make sure the inputs are contiguous float32 - anything else is cast
+        # by TensorFlow on the way to the device at twice the bandwidth
+        if X_train.dtype == np.float64 or (X_val is not None and X_val.dtype == np.float64):
+            logger.warning(
+                "Training features arrived as float64, casting to float32 "
+                "(use prepare_training_data or cast upstream to avoid the copy)"
+            )
+        X_train = np.ascontiguousarray(X_train, dtype=np.float32)
+        y_train = np.ascontiguousarray(y_train, dtype=np.float32)
+        if X_val is not None and y_val is not None:
+            X_val = np.ascontiguousarray(X_val, dtype=np.float32)
+            y_val = np.ascontiguousarray(y_val, dtype=np.float32)
+        
         # Split validation set if not provided
         if X_val is None or y_val is None:
-            X_train, X_val, y_train, y_val = train_test_split(
-                X_train, y_train,
-                test_size=self.validation_split,
-                random_state=self.random_state,
-                stratify=y_train  # Maintain class balance
+            train_idx, val_idx = _stratified_index_split(
+                y_train, self.validation_split, self.random_state
             )
+            X_train, X_val = X_train[train_idx], X_train[val_idx]
+            y_train, y_val = y_train[train_idx], y_train[val_idx]
             logger.info(
                 f"Split data: train={len(X_train)}, val={len(X_val)}, "
                 f"stratified by class"
             )
         
+        replicas = 1
+        batch_size = self.batch_size
+        if self.model is None:
+            # In-process replicas (MirroredStrategy) only apply to models
+            # built here, under the strategy's scope
+            strategy, replicas = self._resolve_distribution()
+            batch_size = self.batch_size * replicas
+            steps_per_epoch = -(-len(X_train) // (self.batch_size * replicas))
+            
+            # Auto-build model from input shape, decaying the learning rate
+            # over the epochs of this training set
+            input_shape = (X_train.shape[1], X_train.shape[2])
+            with strategy.scope():
+                self.build_lstm_model(
+                    input_shape, steps_per_epoch=steps_per_epoch, replicas=replicas
+                )
+        elif self.distribution_strategy != 'none':
+            logger.debug("Model built before training, keeping the strategy it was built under")
+        
         logger.info(
             f"Training LSTM model: train_samples={len(X_train)}, "
             f"val_samples={len(X_val)}, epochs={self.epochs}, "
-            f"batch_size={self.batch_size}"
+            f"batch_size={batch_size}, replicas={replicas}"
         )
         
         # Callbacks
@@ -191,34 +455,48 @@ class LSTMModelTrainer:
                 patience=10,
                 restore_best_weights=True,
                 verbose=1
-            ),
-            
-            # Reduce learning rate on plateau
-            ReduceLROnPlateau(
-                monitor='val_loss',
-                factor=0.5,
-                patience=5,
-                min_lr=1e-7,
-                verbose=1
-            ),
-            
-            # Save best model
-            ModelCheckpoint(
-                'models/best_model.h5',
-                monitor='val_loss',
-                save_best_only=True,
-                verbose=0
             )
         ]
         
+        # Reduce learning rate on plateau, unless it already follows a schedule
+        if not self._lr_scheduled:
+            callbacks.append(
+                ReduceLROnPlateau(
+                    monitor='val_loss',
+                    factor=0.5,
+                    patience=5,
+                    min_lr=1e-7,
+                    verbose=1
+                )
+            )
+        
+        # Checkpoint best weights (weights only - much cheaper than rewriting
+        # the full model on every val_loss improvement)
+        if self.checkpoint_path:
+            Path(self.checkpoint_path).parent.mkdir(parents=True, exist_ok=True)
+            callbacks.append(
+                ModelCheckpoint(
+                    self.checkpoint_path,
+                    monitor='val_loss',
+                    save_best_only=True,
+                    save_weights_only=True,
+                    save_freq='epoch',
+                    verbose=0
+                )
+            )
+        
         # Train model
         start_time = datetime.now()
         
+        train_data = self._make_dataset(
+            X_train, y_train, shuffle=True, batch_size=batch_size
+        )
+        val_data = self._make_dataset(X_val, y_val, shuffle=False, batch_size=batch_size)
+        
         self.history = self.model.fit(
-            X_train, y_train,
-            validation_data=(X_val, y_val),
+            train_data,
+            validation_data=val_data,
             epochs=self.epochs,
-            batch_size=self.batch_size,
             callbacks=callbacks,
             verbose=verbose
         )
@@ -245,6 +523,84 @@ class LSTMModelTrainer:
         
         return training_summary
     
+    def _make_dataset(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        shuffle: bool,
+        batch_size: Optional[int] = None
+    ) -> 'tf.data.Dataset':
+        """
+        Batched input pipeline over in-memory training arrays.
+        
+        The arrays are converted to tensors once. Shuffling permutes row
+        indices (reshuffled every epoch) and each batch is gathered from
+        them, so no second copy of the samples is held in a shuffle
+        buffer. Prefetching prepares the next batch while the current
+        step runs.
+        
+        Args:
+            X: Features (n_samples, sequence_length, n_features)
+            y: Labels (n_samples,)
+            shuffle: Shuffle the samples (training) or keep their order
+            batch_size: Batch size (defaults to the trainer's batch_size)
+            
+        Returns:
+            Dataset of (features, labels) batches
+        """
+        import tensorflow as tf
+        
+        features = tf.constant(X, dtype=tf.float32)
+        labels = tf.constant(y, dtype=tf.float32)
+        
+        indices = tf.data.Dataset.range(len(X))
+        if shuffle:
+            indices = indices.shuffle(
+                len(X), seed=self.random_state, reshuffle_each_iteration=True
+            )
+        
+        return (
+            indices
+            .batch(batch_size or self.batch_size)
+            .map(
+                lambda batch: (tf.gather(features, batch), tf.gather(labels, batch)),
+                num_parallel_calls=tf.data.AUTOTUNE
+            )
+            .prefetch(tf.data.AUTOTUNE)
+        )
+    
+    def _get_predict_fn(self, shape: Tuple[int, int]):
+        """
+        Model forward pass traced once for any batch size.
+        
+        model.predict builds a new input pipeline and re-enters tracing on
+        every call, which dominates for the small arrays evaluated here
+        (and adds up across hyperparameter sweeps). The concrete function
+        is kept until the model or the input shape changes.
+        
+        Args:
+            shape: Input shape without the batch axis (sequence_length, n_features)
+            
+        Returns:
+            Concrete function mapping a float32 (batch, *shape) tensor to
+            the model's output
+        """
+        shape = tuple(shape)
+        if self._predict_fn is not None and self._predict_fn[0] == shape:
+            return self._predict_fn[1]
+        
+        import tensorflow as tf
+        
+        model = self.model
+        
+        @tf.function(input_signature=[tf.TensorSpec((None, *shape), tf.float32)])
+        def forward(x):
+            return model(x, training=False)
+        
+        fn = forward.get_concrete_function()
+        self._predict_fn = (shape, fn)
+        return fn
+    
     def evaluate_model(
         self,
         X: np.ndarray,
@@ -267,26 +623,33 @@ class LSTMModelTrainer:
         
         logger.info(f"Evaluating model on {len(X)} samples")
         
+        import tensorflow as tf
+        
         # Get predictions
-        y_pred_proba = self.model.predict(X, verbose=0).flatten()
+        predict_fn = self._get_predict_fn(X.shape[1:])
+        y_pred_proba = predict_fn(tf.constant(X, dtype=tf.float32)).numpy().flatten()
         y_pred = (y_pred_proba >= threshold).astype(int)
         
-        # Calculate metrics
-        accuracy = accuracy_score(y, y_pred)
-        precision = precision_score(y, y_pred, zero_division=0)
-        recall = recall_score(y, y_pred, zero_division=0)
-        f1 = f1_score(y, y_pred, zero_division=0)
-        
-        # Confusion matrix
-        cm = confusion_matrix(y, y_pred)
-        tn, fp, fn, tp = cm.ravel() if cm.size == 4 else (0, 0, 0, 0)
+        # Confusion matrix counts, from the actual up/down masks
+        up_mask = y == 1
+        down_mask = y == 0
+        n_up = int(np.count_nonzero(up_mask))
+        n_down = int(np.count_nonzero(down_mask))
+        tp = int(np.count_nonzero(y_pred[up_mask] == 1))
+        fn = n_up - tp
+        tn = int(np.count_nonzero(y_pred[down_mask] == 0))
+        fp = n_down - tn
+        
+        # Calculate metrics (0 where undefined, as sklearn's zero_division=0)
+        accuracy = (tp + tn) / len(y)
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = 2 * tp / (2 * tp + fp + fn) if tp else 0.0
         
         # Directional accuracy (most important for trading)
         # What percentage of up/down predictions were correct
-        up_mask = y == 1
-        down_mask = y == 0
-        up_accuracy = accuracy_score(y[up_mask], y_pred[up_mask]) if up_mask.sum() > 0 else 0.0
-        down_accuracy = accuracy_score(y[down_mask], y_pred[down_mask]) if down_mask.sum() > 0 else 0.0
+        up_accuracy = tp / n_up if n_up else 0.0
+        down_accuracy = tn / n_down if n_down else 0.0
         
         metrics = {
             'accuracy': float(accuracy),
@@ -316,7 +679,7 @@ class LSTMModelTrainer:
         Save trained model to disk.
         
         Args:
-            filepath: Path to save model file (.h5 or .keras)
+            filepath: Path to save model file (.keras recommended; .h5 is legacy)
         """
         if self.model is None:
             raise ValueError("No model to save. Train a model first.")
@@ -345,7 +708,7 @@ class LSTMModelTrainer:
             json.dump(metadata, f, indent=2)
         logger.info(f"Model metadata saved to: {metadata_path}")
     
-    def load_model(self, filepath: str) -> keras.Model:
+    def load_model(self, filepath: str) -> 'keras.Model':
         """
         Load trained model from disk.
         
@@ -355,10 +718,21 @@ class LSTMModelTrainer:
         Returns:
             Loaded Keras model
         """
+        from tensorflow import keras
+        
         logger.info(f"Loading model from: {filepath}")
         
         # Load model
         self.model = keras.models.load_model(filepath)
+        self._predict_fn = None
+        
+        # A schedule can't be reduced on plateau; Keras keeps it on
+        # _learning_rate (learning_rate only reports its current value)
+        optimizer = getattr(self.model.optimizer, 'inner_optimizer', self.model.optimizer)
+        self._lr_scheduled = isinstance(
+            getattr(optimizer, '_learning_rate', None),
+            keras.optimizers.schedules.LearningRateSchedule
+        )
         
         # Load metadata if available
         metadata_path = Path(filepath).with_suffix('.json')
@@ -414,31 +788,34 @@ def prepare_training_data(
     y = df[target_column].values
     X = df.drop(columns=[target_column])
     feature_names = X.columns.tolist()
-    X = X.values
     
-    # Create sequences
-    X_sequences = []
-    y_sequences = []
+    # The model trains in float32; casting here (rather than per batch in the
+    # input pipeline) also halves the memory of the windows gathered below
+    X = np.ascontiguousarray(X.values, dtype=np.float32)
+    y = np.ascontiguousarray(y, dtype=np.float32)
     
-    for i in range(sequence_length, len(X)):
-        X_sequences.append(X[i-sequence_length:i])
-        y_sequences.append(y[i])
+    if len(X) <= sequence_length:
+        raise ValueError(
+            f"Not enough rows ({len(X)}) for sequence length {sequence_length}"
+        )
     
-    X_sequences = np.array(X_sequences)
-    y_sequences = np.array(y_sequences)
+    # Each window of sequence_length rows is labelled with the row after it.
+    # Windows are identified by their start row and only materialized once
+    # per split, gathered straight from X
+    y_sequences = y[sequence_length:]
+    starts = np.arange(len(y_sequences))
+    offsets = np.arange(sequence_length)
     
     logger.info(
-        f"Created {len(X_sequences)} sequences of length {sequence_length}, "
+        f"Created {len(starts)} sequences of length {sequence_length}, "
         f"with {len(feature_names)} features"
     )
     
-    # Train/test split
-    X_train, X_test, y_train, y_test = train_test_split(
-        X_sequences, y_sequences,
-        test_size=test_size,
-        random_state=random_state,
-        stratify=y_sequences  # Maintain class balance
-    )
+    # Train/test split (stratified to maintain class balance)
+    train_starts, test_starts = _stratified_index_split(y_sequences, test_size, random_state)
+    X_train = X[train_starts[:, None] + offsets]  # (n_train, sequence_length, n_features)
+    X_test = X[test_starts[:, None] + offsets]
+    y_train, y_test = y_sequences[train_starts], y_sequences[test_starts]
     
     logger.info(
         f"Split into train={len(X_train)}, test={len(X_test)}, "
@@ -517,12 +894,12 @@ if __name__ == "__main__":
     
     # Save model
     print("\nSaving model...")
-    trainer.save_model("models/demo_lstm_model.h5")
+    trainer.save_model("models/demo_lstm_model.keras")
     
     # Load model
     print("\nLoading model...")
     trainer_new = LSTMModelTrainer()
-    trainer_new.load_model("models/demo_lstm_model.h5")
+    trainer_new.load_model("models/demo_lstm_model.keras")
     
     # Make predictions
     print("\nMaking predictions on test data...")
@@ -8,19 +8,96 @@ This module handles:
 - Feature importance analysis
 """
 
+import os
+import threading
+
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, Optional, Tuple, List
 from pathlib import Path
 from datetime import datetime
 from loguru import logger
 
+import tensorflow as tf
 from tensorflow import keras
 from src.bot_types.trading_types import ModelPrediction
 from src.data.feature_engineer import FeatureEngineer
 from src.common.decorators import handle_ml_error
 
 
+def _configure_gpus() -> List[str]:
+    """
+    Enable memory growth on visible GPUs so TensorFlow doesn't reserve all
+    device memory up front.
+    
+    Returns:
+        List of visible GPU device names (empty on CPU-only hosts)
+    """
+    gpus = tf.config.list_physical_devices('GPU')
+    for gpu in gpus:
+        try:
+            tf.config.experimental.set_memory_growth(gpu, True)
+        except RuntimeError:
+            # Already initialized; memory growth can only be set before first use
+            pass
+    return [gpu.name for gpu in gpus]
+
+
+# Inference dtype -> (Keras mixed precision policy, numpy dtype fed to predict).
+# numpy has no bfloat16, so bf16 models take float32 input and cast on device.
+_INFERENCE_DTYPES = {
+    'float32': (None, np.float32),
+    'float16': ('mixed_float16', np.float16),
+    'bfloat16': ('mixed_bfloat16', np.float32),
+}
+
+
+def _with_precision_policy(model: keras.Model, policy: str) -> keras.Model:
+    """
+    Rebuild a loaded model so its layers compute under a mixed precision policy.
+    
+    Args:
+        model: Loaded float32 model
+        policy: Keras mixed precision policy name (e.g. 'mixed_float16')
+        
+    Returns:
+        Clone of model with the same weights, computing in reduced precision
+    """
+    def clone_layer(layer):
+        config = layer.get_config()
+        if not isinstance(layer, keras.layers.InputLayer):
+            config['dtype'] = policy
+        return layer.__class__.from_config(config)
+    
+    reduced = keras.models.clone_model(model, clone_function=clone_layer)
+    reduced.set_weights(model.get_weights())
+    return reduced
+
+
+def _export_tflite(model: keras.Model, tflite_path: Path) -> bool:
+    """
+    Convert a model to TensorFlow Lite with float16 weights.
+    
+    Args:
+        model: Loaded float32 model
+        tflite_path: Destination .tflite file
+        
+    Returns:
+        True if the model was converted and written
+    """
+    try:
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+        tflite_path.write_bytes(converter.convert())
+        logger.info(f"Exported TFLite model: {tflite_path}")
+        return True
+    except Exception as e:
+        logger.warning(f"Could not export TFLite model: {e}")
+        return False
+
+
 class LSTMPredictor:
     """Generate predictions using trained LSTM models."""
     
@@ -28,7 +105,9 @@ class LSTMPredictor:
         self,
         model_path: str,
         sequence_length: int = 60,
-        confidence_threshold: float = 0.70
+        confidence_threshold: float = 0.70,
+        inference_dtype: str = "float32",
+        use_tflite: bool = False
     ):
         """
         Initialize the LSTM predictor.
@@ -37,21 +116,41 @@ class LSTMPredictor:
             model_path: Path to trained model file (.h5 or .keras)
             sequence_length: Number of time steps in input sequence
             confidence_threshold: Minimum confidence for valid prediction
+            inference_dtype: 'float32' (default, reproducible), or 'float16' /
+                'bfloat16' to run inference in reduced precision on hardware
+                that supports it (probabilities differ slightly from float32)
+            use_tflite: Serve single-sequence predictions from a TensorFlow
+                Lite copy of the model with float16 weights, saved next to
+                model_path (CPU inference; probabilities differ slightly)
         """
+        if inference_dtype not in _INFERENCE_DTYPES:
+            raise ValueError(
+                f"Unsupported inference_dtype: {inference_dtype} "
+                f"(expected one of {sorted(_INFERENCE_DTYPES)})"
+            )
+        if use_tflite and inference_dtype != "float32":
+            raise ValueError("use_tflite already reduces precision; keep inference_dtype='float32'")
+        
         self.model_path = model_path
         self.sequence_length = sequence_length
         self.confidence_threshold = confidence_threshold
+        self.inference_dtype = inference_dtype
+        self.use_tflite = use_tflite
         
         self.model: Optional[keras.Model] = None
         self.feature_engineer: Optional[FeatureEngineer] = None
         self.feature_names: Optional[List[str]] = None
+        self._predict_fn: Optional[Tuple[int, tf.types.experimental.ConcreteFunction]] = None
+        self._tflite: Optional[tf.lite.Interpreter] = None
+        self._tflite_lock = threading.Lock()  # an interpreter is not thread-safe
         
         # Load model
         self._load_model()
         
         logger.info(
             f"Initialized LSTMPredictor: model={model_path}, "
-            f"seq_len={sequence_length}, threshold={confidence_threshold}"
+            f"seq_len={sequence_length}, threshold={confidence_threshold}, "
+            f"dtype={inference_dtype}"
         )
     
     @handle_ml_error()
@@ -61,7 +160,20 @@ class LSTMPredictor:
             raise FileNotFoundError(f"Model file not found: {self.model_path}")
         
         logger.info(f"Loading model from: {self.model_path}")
-        self.model = keras.models.load_model(self.model_path)
+        
+        # Pin the model to a single device so inference never copies weights
+        device = '/GPU:0' if _configure_gpus() else '/CPU:0'
+        with tf.device(device):
+            self.model = keras.models.load_model(self.model_path)
+            
+            policy, _ = _INFERENCE_DTYPES[self.inference_dtype]
+            if policy is not None:
+                self.model = _with_precision_policy(self.model, policy)
+                logger.info(f"Running inference with {policy} policy")
+        
+        # Trace the predict graph now rather than on the first trading cycle
+        if hasattr(self.model, 'make_predict_function'):
+            self.model.make_predict_function()
         
         # Load metadata if available
         metadata_path = Path(self.model_path).with_suffix('.json')
@@ -74,13 +186,69 @@ class LSTMPredictor:
             self.feature_names = metadata.get('feature_names')
             logger.info(f"Loaded model metadata: trained_at={metadata.get('trained_at')}")
         
+        # Trace the rolling-prediction function for the model's input width
+        self._get_predict_fn(self.model.input_shape[-1])
+        
+        if self.use_tflite:
+            self._tflite = self._load_tflite()
+        
         logger.info("Model loaded successfully")
     
+    def _load_tflite(self) -> Optional[tf.lite.Interpreter]:
+        """
+        Load the TensorFlow Lite copy of the model, exporting it if missing or stale.
+        
+        Returns:
+            Interpreter sized for one input sequence, or None to keep using
+            the Keras model
+        """
+        tflite_path = Path(self.model_path).with_suffix('.tflite')
+        if (
+            not tflite_path.exists()
+            or tflite_path.stat().st_mtime < Path(self.model_path).stat().st_mtime
+        ):
+            if not _export_tflite(self.model, tflite_path):
+                return None
+        
+        try:
+            interpreter = tf.lite.Interpreter(
+                model_path=str(tflite_path), num_threads=os.cpu_count()
+            )
+            input_index = interpreter.get_input_details()[0]['index']
+            interpreter.resize_tensor_input(
+                input_index, [1, self.sequence_length, self.model.input_shape[-1]]
+            )
+            interpreter.allocate_tensors()
+            logger.info(f"Serving LSTM predictions from TFLite model: {tflite_path}")
+            return interpreter
+        except Exception as e:
+            logger.warning(f"Could not load TFLite model, using Keras: {e}")
+            return None
+    
+    def _predict_tflite(self, sequence: np.ndarray) -> float:
+        """
+        Run one input sequence through the TFLite interpreter.
+        
+        Args:
+            sequence: Model input with shape (1, seq_len, n_features)
+            
+        Returns:
+            Model output probability of an up move
+        """
+        with self._tflite_lock:
+            self._tflite.set_tensor(
+                self._tflite.get_input_details()[0]['index'],
+                sequence.astype(np.float32)
+            )
+            self._tflite.invoke()
+            return float(self._tflite.get_tensor(self._tflite.get_output_details()[0]['index'])[0][0])
+    
     @handle_ml_error()
     def predict_next_day(
         self,
         df: pd.DataFrame,
-        symbol: str = "PLTR"
+        symbol: str = "PLTR",
+        df_features: Optional[pd.DataFrame] = None
     ) -> Optional[ModelPrediction]:
         """
         Predict next day price direction.
@@ -88,37 +256,260 @@ class LSTMPredictor:
         Args:
             df: DataFrame with historical OHLCV data (must have at least sequence_length rows)
             symbol: Stock symbol
+            df_features: Technical indicators already calculated for df
+                (calculated here if not given)
             
         Returns:
             ModelPrediction with direction, confidence, and probability, or None if prediction fails
         """
-        if len(df) < self.sequence_length:
-            raise ValueError(
-                f"Insufficient data: need {self.sequence_length} rows, got {len(df)}"
-            )
-        
         logger.info(f"Predicting next day direction for {symbol}")
         
+        sequence, feature_names = self._prepare_sequence(df, df_features)
+        
+        # Make prediction
+        if self._tflite is not None:
+            probability = self._predict_tflite(sequence)
+        else:
+            probability = float(self.model.predict(sequence, verbose=0)[0][0])
+        
+        return self._build_prediction(symbol, probability, df, feature_names)
+    
+    @handle_ml_error()
+    def predict_next_day_many(
+        self,
+        data: Dict[str, pd.DataFrame],
+        features: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> Dict[str, ModelPrediction]:
+        """
+        Predict next day price direction for several symbols in one forward pass.
+        
+        Each symbol's input sequence is stacked along the batch axis so the
+        model runs once for all symbols instead of once per symbol.
+        
+        Args:
+            data: Dict of symbol -> DataFrame with historical OHLCV data
+            features: Dict of symbol -> technical indicators already
+                calculated for that symbol's data (optional)
+            
+        Returns:
+            Dict of symbol -> ModelPrediction (symbols whose input could not
+            be prepared are omitted)
+        """
+        features = features or {}
+        symbols = []
+        sequences = []
+        feature_names = {}
+        
+        for symbol, df in data.items():
+            try:
+                sequence, names = self._prepare_sequence(df, features.get(symbol))
+            except Exception as e:
+                logger.error(f"Could not prepare LSTM input for {symbol}: {e}")
+                continue
+            symbols.append(symbol)
+            sequences.append(sequence)
+            feature_names[symbol] = names
+        
+        if not sequences:
+            return {}
+        
+        logger.info(f"Predicting next day direction for {len(symbols)} symbols")
+        
+        batch = np.concatenate(sequences, axis=0)  # (n_symbols, seq_len, n_features)
+        probabilities = self.model.predict(batch, batch_size=len(batch), verbose=0)[:, 0]
+        
+        return {
+            symbol: self._build_prediction(
+                symbol, float(probability), data[symbol], feature_names[symbol]
+            )
+            for symbol, probability in zip(symbols, probabilities)
+        }
+    
+    def _feature_rows(
+        self,
+        df: pd.DataFrame,
+        df_features: Optional[pd.DataFrame] = None
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Compute model input features for every complete row of df.
+        
+        Args:
+            df: DataFrame with historical OHLCV data
+            df_features: Technical indicators already calculated for df
+                (calculated here if not given)
+            
+        Returns:
+            Tuple of (X, positions, feature names), see
+            FeatureEngineer.create_feature_rows
+        """
         # Initialize feature engineer if needed
         if self.feature_engineer is None:
             self.feature_engineer = FeatureEngineer()
         
         # Calculate technical indicators
-        df_features = self.feature_engineer.calculate_technical_indicators(df.copy())
+        if df_features is None:
+            df_features = self.feature_engineer.calculate_technical_indicators(df)
         
-        # Create ML features
-        features_df = self.feature_engineer.create_ml_features(df_features)
+        return self.feature_engineer.create_feature_rows(df_features)
+    
+    def _prepare_sequence(
+        self,
+        df: pd.DataFrame,
+        df_features: Optional[pd.DataFrame] = None
+    ) -> Tuple[np.ndarray, List[str]]:
+        """
+        Build the model input sequence from historical data.
+        
+        Args:
+            df: DataFrame with historical OHLCV data
+            df_features: Technical indicators already calculated for df
+                (calculated here if not given)
+            
+        Returns:
+            Tuple of (sequence with shape (1, seq_len, n_features), feature names)
+        """
+        if len(df) < self.sequence_length:
+            raise ValueError(
+                f"Insufficient data: need {self.sequence_length} rows, got {len(df)}"
+            )
+        
+        X, _, feature_names = self._feature_rows(df, df_features)
+        if len(X) < self.sequence_length:
+            raise ValueError(
+                f"Insufficient data: need {self.sequence_length} complete rows, got {len(X)}"
+            )
         
         # Normalize features
-        features_normalized = self.feature_engineer.normalize_features(features_df)
+        features_normalized, _ = self.feature_engineer.normalize_features(X)
         
         # Create sequence (last sequence_length rows)
-        sequence = features_normalized.values[-self.sequence_length:]
+        sequence = features_normalized[-self.sequence_length:]
         sequence = sequence.reshape(1, self.sequence_length, -1)  # (1, seq_len, n_features)
         
-        # Make prediction
-        probability = float(self.model.predict(sequence, verbose=0)[0][0])
+        return sequence, feature_names
+    
+    @handle_ml_error()
+    def predict_rolling(
+        self,
+        df: pd.DataFrame,
+        batch_size: int = 512,
+        df_features: Optional[pd.DataFrame] = None,
+        max_batch_bytes: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Predict next day up-probability as of every row of df in one pass.
         
+        Equivalent to calling predict_next_day on df.iloc[:i + 1] for each
+        row i: features are computed once over the whole frame, each window
+        is normalized with the statistics of the rows up to its last bar
+        (what a scaler fitted on that prefix would use), and the windows are
+        streamed through the model in fixed-size batches. Windows are views
+        into the feature rows and only one batch is materialized at a time,
+        so memory stays flat however long df is.
+        
+        Args:
+            df: DataFrame with historical OHLCV data
+            batch_size: Model batch size
+            df_features: Technical indicators already calculated for df
+                (calculated here if not given)
+            max_batch_bytes: Size limit for one model input batch; when
+                given, the batch size is derived from it instead
+            
+        Returns:
+            Array of probabilities aligned with df's rows (NaN where there is
+            not yet enough history to predict)
+        """
+        if self.model is None:
+            raise ValueError("Model not loaded")
+        
+        probabilities = np.full(len(df), np.nan)
+        
+        X, positions, _ = self._feature_rows(df, df_features)
+        seq_len = self.sequence_length
+        if len(X) < seq_len:
+            return probabilities
+        
+        # Expanding mean/std (ddof=0, zero std -> 1, as StandardScaler)
+        counts = np.arange(1, len(X) + 1)[:, None]
+        mean = np.cumsum(X, axis=0) / counts
+        var = np.cumsum(X * X, axis=0) / counts - mean * mean
+        std = np.sqrt(np.maximum(var, 0.0))
+        std[std < 10 * np.finfo(np.float64).eps] = 1.0
+        
+        # (n_windows, seq_len, n_features) views ending at rows seq_len-1 ...
+        windows = sliding_window_view(X, seq_len, axis=0).transpose(0, 2, 1)
+        mean = mean[seq_len - 1:, None, :]
+        std = std[seq_len - 1:, None, :]
+        
+        _, input_dtype = _INFERENCE_DTYPES[self.inference_dtype]
+        if max_batch_bytes is not None:
+            window_bytes = seq_len * X.shape[1] * np.dtype(input_dtype).itemsize
+            batch_size = max(1, max_batch_bytes // window_bytes)
+        
+        logger.info(f"Predicting {len(windows)} rolling windows in batches of {batch_size}")
+        
+        predict_fn = self._get_predict_fn(X.shape[1])
+        window_probs = np.empty(len(windows))
+        for i in range(0, len(windows), batch_size):
+            batch = slice(i, i + batch_size)
+            sequences = ((windows[batch] - mean[batch]) / std[batch]).astype(input_dtype)
+            window_probs[batch] = predict_fn(tf.convert_to_tensor(sequences)).numpy()[:, 0]
+        
+        # A row that is not complete predicts from the last complete row before it
+        probabilities[positions[seq_len - 1:]] = window_probs
+        return pd.Series(probabilities).ffill().to_numpy()
+    
+    def _get_predict_fn(self, n_features: int):
+        """
+        Model forward pass traced once for any batch size.
+        
+        Keras predict re-enters its own function tracing on each call (and
+        for a new final batch size), which adds up when backtesting many
+        symbols with one predictor. The concrete function is kept and
+        reused for as long as the feature count is unchanged.
+        
+        Args:
+            n_features: Number of features per time step
+            
+        Returns:
+            Concrete function mapping a (batch, sequence_length, n_features)
+            tensor to the model's output
+        """
+        if self._predict_fn is not None and self._predict_fn[0] == n_features:
+            return self._predict_fn[1]
+        
+        _, input_dtype = _INFERENCE_DTYPES[self.inference_dtype]
+        model = self.model
+        
+        @tf.function(input_signature=[
+            tf.TensorSpec((None, self.sequence_length, n_features), tf.as_dtype(input_dtype))
+        ])
+        def forward(x):
+            return model(x, training=False)
+        
+        fn = forward.get_concrete_function()
+        self._predict_fn = (n_features, fn)
+        return fn
+    
+    def _build_prediction(
+        self,
+        symbol: str,
+        probability: float,
+        df: pd.DataFrame,
+        feature_names: List[str]
+    ) -> ModelPrediction:
+        """
+        Turn a model output probability into a ModelPrediction.
+        
+        Args:
+            symbol: Stock symbol
+            probability: Model output probability of an up move
+            df: DataFrame the prediction was made from
+            feature_names: Names of the model input features
+            
+        Returns:
+            ModelPrediction with direction, confidence, and predicted price
+        """
         # Determine direction
         direction = "UP" if probability > 0.5 else "DOWN"
         
@@ -127,7 +518,7 @@ class LSTMPredictor:
         confidence = abs(probability - 0.5) * 2.0  # Scale to [0, 1]
         
         # Calculate predicted price based on probability
-        current_price = df.iloc[-1]['close']
+        current_price = df['close'].iat[-1]
         # Use probability to estimate price movement magnitude
         if direction == "UP":
             # For UP direction, use probability above 0.5 to scale the move
@@ -144,7 +535,7 @@ class LSTMPredictor:
             predicted_price=predicted_price,
             direction=direction,
             confidence=confidence,
-            features_used=self.feature_names or list(features_df.columns),
+            features_used=self.feature_names or feature_names,
             timestamp=datetime.now(),
             model_name="LSTM",
             metadata={
@@ -261,7 +652,7 @@ class LSTMPredictor:
             self.feature_engineer = FeatureEngineer()
         
         # Prepare features
-        df_features = self.feature_engineer.calculate_technical_indicators(df.copy())
+        df_features = self.feature_engineer.calculate_technical_indicators(df)
         features_df = self.feature_engineer.create_ml_features(df_features)
         features_normalized = self.feature_engineer.normalize_features(features_df)
         
@@ -356,7 +747,7 @@ class LSTMPredictor:
         if self.feature_engineer is None:
             self.feature_engineer = FeatureEngineer()
         
-        df_features = self.feature_engineer.calculate_technical_indicators(df.copy())
+        df_features = self.feature_engineer.calculate_technical_indicators(df)
         latest = df_features.iloc[-1]
         
         # Key indicators
@@ -4,12 +4,19 @@ Market Close Handler
 Handles end-of-day operations at market close (4:00 PM ET).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from loguru import logger
 
 from src.bot_types.trading_types import BotConfig
 from src.database.db_manager import DatabaseManager
 
+# Log section separator, built once rather than per cycle
+_SEPARATOR = "=" * 80
+
+# Upper bound on concurrent EOD position closes
+_MAX_CLOSE_WORKERS = 16
+
 
 class MarketCloseHandler:
     """
@@ -45,22 +52,28 @@ class MarketCloseHandler:
         This is called by the scheduler at 4:00 PM ET daily.
         """
         try:
-            logger.info("=" * 80)
+            logger.info(_SEPARATOR)
             logger.info("Market close - executing end-of-day tasks...")
             
             # Close positions if configured
             if self.config.close_positions_eod:
                 logger.info("Closing all positions (EOD setting enabled)...")
-                positions = self.position_manager.get_open_positions()
+                symbols = [p.symbol for p in self.position_manager.get_all_positions()]
                 
-                for position in positions:
-                    logger.info(f"Closing position: {position.symbol}")
-                    success = self.position_manager.close_position(position.symbol)
+                if symbols:
+                    # Closes are independent per symbol, so submit them together
+                    logger.info(f"Closing {len(symbols)} positions: {', '.join(symbols)}")
+                    with ThreadPoolExecutor(
+                        max_workers=min(_MAX_CLOSE_WORKERS, len(symbols)),
+                        thread_name_prefix='market-close'
+                    ) as pool:
+                        results = list(pool.map(self.position_manager.close_position, symbols))
                     
-                    if success:
-                        logger.info(f"Position closed: {position.symbol}")
-                    else:
-                        logger.error(f"Failed to close position: {position.symbol}")
+                    for symbol, success in zip(symbols, results):
+                        if success:
+                            logger.info(f"Position closed: {symbol}")
+                        else:
+                            logger.error(f"Failed to close position: {symbol}")
             
             # Calculate daily performance
             logger.info("Calculating daily performance...")
@@ -88,7 +101,7 @@ class MarketCloseHandler:
             })
             
             logger.info("End-of-day tasks complete")
-            logger.info("=" * 80)
+            logger.info(_SEPARATOR)
             
         except Exception as e:
             logger.exception(f"Error handling market close: {e}")
@@ -5,12 +5,49 @@ Orchestrates position monitoring and stop loss execution.
 Runs continuously during market hours.
 """
 
-from typing import Dict, Any
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from loguru import logger
 
 from src.bot_types.trading_types import BotConfig
+from src.data.price_stream import PriceStream
 from src.database.db_manager import DatabaseManager
 
+# Maximum age of the cached account cash before reconciling with the broker
+_CASH_RECONCILE_SECONDS = 60.0
+
+# Real-time priority given to stop-loss threads when they are pinned
+_STOP_LOSS_FIFO_PRIORITY = 50
+
+
+def _pin_stop_loss_thread():
+    """
+    Pin the calling stop-loss worker to a dedicated CPU, if configured.
+    
+    Set STOP_LOSS_CPU to a core reserved with the isolcpus= kernel
+    parameter; the worker is then bound to it and run under SCHED_FIFO so
+    housekeeping threads cannot delay a stop exit. Unset, this does nothing.
+    Real-time scheduling needs CAP_SYS_NICE; without it only the affinity
+    is applied.
+    """
+    cpu = os.getenv('STOP_LOSS_CPU')
+    if not cpu or not hasattr(os, 'sched_setaffinity'):
+        return
+    
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not pin stop-loss thread to CPU {cpu}: {e}")
+        return
+    
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_STOP_LOSS_FIFO_PRIORITY))
+    except OSError as e:
+        logger.warning(f"Could not set real-time priority for stop-loss thread: {e}")
+
 
 class PositionMonitorOrchestrator:
     """
@@ -44,6 +81,30 @@ class PositionMonitorOrchestrator:
         
         self.config = config
         self.db = db
+        
+        # Stop-loss exits are independent broker round-trips, so triggered
+        # stops are closed concurrently rather than one after another
+        self._stop_pool = self._create_stop_pool()
+        
+        # Account cash only changes on fills, which show up as changed
+        # holdings; reuse it between fills and reconcile once a minute
+        self._cash: Optional[float] = None
+        self._cash_holdings: Optional[FrozenSet[Tuple[str, int]]] = None
+        self._cash_expires = 0.0
+        
+        # Live trade prices for held symbols trigger stops between polls;
+        # the 30s tick then acts as reconciliation
+        self.price_stream = PriceStream(on_price=self._on_stream_price)
+        
+        # Serializes position price/P&L writes and stop checks between the
+        # scheduler tick and the stream thread, so neither sees the other's
+        # half-applied updates or interleaves trailing-stop changes
+        self._price_lock = threading.Lock()
+        
+        # Symbols with a stop-loss exit in progress (poll and stream can
+        # both see the same trigger)
+        self._stops_in_flight = set()
+        self._stops_lock = threading.Lock()
     
     def update_positions(self):
         """
@@ -51,48 +112,167 @@ class PositionMonitorOrchestrator:
         
         This is the main entry point called by the scheduler every 30 seconds.
         """
-        try:
-            # Sync positions with broker
-            self.position_manager.sync_positions()
-            
-            # Update all position prices at once (batch update)
-            updated_prices = self.position_manager.update_position_prices()
+        # Bind hot-path methods once; this runs ~1200 times per trading day.
+        # Market-hours gating happens in the coordinator against the cached
+        # session, so no schedule lookup is repeated here.
+        pos_mgr = self.position_manager
+        stop_mgr = self.stop_loss_manager
+        get_stop_info = stop_mgr.get_stop_info
+        register_position = stop_mgr.register_position
+        execute_stop_loss = self._execute_stop_loss
+        
+        with self._price_lock:
+            # Only broker and database calls are guarded; a failed price write
+            # must not stop the stop-loss checks that follow it
+            try:
+                # Sync positions with broker
+                pos_mgr.sync_positions()
+                
+                # Update all position prices at once (batch update)
+                updated_prices = pos_mgr.update_position_prices()
+            except Exception as e:
+                logger.exception(f"Error updating positions: {e}")
+                return
             
             # Get all positions for monitoring
-            positions = self.position_manager.get_all_positions()
+            positions = pos_mgr.get_all_positions()
             
-            if not positions:
-                return
-            
-            logger.debug(f"Monitoring {len(positions)} positions...")
+            # Read the refreshed prices for persisting while no tick can change them
+            price_rows = [
+                (p.symbol, p.current_price, p.unrealized_pnl, p.unrealized_pnl_percent)
+                for p in positions
+                if p.symbol in updated_prices
+            ]
             
             # Register any new positions with stop loss manager
             for position in positions:
                 # Check if position is registered (returns None if not)
-                if self.stop_loss_manager.get_stop_info(position.symbol) is None:
+                if get_stop_info(position.symbol) is None:
                     # Pass entire Position object
-                    self.stop_loss_manager.register_position(position)
+                    register_position(position)
             
             # Check ALL stops at once (batch operation)
             # StopLossManager internally updates trailing stops based on position.current_price
-            triggered_stops = self.stop_loss_manager.check_stops(positions)
-            
-            # Execute any triggered stops
-            for position, reason in triggered_stops:
-                logger.warning(f"Stop loss triggered for {position.symbol}: {reason}")
-                self._execute_stop_loss(position.symbol, reason)
+            triggered_stops = stop_mgr.check_stops(positions) if positions else []
+        
+        # Keep the live price feed subscribed to exactly the held symbols
+        self.price_stream.set_symbols(p.symbol for p in positions)
+        
+        if not positions:
+            return
+        
+        logger.debug("Monitoring {} positions...", len(positions))
+        
+        # Persist refreshed prices in one transaction
+        if price_rows:
+            try:
+                self.db.update_position_prices(price_rows)
+            except Exception as e:
+                logger.exception(f"Error persisting position prices: {e}")
+        
+        # Execute any triggered stops concurrently (each handles its own errors)
+        futures = []
+        for position, reason in triggered_stops:
+            logger.warning(f"Stop loss triggered for {position.symbol}: {reason}")
+            futures.append(self._stop_pool.submit(execute_stop_loss, position.symbol, reason))
+        for future in futures:
+            future.result()
+        
+        # Update portfolio state
+        try:
+            cash = self._get_cash(positions, stops_executed=bool(triggered_stops))
+        except Exception as e:
+            logger.exception(f"Error reading account cash: {e}")
+            return
+        
+        if cash is not None:
+            self.portfolio_monitor.update_portfolio_state(
+                current_positions=positions,
+                cash_available=cash
+            )
+    
+    def _get_cash(self, positions: List, stops_executed: bool) -> Optional[float]:
+        """
+        Get account cash, calling the broker only when it may have changed.
+        
+        The cached value is reused while holdings are unchanged and no stop
+        was executed, up to _CASH_RECONCILE_SECONDS.
+        
+        Args:
+            positions: Current open positions
+            stops_executed: Whether stop-loss exits were submitted this tick
             
-            # Update portfolio state
-            account = self.executor.get_account()
-            if account:
-                cash = float(account.get('cash', 0)) if isinstance(account, dict) else float(account.cash)
-                self.portfolio_monitor.update_portfolio_state(
-                    current_positions=positions,
-                    cash_available=cash
-                )
+        Returns:
+            Cash available, or None if the account could not be read
+        """
+        holdings = frozenset((p.symbol, p.quantity) for p in positions)
+        now = time.monotonic()
+        
+        if (
+            self._cash is not None
+            and not stops_executed
+            and holdings == self._cash_holdings
+            and now < self._cash_expires
+        ):
+            return self._cash
+        
+        account = self.executor.get_account()
+        if not account:
+            return None
+        
+        cash = float(account.get('cash', 0)) if isinstance(account, dict) else float(account.cash)
+        if self._cash is not None and abs(cash - self._cash) > 0.01 and holdings == self._cash_holdings:
+            logger.debug("Cash reconciled with broker: ${:.2f} -> ${:.2f}", self._cash, cash)
+        
+        self._cash = cash
+        self._cash_holdings = holdings
+        self._cash_expires = now + _CASH_RECONCILE_SECONDS
+        return cash
+    
+    def stop_streaming(self):
+        """Stop the live price feed (it restarts on the next update with positions)."""
+        self.price_stream.stop()
+    
+    def shutdown(self):
+        """
+        Wait for in-flight stop-loss exits and release the stop pool's threads.
+        
+        Call after stop_streaming(), so the stream can't submit new exits. A
+        fresh pool replaces the old one for when the bot is restarted.
+        """
+        self._stop_pool.shutdown(wait=True)
+        self._stop_pool = self._create_stop_pool()
+    
+    @staticmethod
+    def _create_stop_pool() -> ThreadPoolExecutor:
+        """Create the stop-loss exit pool (its threads start on first use)."""
+        return ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix='stop-loss',
+            initializer=_pin_stop_loss_thread
+        )
+    
+    def _on_stream_price(self, symbol: str, price: float):
+        """
+        Apply a streamed trade price and exit immediately if a stop is hit.
+        
+        Runs on the price stream thread, under the same lock as the polling
+        tick; stop exits are handed to the stop pool.
+        
+        Args:
+            symbol: Stock symbol
+            price: Trade price
+        """
+        with self._price_lock:
+            position = self.position_manager.update_position_price(symbol, price)
+            if position is None:
+                return
             
-        except Exception as e:
-            logger.exception(f"Error updating positions: {e}")
+            triggered_stops = self.stop_loss_manager.check_stops([position])
+        
+        for position, reason in triggered_stops:
+            logger.warning(f"Stop loss triggered for {symbol} (live): {reason}")
+            self._stop_pool.submit(self._execute_stop_loss, symbol, reason)
     
     def _execute_stop_loss(self, symbol: str, reason: str):
         """
@@ -102,6 +282,12 @@ class PositionMonitorOrchestrator:
             symbol: Symbol to close
             reason: Reason for stop loss
         """
+        with self._stops_lock:
+            if symbol in self._stops_in_flight:
+                logger.debug("Stop loss for {} already in progress", symbol)
+                return
+            self._stops_in_flight.add(symbol)
+        
         try:
             logger.info(f"Executing stop loss for {symbol}: {reason}")
             
@@ -119,3 +305,6 @@ class PositionMonitorOrchestrator:
                 
         except Exception as e:
             logger.exception(f"Error executing stop loss: {e}")
+        finally:
+            with self._stops_lock:
+                self._stops_in_flight.discard(symbol)
@@ -4,6 +4,7 @@ Risk Monitor Orchestrator
 Monitors portfolio risk limits and activates circuit breaker when needed.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from loguru import logger
 
@@ -42,6 +43,29 @@ class RiskMonitorOrchestrator:
         self.executor = executor
         self.config = config
         self.db = db
+        
+        # In-memory circuit breaker flag, checked by the trading cycle before
+        # any new order; the DB copy is written off the critical path by a
+        # single background writer
+        self.circuit_breaker_active = False
+        self._state_writer = self._create_state_writer()
+    
+    @staticmethod
+    def _create_state_writer() -> ThreadPoolExecutor:
+        """Create the bot-state writer (its thread starts on first use)."""
+        return ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='bot-state'
+        )
+    
+    def shutdown(self):
+        """
+        Wait for pending bot-state writes and release the writer thread.
+        
+        A fresh writer replaces the old one for when the bot is restarted.
+        """
+        self._state_writer.shutdown(wait=True)
+        self._state_writer = self._create_state_writer()
     
     def check_risk_limits(self) -> bool:
         """
@@ -58,12 +82,15 @@ class RiskMonitorOrchestrator:
         try:
             # Get current portfolio state first
             if self.position_manager and self.executor:
-                current_positions = self.position_manager.get_all_positions()
-                account_info = self.executor.get_account_info()
-                portfolio_state = self.portfolio_monitor.update_portfolio_state(
-                    current_positions=current_positions,
-                    cash_available=account_info['cash']
-                )
+                # Reuse the position monitor's snapshot when it is fresh
+                portfolio_state = self.portfolio_monitor.get_latest_state()
+                if portfolio_state is None:
+                    current_positions = self.position_manager.get_all_positions()
+                    account_info = self.executor.get_account()
+                    portfolio_state = self.portfolio_monitor.update_portfolio_state(
+                        current_positions=current_positions,
+                        cash_available=account_info['cash']
+                    )
                 # Get risk metrics from portfolio state
                 risk_metrics = self.portfolio_monitor.get_risk_metrics(portfolio_state)
             else:
@@ -71,9 +98,9 @@ class RiskMonitorOrchestrator:
                 logger.warning("RiskMonitor missing position_manager or executor - cannot get accurate risk metrics")
                 return True  # Skip risk check if we can't get proper data
             
-            # Check daily loss limit (5%)
-            daily_loss_limit = self.config.daily_loss_limit  # 0.05 = 5%
-            if risk_metrics.daily_pnl_percent <= -daily_loss_limit:
+            # Check daily loss limit (already evaluated against
+            # config.daily_loss_limit when the metrics were computed)
+            if risk_metrics.daily_loss_limit_reached:
                 logger.critical(
                     f"CIRCUIT BREAKER TRIGGERED: Daily loss limit exceeded "
                     f"({risk_metrics.daily_pnl_percent:.2%})"
@@ -83,9 +110,10 @@ class RiskMonitorOrchestrator:
             # Log risk metrics periodically
             if risk_metrics.positions_used > 0:
                 logger.info(
-                    f"Risk metrics: positions={risk_metrics.positions_used}, "
-                    f"exposure={risk_metrics.total_exposure_percent:.1%}, "
-                    f"daily_pnl={risk_metrics.daily_pnl_percent:.2%}"
+                    "Risk metrics: positions={}, exposure={:.1%}, daily_pnl={:.2%}",
+                    risk_metrics.positions_used,
+                    risk_metrics.total_exposure_percent,
+                    risk_metrics.daily_pnl_percent
                 )
             
             return True
@@ -104,8 +132,9 @@ class RiskMonitorOrchestrator:
         try:
             logger.critical("Activating circuit breaker - stopping all trading")
             
-            # Update bot state to trigger stop
-            self.db.update_bot_state({
+            # Halt in memory first; persisting must not delay the stop
+            self.circuit_breaker_active = True
+            self._state_writer.submit(self._persist_bot_state, {
                 'trading_mode': self.config.trading_mode.value,
                 'is_running': False,
                 'circuit_breaker_triggered': True
@@ -117,3 +146,31 @@ class RiskMonitorOrchestrator:
         except Exception as e:
             logger.exception(f"Error activating circuit breaker: {e}")
             return False
+    
+    def reset_circuit_breaker(self):
+        """
+        Clear the circuit breaker so new orders are accepted again.
+        
+        Called when the bot is started and at the daily reset; the
+        persisted flag is cleared with the in-memory one.
+        """
+        if not self.circuit_breaker_active:
+            return
+        
+        logger.warning("Resetting circuit breaker - trading re-enabled")
+        self.circuit_breaker_active = False
+        self._state_writer.submit(self._persist_bot_state, {
+            'circuit_breaker_triggered': False
+        })
+    
+    def _persist_bot_state(self, state: Dict[str, Any]):
+        """
+        Write bot state to the database (runs on the background writer).
+        
+        Args:
+            state: Bot state fields to update
+        """
+        try:
+            self.db.update_bot_state(state)
+        except Exception as e:
+            logger.exception(f"Error persisting bot state: {e}")
@@ -5,13 +5,46 @@ Orchestrates the complete trading workflow from data collection through
 prediction generation to signal execution.
 """
 
-from typing import Dict, Any
-from datetime import datetime, timedelta
+import dataclasses
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+import pandas as pd
 from loguru import logger
 
-from src.bot_types.trading_types import BotConfig, TradingSignal
+from src.bot_types.trading_types import (
+    BotConfig,
+    TradingSignal,
+    RiskMetrics,
+    SignalType,
+    ModelPrediction,
+)
+from src.common.converters import DatabaseConverter
 from src.database.db_manager import DatabaseManager
 
+# Log section separator, built once rather than per cycle
+_SEPARATOR = "=" * 80
+
+# How long a submitted signal blocks an identical resubmission
+_DEDUP_TTL_SECONDS = 300
+
+
+def _bars_key(df: pd.DataFrame) -> tuple:
+    """
+    Identify a window of bars by its last bar and a hash of its contents.
+    
+    Args:
+        df: DataFrame with OHLCV bars
+        
+    Returns:
+        Tuple of (last bar timestamp, digest of index and values)
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return df.index[-1], hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+
 
 class TradingCycleOrchestrator:
     """
@@ -29,7 +62,13 @@ class TradingCycleOrchestrator:
     Does NOT manage lifecycle, scheduling, or position monitoring.
     """
     
-    def __init__(self, modules: Dict[str, Any], config: BotConfig, db: DatabaseManager):
+    def __init__(
+        self,
+        modules: Dict[str, Any],
+        config: BotConfig,
+        db: DatabaseManager,
+        risk_monitor=None
+    ):
         """
         Initialize trading cycle orchestrator.
         
@@ -37,6 +76,8 @@ class TradingCycleOrchestrator:
             modules: Dict of bot module instances
             config: Bot configuration
             db: Database manager instance
+            risk_monitor: RiskMonitorOrchestrator whose circuit breaker halts
+                new orders (optional)
         """
         # Extract required modules
         self.data_fetcher = modules['data_fetcher']
@@ -50,151 +91,434 @@ class TradingCycleOrchestrator:
         self.portfolio_monitor = modules['portfolio_monitor']
         self.order_manager = modules['order_manager']
         self.position_manager = modules['position_manager']
+        self.executor = modules['executor']
         
         self.config = config
         self.db = db
+        self.risk_monitor = risk_monitor
+        
+        # Enum string resolved once; config is immutable between reloads
+        self._trading_mode_str = config.trading_mode.value
+        
+        self._pool_size = max(1, len(config.symbols))
+        self._create_pools()
+        
+        # Serializes risk validation + execution so concurrent symbols
+        # cannot over-allocate the portfolio or race on the signal queue
+        self._execution_lock = threading.Lock()
+        
+        # Guards against overlapping cycle runs; a run that finds it held skips
+        self._cycle_lock = threading.Lock()
+        
+        # Recently submitted (symbol, signal type, bar date) -> expiry, so a
+        # signal is never submitted twice within the dedup window
+        self._inflight: Dict[Tuple[str, str, date], float] = {}
+        
+        # DB writes queued during a cycle and flushed in one transaction
+        self._pending_db_writes: List[Tuple[str, Dict[str, Any]]] = []
+        self._db_writes_lock = threading.Lock()
+        
+        # One pre-bound pipeline per symbol, built once rather than per cycle
+        self._symbol_pipelines = {
+            symbol: self._build_pipeline(symbol) for symbol in config.symbols
+        }
+    
+    def _create_pools(self):
+        """Create the worker pools (their threads start on first use)."""
+        # Symbols are I/O-bound (broker/data HTTP calls), so process them concurrently.
+        # Pool is persistent to avoid thread start-up cost every cycle, and is
+        # grown at the start of a cycle when a config reload added symbols.
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._pool_size,
+            thread_name_prefix='trading-cycle'
+        )
+        
+        # Separate pool for the cycle-wide batched fetches (bars + latest
+        # prices), which run side by side before symbols are dispatched
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix='trading-io'
+        )
+        
+        # Single background writer that applies flushed batches in order, so
+        # the cycle never waits on a commit. Trade-off: writes still queued
+        # here are lost if the process dies before the writer reaches them
+        # (shutdown() drains them on a clean stop).
+        self._db_writer = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='db-writer'
+        )
     
-    def run(self):
+    def shutdown(self):
         """
-        Execute one complete trading cycle.
+        Persist queued DB writes and release the worker threads.
         
-        Processes each configured symbol through the trading workflow.
+        Waits for a running cycle and for the DB writer to drain. Fresh
+        pools replace the old ones, so the orchestrator works again when
+        the bot is restarted.
         """
-        try:
-            logger.info("=" * 80)
-            logger.info("Starting trading cycle...")
-            
-            # Process each configured symbol
-            for symbol in self.config.symbols:
-                self._process_symbol(symbol)
-            
-            logger.info("Trading cycle complete")
-            logger.info("=" * 80)
-            
-        except Exception as e:
-            logger.exception(f"Error in trading cycle: {e}")
+        with self._cycle_lock:
+            self._flush_db_writes()
+            for pool in (self._pool, self._io_pool, self._db_writer):
+                pool.shutdown(wait=True)
+            self._create_pools()
+        
+        logger.debug("Trading cycle workers shut down")
     
-    def _process_symbol(self, symbol: str):
+    def run(self, now: Optional[datetime] = None):
         """
-        Process trading logic for a single symbol.
+        Execute one complete trading cycle.
+        
+        Processes all configured symbols concurrently through the trading workflow,
+        so cycle latency tracks the slowest symbol rather than the sum of all symbols.
         
         Args:
-            symbol: Stock symbol to process
+            now: Cycle timestamp read once by the caller (defaults to now)
         """
+        if self._circuit_breaker_active():
+            logger.warning("Circuit breaker active - skipping trading cycle")
+            return
+        
+        if not self._cycle_lock.acquire(blocking=False):
+            logger.warning("Previous trading cycle still running - skipping this run")
+            return
+        
         try:
-            logger.info(f"Processing {symbol}...")
-            
-            # Step 1: Fetch market data
-            logger.debug(f"Fetching market data for {symbol}...")
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=90)
-            historical_data = self.data_fetcher.fetch_historical_data(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            if historical_data is None or historical_data.empty:
-                logger.warning(f"No historical data available for {symbol}")
-                return
-            
-            # Step 2: Validate data quality
-            logger.debug("Validating data quality...")
-            is_valid, issues = self.data_validator.validate_price_data(historical_data)
-            if not is_valid:
-                logger.warning(f"Data quality issues: {', '.join(issues)}")
-                historical_data = self.data_validator.validate_and_clean(historical_data)
-            
-            # Step 3: Calculate technical indicators
-            logger.debug("Calculating technical indicators...")
-            data_with_indicators = self.feature_engineer.calculate_technical_indicators(
-                historical_data
-            )
-            
-            # Step 4: Create ML features
-            logger.debug("Creating ML features...")
-            features = self.feature_engineer.create_ml_features(data_with_indicators)
+            logger.info(_SEPARATOR)
+            logger.info("Starting trading cycle...")
             
-            if features is None or features.empty:
-                logger.warning(f"Could not create ML features for {symbol}")
-                return
+            # Snapshot portfolio risk and bot state once per cycle; executions
+            # update the snapshot in-memory instead of re-fetching per symbol
+            risk_metrics = self._snapshot_risk_metrics()
+            bot_state = self.db.get_bot_state() or {}
             
-            # Step 5: Generate ML prediction
-            if self.predictor is None:
-                logger.warning("No ML model loaded - skipping prediction")
-                return
+            # Snapshot pipelines so a concurrent config reload can't change
+            # the symbol set mid-cycle
+            pipelines = self._symbol_pipelines
+            symbols = list(pipelines)
+            self._ensure_pool_size(len(symbols))
             
-            logger.debug("Generating ML prediction...")
-            prediction = self.ensemble.ensemble_predict(
-                symbol=symbol,
-                data=data_with_indicators,
-                lstm_predictor=self.predictor,
-                features=features
+            # Step 1: Fetch market data for all symbols in one batched request
+            # each for bars and latest prices, overlapping the two round-trips
+            end_date = now or datetime.now()
+            start_date = end_date - timedelta(days=90)
+            bars_future = self._io_pool.submit(
+                self.data_fetcher.fetch_historical_data_multi,
+                symbols, start_date, end_date
             )
-            
-            if prediction is None:
-                logger.warning(f"Could not generate prediction for {symbol}")
-                return
-            
-            logger.info(
-                f"Prediction: direction={prediction.predicted_direction}, "
-                f"confidence={prediction.confidence:.2%}, "
-                f"price=${prediction.predicted_price:.2f}"
+            prices_future = self._io_pool.submit(
+                self.data_fetcher.fetch_latest_prices, symbols
             )
+            historical_by_symbol = bars_future.result()
+            latest_prices = prices_future.result()
+            
+            # Steps 2-4: Prepare model input for all symbols in parallel
+            prepare_futures = {
+                symbol: self._pool.submit(
+                    pipelines[symbol][0],
+                    historical_by_symbol.get(symbol)
+                )
+                for symbol in symbols
+            }
+            prepared = {
+                symbol: data
+                for symbol, future in prepare_futures.items()
+                if (data := future.result()) is not None
+            }
+            
+            # Step 5: One batched ensemble prediction across all symbols
+            predictions = self._predict_all(prepared)
+            
+            # Steps 6-8: Generate and dispatch signals in parallel
+            futures = [
+                self._pool.submit(
+                    pipelines[symbol][1],
+                    prediction,
+                    latest_prices.get(symbol),
+                    risk_metrics,
+                    bot_state
+                )
+                for symbol, prediction in predictions.items()
+            ]
+            for future in futures:
+                future.result()
             
-            # Save prediction to database
-            self.db.save_prediction(
-                symbol=prediction.symbol,
-                predicted_direction=prediction.predicted_direction,
-                predicted_price=prediction.predicted_price,
-                confidence=prediction.confidence,
-                model_type="ensemble"
-            )
+            self._flush_db_writes()
             
-            # Step 6: Generate trading signal
-            logger.debug("Generating trading signal...")
-            current_price = self.data_fetcher.fetch_latest_price(symbol)
+            logger.info("Trading cycle complete")
+            logger.info(_SEPARATOR)
             
-            # Check if we already have a position
-            current_position = self.position_manager.get_position(symbol)
+        except Exception as e:
+            logger.exception(f"Error in trading cycle: {e}")
+        finally:
+            self._cycle_lock.release()
+    
+    def update_config(self, config: BotConfig):
+        """
+        Apply a reloaded configuration.
+        
+        Pipelines are kept for symbols that remain and built for new ones;
+        takes effect from the next cycle, which also grows the symbol pool
+        if there are now more symbols than workers.
+        
+        Args:
+            config: New bot configuration
+        """
+        self._symbol_pipelines = {
+            symbol: self._symbol_pipelines.get(symbol) or self._build_pipeline(symbol)
+            for symbol in config.symbols
+        }
+        self.config = config
+        self._trading_mode_str = config.trading_mode.value
+        logger.info(f"Trading cycle config updated: symbols={list(config.symbols)}")
+    
+    def _ensure_pool_size(self, n_symbols: int):
+        """
+        Grow the symbol pool so every symbol gets its own worker.
+        
+        Only called from run() while holding the cycle lock, so no cycle is
+        using the old pool when it is replaced.
+        
+        Args:
+            n_symbols: Number of symbols in the cycle
+        """
+        if n_symbols <= self._pool_size:
+            return
+        
+        old_pool = self._pool
+        self._pool_size = n_symbols
+        self._pool = ThreadPoolExecutor(
+            max_workers=n_symbols,
+            thread_name_prefix='trading-cycle'
+        )
+        old_pool.shutdown(wait=False)
+        logger.info(f"Trading cycle pool resized to {n_symbols} workers")
+    
+    def _circuit_breaker_active(self) -> bool:
+        """
+        Check whether the risk monitor has halted trading.
+        
+        Returns:
+            bool: True if no new orders may be placed
+        """
+        return self.risk_monitor is not None and self.risk_monitor.circuit_breaker_active
+    
+    def _predict_all(self, prepared: Dict[str, pd.DataFrame]) -> Dict[str, ModelPrediction]:
+        """
+        Run the ensemble once over every prepared symbol.
+        
+        Args:
+            prepared: Dict of symbol -> DataFrame with indicators
             
-            signal = self.signal_generator.generate_signal(
-                prediction=prediction,
-                current_price=current_price,
-                current_position=current_position
+        Returns:
+            Dict of symbol -> ModelPrediction for symbols that got a prediction
+        """
+        if not prepared:
+            return {}
+        
+        if self.predictor is None:
+            logger.warning("No ML model loaded - skipping prediction")
+            return {}
+        
+        logger.debug("Generating ML predictions for {} symbols...", len(prepared))
+        # The prepared frames keep the OHLCV columns next to the indicators,
+        # so they serve as both the bars and the precomputed features
+        predictions = self.ensemble.ensemble_predict_batch(prepared, features=prepared)
+        
+        for symbol in prepared.keys() - predictions.keys():
+            logger.warning(f"Could not generate prediction for {symbol}")
+        
+        return predictions
+    
+    def _snapshot_risk_metrics(self) -> RiskMetrics:
+        """
+        Get current risk metrics, reusing the latest portfolio state if fresh.
+        
+        The portfolio monitor caches and shares its RiskMetrics, so the
+        snapshot is a private copy that executions can update in-place.
+        
+        Returns:
+            RiskMetrics for the current portfolio (owned by the caller)
+        """
+        portfolio_state = self.portfolio_monitor.get_latest_state()
+        if portfolio_state is None:
+            account = self.executor.get_account()
+            portfolio_state = self.portfolio_monitor.update_portfolio_state(
+                current_positions=self.position_manager.get_all_positions(),
+                cash_available=account['cash']
             )
+        return dataclasses.replace(self.portfolio_monitor.get_risk_metrics(portfolio_state))
+    
+    def _build_pipeline(
+        self,
+        symbol: str
+    ) -> Tuple[Callable[..., Optional[pd.DataFrame]], Callable[..., None]]:
+        """
+        Build the per-symbol trading pipeline.
+        
+        The pipeline has two stages around the cycle-wide batched prediction:
+        preparing model input from market data, and turning the prediction
+        into a signal. Module methods and the symbol are bound once here as
+        closure locals, so the per-cycle hot path does no attribute lookups
+        on self.
+        
+        Args:
+            symbol: Stock symbol the pipeline processes
             
-            if signal is None:
-                logger.info(f"No signal generated for {symbol}")
-                return
+        Returns:
+            Tuple of (prepare, act) callables:
+            - prepare(historical_data) -> data with indicators, or None to skip
+            - act(prediction, current_price, risk_metrics, bot_state)
+        """
+        validate_price_data = self.data_validator.validate_price_data
+        validate_and_clean = self.data_validator.validate_and_clean
+        calculate_indicators = self.feature_engineer.calculate_technical_indicators
+        queue_prediction = self._queue_prediction
+        get_position = self.position_manager.get_position
+        generate_signal = self.signal_generator.generate_signal
+        validate_and_dispatch = self._validate_and_dispatch
+        execution_lock = self._execution_lock
+        
+        # Indicators of the last window prepared, reused while the fetched
+        # bars are unchanged (e.g. cycles between two daily bars)
+        indicators_key = None
+        indicators = None
+        
+        def prepare(historical_data: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+            """
+            Validate market data and calculate indicators for the symbol.
             
-            logger.info(
-                f"Signal: {signal.signal_type.value} {symbol} @ ${signal.entry_price:.2f}, "
-                f"confidence={signal.confidence:.2%}"
-            )
+            A window whose last bar and contents match the previous call's
+            (a sliding or rewritten window does not) reuses its indicators.
             
+            Args:
+                historical_data: Prefetched OHLCV bars for the symbol
+                
+            Returns:
+                DataFrame with indicators ready for prediction, or None to skip
+            """
+            nonlocal indicators_key, indicators
+            try:
+                logger.info(f"Processing {symbol}...")
+                
+                if historical_data is None or historical_data.empty:
+                    logger.warning(f"No historical data available for {symbol}")
+                    return None
+                
+                # Step 2: Validate data quality
+                logger.debug("Validating data quality...")
+                is_valid, issues = validate_price_data(historical_data)
+                if not is_valid:
+                    logger.warning(f"Data quality issues: {', '.join(issues)}")
+                    historical_data = validate_and_clean(historical_data)
+                
+                # Step 3: Calculate technical indicators
+                key = _bars_key(historical_data)
+                if key == indicators_key:
+                    logger.debug("Bars unchanged, reusing technical indicators")
+                else:
+                    logger.debug("Calculating technical indicators...")
+                    indicators = calculate_indicators(historical_data)
+                    indicators_key = key
+                
+                # Step 4: ML features are built from these indicators by each
+                # ensemble component, which checks it has enough complete rows
+                return indicators
+                
+            except Exception as e:
+                logger.exception(f"Error processing {symbol}: {e}")
+                return None
+        
+        def act(
+            prediction: ModelPrediction,
+            current_price: Optional[float],
+            risk_metrics: RiskMetrics,
+            bot_state: Dict[str, Any]
+        ):
+            """
+            Record the symbol's prediction and generate/dispatch its signal.
+            
+            Args:
+                prediction: Ensemble prediction for the symbol
+                current_price: Prefetched latest price for the symbol
+                risk_metrics: Cycle-wide risk snapshot (shared across symbols)
+                bot_state: Cycle-wide bot state snapshot (shared across symbols)
+            """
+            try:
+                logger.info(
+                    f"Prediction: direction={prediction.direction}, "
+                    f"confidence={prediction.confidence:.2%}, "
+                    f"price=${prediction.predicted_price:.2f}"
+                )
+                
+                # Queue prediction for the end-of-cycle DB flush
+                queue_prediction(prediction)
+                
+                # Step 6: Generate trading signal
+                logger.debug("Generating trading signal...")
+                
+                # Check if we already have a position (local cache lookup;
+                # kept fresh by the position monitor's broker sync and by fills)
+                current_position = get_position(symbol)
+                
+                signal = generate_signal(
+                    prediction=prediction,
+                    current_price=current_price,
+                    current_position=current_position
+                )
+                
+                if signal is None:
+                    logger.info(f"No signal generated for {symbol}")
+                    return
+                
+                logger.info(
+                    f"Signal: {signal.signal_type.value} {symbol} @ ${signal.entry_price:.2f}, "
+                    f"confidence={signal.confidence:.2%}"
+                )
+                
+                with execution_lock:
+                    validate_and_dispatch(signal, risk_metrics, bot_state)
+                
+            except Exception as e:
+                logger.exception(f"Error processing {symbol}: {e}")
+        
+        return prepare, act
+    
+    def _validate_and_dispatch(
+        self,
+        signal: TradingSignal,
+        risk_metrics: RiskMetrics,
+        bot_state: Dict[str, Any]
+    ):
+        """
+        Validate a signal against risk rules, then execute or queue it.
+        
+        Must be called while holding the execution lock, since it reads and
+        mutates the shared cycle snapshots.
+        
+        Args:
+            signal: TradingSignal to validate and dispatch
+            risk_metrics: Cycle-wide risk snapshot
+            bot_state: Cycle-wide bot state snapshot
+        """
+        try:
             # Step 7: Validate against risk rules
             logger.debug("Validating trade against risk rules...")
-            risk_metrics = self.portfolio_monitor.get_risk_metrics()
             current_positions = self.position_manager.get_all_positions()
             
             is_valid, reason = self.risk_calculator.validate_trade(
                 signal=signal,
-                portfolio=risk_metrics,
+                risk_metrics=risk_metrics,
                 current_positions=current_positions
             )
             
             if not is_valid:
                 logger.warning(f"Trade rejected: {reason}")
                 # Save signal as rejected
-                self.db.save_signal(
-                    symbol=signal.symbol,
-                    signal_type=signal.signal_type.value,
-                    confidence=signal.confidence,
-                    entry_price=signal.entry_price,
-                    quantity=signal.quantity,
+                self._queue_signal(
+                    signal,
                     status="rejected",
-                    reasoning=f"Risk validation failed: {reason}"
+                    rejected_reason=f"Risk validation failed: {reason}"
                 )
                 return
             
@@ -203,42 +527,45 @@ class TradingCycleOrchestrator:
             
             if should_execute:
                 logger.info(f"Auto-executing signal (confidence {signal.confidence:.2%} > threshold)")
-                self._execute_signal(signal)
+                self._execute_signal(signal, risk_metrics, bot_state)
             else:
                 logger.info(f"Adding signal to queue for manual approval")
                 self.signal_queue.add_signal(signal)
                 # Save signal as pending
-                self.db.save_signal(
-                    symbol=signal.symbol,
-                    signal_type=signal.signal_type.value,
-                    confidence=signal.confidence,
-                    entry_price=signal.entry_price,
-                    quantity=signal.quantity,
-                    status="pending",
-                    reasoning=signal.reasoning
-                )
+                self._queue_signal(signal, status="pending")
             
         except Exception as e:
-            logger.exception(f"Error processing {symbol}: {e}")
+            logger.exception(f"Error dispatching signal for {signal.symbol}: {e}")
     
-    def _execute_signal(self, signal: TradingSignal) -> bool:
+    def _execute_signal(
+        self,
+        signal: TradingSignal,
+        risk_metrics: RiskMetrics,
+        bot_state: Dict[str, Any]
+    ) -> bool:
         """
         Execute a trading signal.
         
+        On success the risk and bot state snapshots are updated in-memory so
+        later symbols in the same cycle see the new exposure without re-fetching.
+        
         Args:
             signal: TradingSignal to execute
+            risk_metrics: Risk snapshot to size against (updated on success)
+            bot_state: Bot state snapshot (updated on success)
             
         Returns:
             bool: True if executed successfully, False otherwise
         """
         try:
-            logger.info(f"Executing signal: {signal.signal_type.value} {signal.symbol}")
+            symbol = signal.symbol
+            signal_type = signal.signal_type.value
+            logger.info(f"Executing signal: {signal_type} {symbol}")
             
             # Calculate position size based on risk
-            risk_metrics = self.portfolio_monitor.get_risk_metrics()
             quantity = self.risk_calculator.calculate_position_size(
                 signal=signal,
-                portfolio_value=risk_metrics['portfolio_value'],
+                portfolio_value=risk_metrics.portfolio_value,
                 current_price=signal.entry_price
             )
             
@@ -249,6 +576,17 @@ class TradingCycleOrchestrator:
             # Update signal quantity
             signal.quantity = quantity
             
+            # The breaker can trip while a cycle or approval is under way
+            if self._circuit_breaker_active():
+                logger.warning(f"Circuit breaker active - not executing {signal_type} {symbol}")
+                return False
+            
+            # Skip if the same signal was already submitted for this bar
+            dedup_key = (symbol, signal_type, signal.timestamp.date())
+            if not self._claim_execution(dedup_key):
+                logger.warning(f"Duplicate signal ignored: {signal_type} {symbol} already submitted")
+                return False
+            
             # Execute order via order manager
             success = self.order_manager.submit_order(
                 signal=signal,
@@ -257,37 +595,144 @@ class TradingCycleOrchestrator:
             )
             
             if success:
-                logger.success(f"Signal executed successfully: {signal.signal_type.value} {quantity} {signal.symbol}")
+                logger.success(f"Signal executed successfully: {signal_type} {quantity} {symbol}")
                 
                 # Save signal as executed
-                self.db.save_signal(
-                    symbol=signal.symbol,
-                    signal_type=signal.signal_type.value,
-                    confidence=signal.confidence,
-                    entry_price=signal.entry_price,
-                    quantity=quantity,
-                    status="executed",
-                    reasoning=signal.reasoning
-                )
+                self._queue_signal(signal, status="executed")
+                
+                # Reflect the fill in the snapshots instead of re-fetching
+                self._apply_execution(risk_metrics, signal, quantity)
+                bot_state['total_trades_today'] = bot_state.get('total_trades_today', 0) + 1
                 
                 # Update bot state
-                state = self.db.get_bot_state()
-                if state:
-                    self.db.update_bot_state({
-                        'trading_mode': self.config.trading_mode.value,
-                        'is_running': True,
-                        'total_trades_today': state.get('total_trades_today', 0) + 1
-                    })
+                self._queue_db_write('bot_state', {
+                    'trading_mode': self._trading_mode_str,
+                    'is_running': True,
+                    'total_trades_today': bot_state['total_trades_today']
+                })
                 
                 return True
             else:
-                logger.error(f"Failed to execute signal: {signal.symbol}")
+                logger.error(f"Failed to execute signal: {symbol}")
+                # Release the key so a later cycle may retry
+                self._inflight.pop(dedup_key, None)
                 return False
                 
         except Exception as e:
             logger.exception(f"Error executing signal: {e}")
             return False
     
+    def _claim_execution(self, key: Tuple[str, str, date]) -> bool:
+        """
+        Record a signal as submitted unless it already is.
+        
+        Must be called while holding the execution lock. Expired entries are
+        pruned on each call, so the dict stays bounded by the dedup window.
+        
+        Args:
+            key: (symbol, signal type, bar date) identifying the signal
+            
+        Returns:
+            bool: True if the caller may submit, False if it is a duplicate
+        """
+        now = time.monotonic()
+        inflight = self._inflight
+        
+        for stale in [k for k, expiry in inflight.items() if expiry <= now]:
+            del inflight[stale]
+        
+        if key in inflight:
+            return False
+        
+        inflight[key] = now + _DEDUP_TTL_SECONDS
+        return True
+    
+    def _queue_db_write(self, table: str, row: Dict[str, Any]):
+        """
+        Queue a DB write for the next batch flush.
+        
+        Args:
+            table: Target table ('predictions', 'signals' or 'bot_state')
+            row: Column values to insert (or bot state fields to update)
+        """
+        with self._db_writes_lock:
+            self._pending_db_writes.append((table, row))
+    
+    def _queue_prediction(self, prediction: ModelPrediction):
+        """
+        Queue a model prediction for the next batch flush.
+        
+        Args:
+            prediction: ModelPrediction to persist
+        """
+        self._queue_db_write('predictions', DatabaseConverter.prediction_to_dict(prediction))
+    
+    def _queue_signal(
+        self,
+        signal: TradingSignal,
+        status: str,
+        rejected_reason: Optional[str] = None
+    ):
+        """
+        Queue a trading signal for the next batch flush.
+        
+        Args:
+            signal: TradingSignal to persist
+            status: Signal status ('pending', 'rejected', 'executed')
+            rejected_reason: Why the signal was rejected, if it was
+        """
+        self._queue_db_write(
+            'signals',
+            DatabaseConverter.signal_to_dict(signal, status, rejected_reason)
+        )
+    
+    def _flush_db_writes(self):
+        """Hand all queued predictions, signals and bot state to the DB writer."""
+        with self._db_writes_lock:
+            writes, self._pending_db_writes = self._pending_db_writes, []
+        
+        if writes:
+            self._db_writer.submit(self._write_batch, writes)
+    
+    def _write_batch(self, writes: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Persist a batch of queued writes in one transaction (runs on the DB writer).
+        
+        Args:
+            writes: List of (table, row) tuples
+        """
+        try:
+            if not self.db.flush_batch(writes):
+                logger.error(f"Failed to persist {len(writes)} queued DB writes")
+        except Exception as e:
+            logger.exception(f"Error persisting queued DB writes: {e}")
+    
+    @staticmethod
+    def _apply_execution(risk_metrics: RiskMetrics, signal: TradingSignal, quantity: int):
+        """
+        Update a risk snapshot in-place to reflect an executed order.
+        
+        Args:
+            risk_metrics: Risk snapshot to update
+            signal: Executed signal
+            quantity: Executed share quantity
+        """
+        notional = quantity * signal.entry_price
+        if signal.signal_type == SignalType.SELL:
+            notional = -notional
+            position_delta = -1
+        else:
+            position_delta = 1
+        
+        risk_metrics.cash_available -= notional
+        risk_metrics.total_exposure += notional
+        risk_metrics.total_exposure_percent = (
+            risk_metrics.total_exposure / risk_metrics.portfolio_value
+            if risk_metrics.portfolio_value > 0 else 0
+        )
+        risk_metrics.positions_used += position_delta
+        risk_metrics.available_positions -= position_delta
+    
     def process_signal_approval(self, signal_id: str) -> bool:
         """
         Process a signal from the queue (manual approval).
@@ -298,37 +743,51 @@ class TradingCycleOrchestrator:
         Returns:
             bool: True if processed successfully, False otherwise
         """
-        try:
-            signal = self.signal_queue.get_signal(signal_id)
-            if signal is None:
-                logger.warning(f"Signal not found: {signal_id}")
+        # Refuse before claiming, so the signal stays pending
+        if self._circuit_breaker_active():
+            logger.warning(f"Circuit breaker active - cannot approve signal {signal_id}")
+            return False
+        
+        # Claim the signal with a single pop so concurrent approvals of
+        # the same ID cannot both execute it
+        signal = self.signal_queue.approve_signal(signal_id)
+        if signal is None:
+            return False
+        
+        with self._execution_lock:
+            # Only the state reads touch the broker/DB; validation below is
+            # pure and reports failure through its return value
+            try:
+                risk_metrics = self._snapshot_risk_metrics()
+                bot_state = self.db.get_bot_state() or {}
+            except Exception as e:
+                logger.exception(f"Error processing signal: {e}")
+                self.signal_queue.requeue_signal(signal_id, signal)
                 return False
             
             # Re-validate risk rules (conditions may have changed)
-            risk_metrics = self.portfolio_monitor.get_risk_metrics()
-            current_positions = self.position_manager.get_all_positions()
             is_valid, reason = self.risk_calculator.validate_trade(
                 signal=signal,
-                portfolio=risk_metrics,
-                current_positions=current_positions
+                risk_metrics=risk_metrics,
+                current_positions=self.position_manager.get_all_positions()
             )
             
             if not is_valid:
                 logger.warning(f"Signal no longer valid: {reason}")
-                self.signal_queue.remove_signal(signal_id)
-                # Update signal status in database
-                self.db.update_signal_status(signal_id, "rejected", reason)
+                # Update signal status in database (off the critical path)
+                self._db_writer.submit(
+                    self.db.update_signal_status,
+                    signal_id, "rejected", rejected_reason=reason
+                )
                 return False
             
-            # Execute signal
-            success = self._execute_signal(signal)
-            
-            if success:
-                self.signal_queue.remove_signal(signal_id)
-                return True
-            else:
-                return False
-                
-        except Exception as e:
-            logger.exception(f"Error processing signal: {e}")
-            return False
+            # Execute signal (handles and logs its own broker errors)
+            success = self._execute_signal(signal, risk_metrics, bot_state)
+        
+        # Approvals happen outside a cycle, so persist immediately
+        self._flush_db_writes()
+        
+        if not success:
+            # Leave it pending so it can be approved again
+            self.signal_queue.requeue_signal(signal_id, signal)
+        return success
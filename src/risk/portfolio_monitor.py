@@ -5,7 +5,8 @@ This module tracks portfolio state in real-time and monitors for
 risk limit violations, providing the data needed for risk validation.
 """
 
-from typing import List, Optional, Dict
+import time
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import numpy as np
@@ -20,6 +21,10 @@ from src.bot_types.trading_types import (
 )
 
 
+# How long computed risk metrics stay valid for the same portfolio state
+_RISK_METRICS_TTL_SECONDS = 1.0
+
+
 @dataclass
 class PortfolioState:
     """
@@ -64,6 +69,11 @@ class PortfolioMonitor:
         self.start_of_day_value = initial_capital
         self.portfolio_history: List[PortfolioState] = []
         
+        # (monotonic time, state, metrics) of the last risk metrics computed
+        self._metrics_cache: Optional[
+            Tuple[float, PortfolioState, RiskMetrics]
+        ] = None
+        
         logger.info(
             f"PortfolioMonitor initialized with ${initial_capital:.2f} capital"
         )
@@ -112,14 +122,41 @@ class PortfolioMonitor:
         
         # Add to history
         self.portfolio_history.append(state)
+        self._metrics_cache = None
         
         logger.debug(
-            f"Portfolio updated: ${portfolio_value:.2f} "
-            f"(cash: ${cash_available:.2f}, positions: ${positions_value:.2f})"
+            "Portfolio updated: ${:.2f} (cash: ${:.2f}, positions: ${:.2f})",
+            portfolio_value, cash_available, positions_value
         )
         
         return state
     
+    def get_latest_state(
+        self,
+        max_age_seconds: float = 30.0
+    ) -> Optional[PortfolioState]:
+        """
+        Get the most recent portfolio state if it is still fresh.
+        
+        The position monitor refreshes state every 30 seconds, so callers
+        can usually reuse that snapshot instead of re-querying the broker.
+        
+        Args:
+            max_age_seconds: Maximum snapshot age to accept
+        
+        Returns:
+            Latest portfolio state, or None if none exists or it is stale
+        """
+        if not self.portfolio_history:
+            return None
+        
+        latest = self.portfolio_history[-1]
+        age = (datetime.now() - latest.timestamp).total_seconds()
+        if age > max_age_seconds:
+            return None
+        
+        return latest
+    
     def get_risk_metrics(
         self,
         portfolio_state: PortfolioState
@@ -127,12 +164,24 @@ class PortfolioMonitor:
         """
         Calculate current risk metrics.
         
+        Metrics for the same state are reused for up to a second, so the
+        risk monitor and the trading cycle share one computation per tick.
+        
         Args:
             portfolio_state: Current portfolio state
         
         Returns:
             Risk metrics for validation
         """
+        now = time.monotonic()
+        cached = self._metrics_cache
+        if (
+            cached is not None
+            and cached[1] is portfolio_state
+            and now - cached[0] < _RISK_METRICS_TTL_SECONDS
+        ):
+            return cached[2]
+        
         # Calculate exposure
         total_exposure = portfolio_state.positions_value
         exposure_percent = (
@@ -181,9 +230,8 @@ class PortfolioMonitor:
         )
         
         logger.debug(
-            f"Risk metrics: Exposure {exposure_percent:.1%}, "
-            f"Daily P&L {daily_pnl_percent:.1%}, "
-            f"Positions {positions_used}/{self.config.max_positions}"
+            "Risk metrics: Exposure {:.1%}, Daily P&L {:.1%}, Positions {}/{}",
+            exposure_percent, daily_pnl_percent, positions_used, self.config.max_positions
         )
         
         if daily_loss_limit_reached:
@@ -192,6 +240,7 @@ class PortfolioMonitor:
                 f"(limit: {self.config.daily_loss_limit:.2%})"
             )
         
+        self._metrics_cache = (now, portfolio_state, metrics)
         return metrics
     
     def _calculate_portfolio_risk(
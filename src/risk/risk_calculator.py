@@ -19,6 +19,7 @@ from loguru import logger
 from src.bot_types.trading_types import (
     TradingSignal,
     Position,
+    PositionStatus,
     RiskMetrics,
     BotConfig
 )
@@ -47,6 +48,22 @@ class RiskCalculator:
         logger.info(f"  Daily loss limit: {config.daily_loss_limit * 100}%")
         logger.info(f"  Stop loss: {config.stop_loss_percent * 100}%")
     
+    @property
+    def config(self) -> BotConfig:
+        """Bot configuration with risk parameters."""
+        return self._config
+    
+    @config.setter
+    def config(self, config: BotConfig):
+        """Set the configuration and resolve validate_trade's thresholds."""
+        self._config = config
+        self._limits = (
+            config.max_positions,
+            config.max_position_size,
+            config.max_portfolio_exposure,
+            config.prediction_confidence_threshold,
+        )
+    
     def calculate_position_size(
         self,
         signal: TradingSignal,
@@ -99,9 +116,8 @@ class RiskCalculator:
             f"{shares} shares (${shares * current_price:.2f})"
         )
         logger.debug(
-            f"  Risk amount: ${risk_amount:.2f}, "
-            f"Risk per share: ${risk_per_share:.2f}, "
-            f"Max by limit: {max_shares_by_limit} shares"
+            "  Risk amount: ${:.2f}, Risk per share: ${:.2f}, Max by limit: {} shares",
+            risk_amount, risk_per_share, max_shares_by_limit
         )
         
         return shares
@@ -127,8 +143,8 @@ class RiskCalculator:
         stop_price = entry_price * (1 - stop_loss_percent)
         
         logger.debug(
-            f"Stop loss calculated: ${stop_price:.2f} "
-            f"({stop_loss_percent * 100}% below ${entry_price:.2f})"
+            "Stop loss calculated: ${:.2f} ({}% below ${:.2f})",
+            stop_price, stop_loss_percent * 100, entry_price
         )
         
         return round(stop_price, 2)
@@ -176,6 +192,10 @@ class RiskCalculator:
             - is_valid: True if all checks pass
             - reason: Explanation for rejection (empty if valid)
         """
+        # Thresholds are resolved once per config, not per call
+        max_positions, max_position_size, max_exposure, min_confidence = self._limits
+        symbol = signal.symbol
+        
         # Check 1: Daily loss limit (circuit breaker)
         if risk_metrics.daily_loss_limit_reached:
             reason = (
@@ -187,64 +207,66 @@ class RiskCalculator:
             return False, reason
         
         # Check 2: Maximum positions limit
-        if risk_metrics.positions_used >= self.config.max_positions:
+        if risk_metrics.positions_used >= max_positions:
             reason = (
                 f"Maximum positions reached: {risk_metrics.positions_used} "
-                f"(limit: {self.config.max_positions})"
+                f"(limit: {max_positions})"
             )
             logger.warning(f"Trade rejected: {reason}")
             return False, reason
         
         # Check 3: Already have position in this symbol
-        for position in current_positions:
-            if position.symbol == signal.symbol and position.status.value == "open":
-                reason = f"Position already exists in {signal.symbol}"
-                logger.warning(f"Trade rejected: {reason}")
-                return False, reason
+        if any(
+            position.symbol == symbol and position.status is PositionStatus.OPEN
+            for position in current_positions
+        ):
+            reason = f"Position already exists in {symbol}"
+            logger.warning(f"Trade rejected: {reason}")
+            return False, reason
         
-        # Check 4: Calculate position value and check limits
-        if signal.entry_price and signal.quantity:
-            position_value = signal.entry_price * signal.quantity
+        entry_price = signal.entry_price
+        quantity = signal.quantity
+        if entry_price and quantity:
+            # Check 4: Calculate position value and check limits
+            position_value = entry_price * quantity
+            portfolio_value = risk_metrics.portfolio_value
             
             # Check single position size limit (20% of portfolio)
-            max_position_value = risk_metrics.portfolio_value * self.config.max_position_size
+            max_position_value = portfolio_value * max_position_size
             if position_value > max_position_value:
                 reason = (
                     f"Position too large: ${position_value:.2f} "
                     f"(limit: ${max_position_value:.2f}, "
-                    f"{self.config.max_position_size * 100}%)"
+                    f"{max_position_size * 100}%)"
                 )
                 logger.warning(f"Trade rejected: {reason}")
                 return False, reason
             
             # Check total exposure limit (20% of portfolio)
             new_total_exposure = risk_metrics.total_exposure + position_value
-            max_total_exposure = risk_metrics.portfolio_value * self.config.max_portfolio_exposure
+            max_total_exposure = portfolio_value * max_exposure
             
             if new_total_exposure > max_total_exposure:
                 reason = (
                     f"Portfolio exposure limit exceeded: "
                     f"${new_total_exposure:.2f} "
                     f"(limit: ${max_total_exposure:.2f}, "
-                    f"{self.config.max_portfolio_exposure * 100}%)"
+                    f"{max_exposure * 100}%)"
                 )
                 logger.warning(f"Trade rejected: {reason}")
                 return False, reason
-        
-        # Check 5: Sufficient buying power
-        if signal.entry_price and signal.quantity:
-            required_capital = signal.entry_price * signal.quantity
-            if required_capital > risk_metrics.cash_available:
+            
+            # Check 5: Sufficient buying power
+            if position_value > risk_metrics.cash_available:
                 reason = (
                     f"Insufficient buying power: "
-                    f"${required_capital:.2f} required, "
+                    f"${position_value:.2f} required, "
                     f"${risk_metrics.cash_available:.2f} available"
                 )
                 logger.warning(f"Trade rejected: {reason}")
                 return False, reason
         
         # Check 6: Signal confidence meets threshold
-        min_confidence = self.config.prediction_confidence_threshold
         if signal.confidence < min_confidence:
             reason = (
                 f"Confidence too low: {signal.confidence:.2f} "
@@ -255,7 +277,7 @@ class RiskCalculator:
         
         # All checks passed
         logger.info(
-            f"Trade validated for {signal.symbol}: "
+            f"Trade validated for {symbol}: "
             f"{signal.quantity} shares at ${signal.entry_price:.2f}"
         )
         return True, ""
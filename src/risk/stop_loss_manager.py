@@ -13,6 +13,7 @@ Key Features:
 
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+import numpy as np
 from loguru import logger
 
 from src.bot_types.trading_types import (
@@ -105,57 +106,53 @@ class StopLossManager:
         Returns:
             List of (position, reason) tuples for positions to close
         """
-        triggered_stops = []
+        open_positions = [p for p in positions if p.status == PositionStatus.OPEN]
+        if not open_positions:
+            return []
+        
+        # Evaluate all positions in one vectorized pass (NaN = no trailing stop)
+        current = np.array([p.current_price for p in open_positions], dtype=float)
+        entry = np.array([p.entry_price for p in open_positions], dtype=float)
+        initial = np.array([p.stop_loss for p in open_positions], dtype=float)
+        trailing = np.array(
+            [np.nan if p.trailing_stop is None else p.trailing_stop for p in open_positions],
+            dtype=float
+        )
         
-        for position in positions:
-            if position.status != PositionStatus.OPEN:
-                continue
-            
-            # Update trailing stop if needed
+        # Update trailing stops only where one activates or would be raised
+        profit = (current - entry) / entry
+        candidate = current * (1 - self.config.trailing_stop_percent)
+        needs_update = (profit >= self.config.trailing_stop_activation) & (
+            np.isnan(trailing) | (candidate > trailing)
+        )
+        for i in np.flatnonzero(needs_update):
+            position = open_positions[i]
             self._update_trailing_stop(position)
-            
-            # Check for stop trigger
-            stop_triggered, reason = self._check_stop_triggered(position)
-            
-            if stop_triggered:
-                triggered_stops.append((position, reason))
-                logger.warning(
-                    f"🛑 STOP LOSS TRIGGERED: {position.symbol} - {reason}"
-                )
+            trailing[i] = position.trailing_stop
         
-        return triggered_stops
-    
-    def _check_stop_triggered(
-        self,
-        position: Position
-    ) -> Tuple[bool, str]:
-        """
-        Check if stop loss has been triggered for a position.
-        
-        Args:
-            position: Position to check
+        # Trailing stop takes precedence over the initial stop (NaN never hits)
+        trailing_hit = current <= trailing
+        triggered = trailing_hit | (current <= initial)
         
-        Returns:
-            Tuple of (is_triggered, reason)
-        """
-        current_price = position.current_price
-        
-        # Check trailing stop first (if activated)
-        if position.trailing_stop is not None:
-            if current_price <= position.trailing_stop:
-                return True, (
-                    f"Trailing stop hit: ${current_price:.2f} <= "
-                    f"${position.trailing_stop:.2f}"
+        triggered_stops = []
+        for i in np.flatnonzero(triggered):
+            position = open_positions[i]
+            if trailing_hit[i]:
+                reason = (
+                    f"Trailing stop hit: ${current[i]:.2f} <= "
+                    f"${trailing[i]:.2f}"
                 )
-        
-        # Check initial stop loss
-        if current_price <= position.stop_loss:
-            return True, (
-                f"Initial stop hit: ${current_price:.2f} <= "
-                f"${position.stop_loss:.2f}"
+            else:
+                reason = (
+                    f"Initial stop hit: ${current[i]:.2f} <= "
+                    f"${initial[i]:.2f}"
+                )
+            triggered_stops.append((position, reason))
+            logger.warning(
+                f"🛑 STOP LOSS TRIGGERED: {position.symbol} - {reason}"
             )
         
-        return False, ""
+        return triggered_stops
     
     def _update_trailing_stop(self, position: Position):
         """
@@ -14,7 +14,7 @@ Key Features:
 """
 
 import os
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 
@@ -23,10 +23,12 @@ from alpaca.trading.requests import (
     MarketOrderRequest,
     LimitOrderRequest,
     GetOrdersRequest,
+    GetCalendarRequest,
 )
 from alpaca.trading.enums import OrderSide, TimeInForce, OrderStatus as AlpacaOrderStatus, QueryOrderStatus
 from alpaca.data.historical import StockHistoricalDataClient
 from loguru import logger
+from requests import Session
 
 from src.bot_types.trading_types import OrderStatus, Position, PositionStatus
 from src.common.decorators import handle_broker_error
@@ -50,7 +52,8 @@ class AlpacaExecutor:
         self,
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
-        is_paper: bool = True
+        is_paper: bool = True,
+        http_session: Optional[Session] = None
     ):
         """
         Initialize Alpaca API executor.
@@ -59,6 +62,8 @@ class AlpacaExecutor:
             api_key: Alpaca API key (if None, loads from environment)
             secret_key: Alpaca secret key (if None, loads from environment)
             is_paper: Use paper trading (True) or live trading (False)
+            http_session: Shared keep-alive HTTP session for the Alpaca clients
+                (defaults to one session per client)
         
         Raises:
             ValueError: If API credentials are missing
@@ -87,6 +92,20 @@ class AlpacaExecutor:
         # Initialize Alpaca data client (no auth needed for free tier)
         self.data_client = StockHistoricalDataClient(api_key, secret_key)
         
+        # Route both clients through the shared connection pool so TLS
+        # connections are reused across modules. alpaca-py has no public hook
+        # for the session, so a client without the private attribute keeps
+        # its own session rather than breaking.
+        if http_session is not None:
+            for client in (self.trading_client, self.data_client):
+                if hasattr(client, '_session'):
+                    client._session = http_session
+                else:
+                    logger.warning(
+                        f"{type(client).__name__} has no _session attribute, "
+                        f"not using the shared HTTP session"
+                    )
+        
         logger.info(
             f"AlpacaExecutor initialized - "
             f"Mode: {'PAPER' if is_paper else 'LIVE'} trading"
@@ -335,7 +354,7 @@ class AlpacaExecutor:
             )
             position_list.append(position)
         
-        logger.info(f"Retrieved {len(position_list)} open positions")
+        logger.debug("Retrieved {} open positions", len(position_list))
         return position_list
     
     @handle_broker_error(retry_strategy=RetryStrategy.IMMEDIATE, max_retries=2)
@@ -432,6 +451,30 @@ class AlpacaExecutor:
         logger.info("All orders cancelled")
         return True, None
     
+    @handle_broker_error(retry_strategy=RetryStrategy.IMMEDIATE, max_retries=2)
+    def get_market_session(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Get the market open and close times for a day from Alpaca's calendar.
+        
+        Accounts for holidays and early closes, unlike a fixed 9:30-16:00 check.
+        
+        Args:
+            day: Calendar date to look up
+        
+        Returns:
+            Tuple of (open, close) as naive Eastern Time datetimes,
+            or None if the market is closed that day
+        """
+        calendar = self.trading_client.get_calendar(
+            GetCalendarRequest(start=day, end=day)
+        )
+        
+        for session in calendar:
+            if session.date == day:
+                return session.open, session.close
+        
+        return None
+    
     @handle_broker_error(retry_strategy=RetryStrategy.IMMEDIATE, max_retries=2)
     def get_latest_price(self, symbol: str) -> Optional[float]:
         """
@@ -458,6 +501,42 @@ class AlpacaExecutor:
             return float(quote[symbol].ask_price)
         
         return None
+    
+    @handle_broker_error(retry_strategy=RetryStrategy.IMMEDIATE, max_retries=2)
+    def get_latest_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get the latest prices for several symbols in at most two requests.
+        
+        Same sources as get_latest_price(): the open position's current price
+        where one exists, otherwise the latest ask quote. Positions come from
+        one list-positions call and the remaining symbols share one quote call.
+        
+        Args:
+            symbols: Stock symbols
+        
+        Returns:
+            Dict of symbol -> latest price (symbols without a price are omitted)
+        """
+        if not symbols:
+            return {}
+        
+        wanted = set(symbols)
+        prices = {
+            pos.symbol: float(pos.current_price)
+            for pos in self.trading_client.get_all_positions()
+            if pos.symbol in wanted and pos.current_price is not None
+        }
+        
+        missing = [symbol for symbol in symbols if symbol not in prices]
+        if missing:
+            from alpaca.data.requests import StockLatestQuoteRequest
+            request = StockLatestQuoteRequest(symbol_or_symbols=missing)
+            quotes = self.data_client.get_stock_latest_quote(request)
+            for symbol in missing:
+                if symbol in quotes:
+                    prices[symbol] = float(quotes[symbol].ask_price)
+        
+        return prices
 
 
 # Example usage
@@ -97,7 +97,7 @@ class PositionManager:
                 logger.info(f"Position {symbol} no longer exists in broker - removing")
                 self.close_position(symbol, auto_closed=True)
             
-            logger.info(f"Synced {synced_count} positions from Alpaca")
+            logger.debug("Synced {} positions from Alpaca", synced_count)
             return synced_count
             
         except Exception as e:
@@ -156,45 +156,72 @@ class PositionManager:
         """
         Update current prices for all open positions.
         
-        This fetches latest prices from Alpaca and updates P&L calculations.
-        Should be called periodically (every 30-60 seconds during market hours).
+        This fetches latest prices from Alpaca in one batched request and
+        updates P&L calculations. Should be called periodically (every 30-60
+        seconds during market hours).
         
         Returns:
             Dictionary of symbol: current_price
         """
         updated_prices = {}
         
-        for symbol in list(self.positions.keys()):
+        symbols = list(self.positions.keys())
+        if not symbols:
+            return updated_prices
+        
+        try:
+            # One round-trip for all positions instead of one per symbol
+            latest_prices = self.executor.get_latest_prices(symbols)
+        except Exception as e:
+            logger.error(f"Failed to fetch latest prices: {e}")
+            return updated_prices
+        
+        for symbol in symbols:
             try:
-                # Get current price from executor
-                current_price = self.executor.get_latest_price(symbol)
+                current_price = latest_prices.get(symbol)
                 
                 if current_price is None:
                     logger.warning(f"Could not get current price for {symbol}")
                     continue
                 
-                # Update position
-                position = self.positions[symbol]
-                position.current_price = current_price
-                position.unrealized_pnl = (current_price - position.entry_price) * position.quantity
-                position.unrealized_pnl_percent = (
-                    (current_price - position.entry_price) / position.entry_price * 100
-                )
-                
-                updated_prices[symbol] = current_price
-                
-                # Update stop loss manager
-                if self.stop_loss_manager:
-                    self.stop_loss_manager.update_position_price(symbol, current_price)
+                if self.update_position_price(symbol, current_price) is not None:
+                    updated_prices[symbol] = current_price
                 
             except Exception as e:
                 logger.error(f"Failed to update price for {symbol}: {e}")
         
         if updated_prices:
-            logger.debug(f"Updated prices for {len(updated_prices)} positions")
+            logger.debug("Updated prices for {} positions", len(updated_prices))
         
         return updated_prices
     
+    def update_position_price(self, symbol: str, current_price: float) -> Optional[Position]:
+        """
+        Apply a new market price to a position and recalculate its P&L.
+        
+        Args:
+            symbol: Stock symbol
+            current_price: Latest market price
+        
+        Returns:
+            The updated Position, or None if no position is held
+        """
+        position = self.positions.get(symbol)
+        if position is None:
+            return None
+        
+        position.current_price = current_price
+        position.unrealized_pnl = (current_price - position.entry_price) * position.quantity
+        position.unrealized_pnl_percent = (
+            (current_price - position.entry_price) / position.entry_price * 100
+        )
+        
+        # Update stop loss manager
+        if self.stop_loss_manager:
+            self.stop_loss_manager.update_position_price(symbol, current_price)
+        
+        return position
+    
     def _update_position(self, symbol: str, new_position: Position):
         """
         Update an existing position with new data.
@@ -216,6 +243,9 @@ class PositionManager:
         """
         Get a position by symbol.
         
+        Served from the local position cache, which sync_positions() refreshes
+        and fills update; never calls the broker.
+        
         Args:
             symbol: Stock symbol
         
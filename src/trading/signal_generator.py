@@ -12,6 +12,7 @@ Key Features:
 - Signal validation and enrichment
 """
 
+import itertools
 from datetime import datetime, timezone
 from typing import Optional, List, Dict
 from enum import Enum
@@ -95,8 +96,8 @@ class SignalGenerator:
         # Check if confidence meets minimum threshold
         if prediction.confidence < self.confidence_threshold:
             logger.debug(
-                f"Prediction confidence {prediction.confidence:.2f} below "
-                f"threshold {self.confidence_threshold:.2f} - skipping"
+                "Prediction confidence {:.2f} below threshold {:.2f} - skipping",
+                prediction.confidence, self.confidence_threshold
             )
             return None
         
@@ -178,8 +179,8 @@ class SignalGenerator:
             else:
                 # Continue holding (no signal needed)
                 logger.debug(
-                    f"Position {current_position.symbol} prediction UP - "
-                    f"continue holding"
+                    "Position {} prediction UP - continue holding",
+                    current_position.symbol
                 )
                 return None
     
@@ -394,12 +395,16 @@ class SignalQueue:
     
     This class maintains a queue of signals that require manual approval
     before execution, providing methods to approve, reject, or modify them.
+    
+    Producers (trading cycle workers) and consumers (dashboard approvals)
+    need no lock: IDs come from an atomic counter and every mutation is a
+    single dict operation, so a signal can only be claimed once.
     """
     
     def __init__(self):
         """Initialize empty signal queue."""
         self.pending_signals: Dict[str, TradingSignal] = {}
-        self._signal_counter = 0
+        self._signal_ids = itertools.count(1)
     
     def add_signal(self, signal: TradingSignal) -> str:
         """
@@ -411,8 +416,7 @@ class SignalQueue:
         Returns:
             Signal ID for tracking
         """
-        self._signal_counter += 1
-        signal_id = f"SIG-{self._signal_counter:04d}"
+        signal_id = f"SIG-{next(self._signal_ids):04d}"
         self.pending_signals[signal_id] = signal
         
         logger.info(
@@ -449,6 +453,17 @@ class SignalQueue:
             logger.warning(f"Signal not found for approval: {signal_id}")
         return signal
     
+    def requeue_signal(self, signal_id: str, signal: TradingSignal):
+        """
+        Put a previously approved signal back in the queue under its ID.
+        
+        Args:
+            signal_id: ID the signal was queued under
+            signal: Signal to restore
+        """
+        self.pending_signals[signal_id] = signal
+        logger.info(f"Signal returned to queue: {signal_id}")
+    
     def reject_signal(self, signal_id: str) -> bool:
         """
         Reject a signal (remove from queue).
@@ -105,3 +105,107 @@ def sample_trade():
         'order_id': 'test-order-123',
         'status': 'filled'
     }
+
+@pytest.fixture
+def make_bars():
+    """
+    Factory for random-walk OHLCV bars on business days.
+    
+    make_bars(n, seed, drift, volatility, start, open_noise) draws the log
+    returns, then the open-price noise (when open_noise is set), then the
+    volume, all from one seeded generator; opens equal closes otherwise.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    def make(
+        n: int = 120,
+        seed: int = 0,
+        drift: float = 0.0,
+        volatility: float = 0.02,
+        start: str = '2024-01-02',
+        open_noise: float = 0.0
+    ) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        close = 30 * np.exp(np.cumsum(drift + rng.normal(0, volatility, n)))
+        open_ = close * (1 + rng.normal(0, open_noise, n)) if open_noise else close
+        return pd.DataFrame(
+            {
+                'open': open_,
+                'high': close * 1.01,
+                'low': close * 0.99,
+                'close': close,
+                'volume': rng.integers(1_000_000, 5_000_000, n).astype(float)
+            },
+            index=pd.bdate_range(start, periods=n)
+        )
+    
+    return make
+
+# Module names the bot coordinator hands to the trading cycle orchestrator
+MODULE_NAMES = [
+    'data_fetcher', 'feature_engineer', 'data_validator', 'predictor',
+    'ensemble', 'signal_generator', 'signal_queue', 'risk_calculator',
+    'portfolio_monitor', 'order_manager', 'position_manager', 'executor',
+]
+
+@pytest.fixture
+def modules():
+    """Stand-in bot modules with a broker that accepts every order."""
+    from unittest.mock import MagicMock
+    
+    mods = {name: MagicMock() for name in MODULE_NAMES}
+    mods['risk_calculator'].calculate_position_size.return_value = 10
+    mods['order_manager'].submit_order.return_value = True
+    return mods
+
+@pytest.fixture
+def make_orchestrator(modules):
+    """
+    Factory for trading cycle orchestrators over the stand-in modules.
+    
+    make_orchestrator(symbols, risk_monitor, db) uses a stand-in database
+    unless one is given; every orchestrator is shut down after the test.
+    """
+    from unittest.mock import MagicMock
+    from src.orchestrators.trading_cycle import TradingCycleOrchestrator
+    
+    created = []
+    
+    def make(symbols=('PLTR',), risk_monitor=None, db=None):
+        config = MagicMock()
+        config.symbols = list(symbols)
+        orch = TradingCycleOrchestrator(
+            modules, config, db if db is not None else MagicMock(),
+            risk_monitor=risk_monitor
+        )
+        created.append(orch)
+        return orch
+    
+    yield make
+    for orch in created:
+        orch.shutdown()
+
+@pytest.fixture
+def make_signal():
+    """
+    Factory for trading signals.
+    
+    make_signal(symbol, signal_type, **fields) builds a BUY for PLTR on a
+    fixed bar date by default; fields override any other attribute.
+    """
+    from datetime import datetime
+    from src.bot_types.trading_types import SignalType, TradingSignal
+    
+    def make(symbol: str = 'PLTR', signal_type=SignalType.BUY, **fields):
+        values = {
+            'confidence': 0.9,
+            'predicted_direction': 'up',
+            'timestamp': datetime(2024, 3, 1, 10, 30),
+            'features': {},
+            'entry_price': 25.0,
+        }
+        values.update(fields)
+        return TradingSignal(symbol=symbol, signal_type=signal_type, **values)
+    
+    return make
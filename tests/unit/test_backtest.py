@@ -0,0 +1,323 @@
+"""
+Unit tests for the vectorized backtest.
+
+Checks Backtester.run_backtest (one rolling prediction pass plus the
+compiled simulation kernel) against the per-day loop it replaced, and
+Backtester.simulate_paths against single runs of the kernel. The predictor
+and data fetcher are stand-ins, so no model is loaded and no data is
+downloaded.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml import backtest
+from src.ml.backtest import Backtester
+
+
+SEQUENCE_LENGTH = 20
+
+
+class StandInPredictor:
+    """
+    Deterministic predictor with consistent rolling and per-day outputs.
+    
+    The up-probability of a bar comes from the 5-bar return up to it, so
+    ensemble_predict on a history slice agrees with row len(history) - 1 of
+    ensemble_predict_rolling.
+    """
+    
+    lookback = 5
+    
+    def ensemble_predict_rolling(self, df: pd.DataFrame, symbol: str = None):
+        close = df['close'].to_numpy(dtype=np.float64)
+        probabilities = np.full(len(close), np.nan)
+        momentum = close[self.lookback:] / close[:-self.lookback] - 1
+        probabilities[self.lookback:] = 1 / (1 + np.exp(-momentum * 40))
+        confidences = np.abs(probabilities - 0.5) * 2
+        return probabilities, confidences
+    
+    def ensemble_predict(self, history: pd.DataFrame, symbol: str = None):
+        probabilities, confidences = self.ensemble_predict_rolling(history, symbol)
+        probability = probabilities[-1]
+        if np.isnan(probability):
+            raise ValueError("Not enough history")
+        return SimpleNamespace(
+            direction="UP" if probability > 0.5 else "DOWN",
+            confidence=confidences[-1]
+        )
+
+
+@pytest.fixture
+def prices(monkeypatch, make_bars):
+    """Synthetic bars served by a stand-in DataFetcher."""
+    df = make_bars(n=260, start='2023-01-02', open_noise=0.005)
+    
+    class StandInFetcher:
+        def fetch_historical_data(self, symbol, start_date, end_date):
+            return df
+    
+    monkeypatch.setattr('src.data.data_fetcher.DataFetcher', StandInFetcher)
+    return df
+
+
+def reference_backtest(
+    backtester: Backtester,
+    df: pd.DataFrame,
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    predictor: StandInPredictor
+):
+    """The per-day loop run_backtest used before vectorization."""
+    capital = backtester.initial_capital
+    position = None
+    trades = []
+    daily_values = []
+    
+    def close_trade(exit_date, exit_price, reason):
+        entry_price, shares, _, entry_date = position
+        trades.append({
+            'symbol': symbol,
+            'entry_date': entry_date,
+            'exit_date': exit_date,
+            'entry_price': entry_price,
+            'exit_price': exit_price,
+            'shares': shares,
+            'pnl': shares * exit_price - entry_price * shares,
+            'pnl_pct': (exit_price / entry_price - 1) * 100,
+            'exit_reason': reason,
+            'holding_days': (exit_date - entry_date).days
+        })
+    
+    for current_date in df.loc[start_date:end_date].index:
+        history = df.loc[:current_date]
+        if len(history) < SEQUENCE_LENGTH:
+            continue
+        
+        price = history.iloc[-1]['close']
+        position_value = position[1] * price if position is not None else 0
+        daily_values.append({
+            'date': current_date,
+            'portfolio_value': capital + position_value,
+            'cash': capital,
+            'position_value': position_value
+        })
+        
+        if position is not None and price <= position[2]:
+            exit_value = position[1] * price
+            capital += exit_value - exit_value * backtester.commission_rate
+            close_trade(current_date, price, 'stop_loss')
+            position = None
+            continue
+        
+        try:
+            prediction = predictor.ensemble_predict(history, symbol=symbol)
+        except ValueError:
+            continue
+        
+        confident = prediction.confidence >= backtester.confidence_threshold
+        if position is None:
+            if prediction.direction == "UP" and confident:
+                shares = int(capital * backtester.position_size_pct / price)
+                entry_value = shares * price
+                commission = entry_value * backtester.commission_rate
+                if shares > 0 and entry_value + commission <= capital:
+                    capital -= entry_value + commission
+                    position = (price, shares, price * (1 - backtester.stop_loss_pct), current_date)
+        elif prediction.direction == "DOWN" and confident:
+            exit_value = position[1] * price
+            capital += exit_value - exit_value * backtester.commission_rate
+            close_trade(current_date, price, 'signal')
+            position = None
+    
+    if position is not None:
+        final_price = df.iloc[-1]['close']
+        capital += position[1] * final_price
+        close_trade(df.index[-1], final_price, 'end_of_test')
+    
+    return capital, trades, daily_values
+
+
+@pytest.mark.parametrize('threshold', [0.1, 0.3, 0.6])
+def test_run_backtest_matches_per_day_loop(prices, threshold):
+    """Trades, daily values, capital and metrics equal the old loop's."""
+    backtester = Backtester(confidence_threshold=threshold)
+    predictor = StandInPredictor()
+    
+    results = backtester.run_backtest(
+        'PLTR', '2023-03-01', '2023-12-29', predictor, sequence_length=SEQUENCE_LENGTH
+    )
+    capital, trades, daily_values = reference_backtest(
+        backtester, prices, 'PLTR', '2023-03-01', '2023-12-29', predictor
+    )
+    
+    assert len(trades) > 0
+    assert results['final_capital'] == pytest.approx(capital)
+    assert results['trades'] == trades
+    assert results['daily_values'] == daily_values
+    assert Backtester.daily_value_records(results) == daily_values
+    
+    expected_metrics = backtester.calculate_metrics(
+        trades, daily_values, backtester.initial_capital
+    )
+    assert results['metrics'] == pytest.approx(expected_metrics)
+
+
+def test_run_backtest_stop_losses_match_per_day_loop(prices):
+    """A tight stop exercises the stop-loss exit against the old loop."""
+    backtester = Backtester(confidence_threshold=0.2, stop_loss_pct=0.01)
+    predictor = StandInPredictor()
+    
+    results = backtester.run_backtest(
+        'PLTR', '2023-03-01', '2023-12-29', predictor, sequence_length=SEQUENCE_LENGTH
+    )
+    capital, trades, _ = reference_backtest(
+        backtester, prices, 'PLTR', '2023-03-01', '2023-12-29', predictor
+    )
+    
+    assert any(trade['exit_reason'] == 'stop_loss' for trade in trades)
+    assert results['trades'] == trades
+    assert results['final_capital'] == pytest.approx(capital)
+
+
+def test_report_same_from_columnar_results(prices):
+    """The report renders the same from the columnar results as from lists."""
+    backtester = Backtester(confidence_threshold=0.3)
+    predictor = StandInPredictor()
+    
+    results = backtester.run_backtest(
+        'PLTR', '2023-03-01', '2023-12-29', predictor, sequence_length=SEQUENCE_LENGTH
+    )
+    capital, trades, daily_values = reference_backtest(
+        backtester, prices, 'PLTR', '2023-03-01', '2023-12-29', predictor
+    )
+    legacy = dict(
+        results,
+        final_capital=capital,
+        trades=trades,
+        daily_values=daily_values,
+        metrics=backtester.calculate_metrics(trades, daily_values, backtester.initial_capital)
+    )
+    
+    assert backtester.generate_report(results) == backtester.generate_report(legacy)
+
+
+# Report text rendered by the original line-by-line generate_report
+BASELINE_REPORT = (
+    "\n============================================================\n"
+    "BACKTEST REPORT: PLTR\n"
+    "============================================================\n"
+    "\n"
+    "Period: 2023-03-01 to 2023-03-31\n"
+    "Initial Capital: $10,000.00\n"
+    "Final Capital: $10,345.60\n"
+    "Total Return: 3.46%\n"
+    "\n"
+    "----------------------TRADE STATISTICS----------------------\n"
+    "Total Trades: 6\n"
+    "Winning Trades: 4\n"
+    "Losing Trades: 2\n"
+    "Win Rate: 66.7%\n"
+    "Average Win: $8.12\n"
+    "Average Loss: $-5.50\n"
+    "Largest Win: $12.50\n"
+    "Largest Loss: $-7.50\n"
+    "Avg Holding Days: 1.0\n"
+    "\n"
+    "------------------------RISK METRICS------------------------\n"
+    "Sharpe Ratio: 1.23\n"
+    "Max Drawdown: -2.35%\n"
+    "Profit Factor: 2.95\n"
+    "\n"
+    "-----------------------RECENT TRADES------------------------\n"
+    "2023-03-03 → 2023-03-04: $21.00 → $21.40 | P&L: $8.50 (+1.7%) | Reason: signal\n"
+    "2023-03-05 → 2023-03-06: $22.00 → $22.30 | P&L: $4.50 (+0.9%) | Reason: stop_loss\n"
+    "2023-03-07 → 2023-03-08: $23.00 → $23.20 | P&L: $0.50 (+0.1%) | Reason: signal\n"
+    "2023-03-09 → 2023-03-10: $24.00 → $24.10 | P&L: $-3.50 (-0.7%) | Reason: stop_loss\n"
+    "2023-03-11 → 2023-03-12: $25.00 → $25.00 | P&L: $-7.50 (-1.5%) | Reason: signal\n"
+    "============================================================\n"
+)
+
+
+def test_generate_report_matches_baseline_text():
+    """generate_report renders exactly the original report text."""
+    trades = [
+        {
+            'entry_date': pd.Timestamp(2023, 3, 1 + 2 * i),
+            'exit_date': pd.Timestamp(2023, 3, 2 + 2 * i),
+            'entry_price': 20.0 + i,
+            'exit_price': 20.5 + 0.9 * i,
+            'pnl': 12.5 - 4 * i,
+            'pnl_pct': 2.5 - 0.8 * i,
+            'exit_reason': 'signal' if i % 2 else 'stop_loss'
+        }
+        for i in range(6)
+    ]
+    metrics = {
+        'total_return_pct': 3.456, 'total_trades': 6, 'winning_trades': 4,
+        'losing_trades': 2, 'win_rate': 0.6667, 'avg_win': 8.125,
+        'avg_loss': -5.5, 'largest_win': 12.5, 'largest_loss': -7.5,
+        'avg_holding_days': 1.0, 'sharpe_ratio': 1.234,
+        'max_drawdown_pct': -2.345, 'profit_factor': 2.95
+    }
+    results = {
+        'symbol': 'PLTR', 'start_date': '2023-03-01', 'end_date': '2023-03-31',
+        'initial_capital': 10000.0, 'final_capital': 10345.6,
+        'trades': trades, 'metrics': metrics
+    }
+    
+    assert Backtester().generate_report(results) == BASELINE_REPORT
+    
+    # Without trades the footer follows the section header directly
+    no_trades = Backtester().generate_report(dict(results, trades=[]))
+    assert no_trades == BASELINE_REPORT.split("2023-03-03 →")[0] + "=" * 60 + "\n"
+
+
+def test_simulate_paths_matches_single_runs():
+    """Each simulated path ends where a single kernel run over it does."""
+    backtester = Backtester()
+    rng = np.random.default_rng(1)
+    n_sims, n_bars = 6, 300
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_bars)))
+    probabilities = rng.random((n_sims, n_bars))
+    confidences = rng.random((n_sims, n_bars))
+    probabilities[:, :10] = np.nan
+    
+    paths = backtester.simulate_paths(close, probabilities, confidences)
+    
+    for k in range(n_sims):
+        entry_mask, exit_mask = backtest._signal_masks(
+            probabilities[k], confidences[k], backtester.confidence_threshold
+        )
+        result = backtest._simulate(
+            close, entry_mask, exit_mask, 0, n_bars,
+            backtester.initial_capital, backtester.position_size_pct,
+            backtester.stop_loss_pct, backtester.commission_rate
+        )
+        assert paths['final_capital'][k] == pytest.approx(result[-1])
+        assert paths['total_trades'][k] == result[0]
+    
+    assert paths['total_return_pct'] == pytest.approx(
+        (paths['final_capital'] / backtester.initial_capital - 1) * 100
+    )
+    assert paths['total_trades'].sum() > 0
+
+
+def test_simulate_paths_accepts_per_path_prices():
+    """Close prices may differ per path; a single path may be 1-D."""
+    backtester = Backtester(confidence_threshold=0.2)
+    rng = np.random.default_rng(2)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, (3, 120)), axis=1))
+    probabilities = rng.random((3, 120))
+    confidences = rng.random((3, 120))
+    
+    paths = backtester.simulate_paths(close, probabilities, confidences)
+    single = backtester.simulate_paths(close[1], probabilities[1], confidences[1])
+    
+    assert paths['final_capital'].shape == (3,)
+    assert single['final_capital'][0] == pytest.approx(paths['final_capital'][1])
+    assert single['total_trades'][0] == paths['total_trades'][1]
@@ -0,0 +1,108 @@
+"""
+Unit tests for batched database writes.
+
+Covers DatabaseManager.flush_batch (executemany inserts plus a merged bot
+state update in one transaction) and the trading cycle's queue -> flush ->
+background writer path, against a temporary SQLite database.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.bot_types.trading_types import ModelPrediction, SignalType
+from src.common.converters import DatabaseConverter
+from src.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Database manager over a fresh SQLite file."""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}")
+    yield manager
+    manager.engine.dispose()
+
+
+def make_prediction(symbol: str, direction: str = 'up') -> ModelPrediction:
+    """Build an ensemble prediction made now."""
+    return ModelPrediction(
+        symbol=symbol,
+        predicted_price=25.5,
+        direction=direction,
+        confidence=0.8,
+        features_used=['RSI', 'MACD'],
+        timestamp=datetime.now()
+    )
+
+
+def test_flush_batch_persists_predictions_signals_and_state(db, make_signal):
+    """One flush inserts every row and applies the bot state updates in order."""
+    writes = [
+        ('predictions', DatabaseConverter.prediction_to_dict(make_prediction('PLTR'))),
+        ('signals', DatabaseConverter.signal_to_dict(
+            make_signal('PLTR', timestamp=datetime.now(), quantity=10), 'executed'
+        )),
+        ('bot_state', {'is_running': True, 'trading_mode': 'manual'}),
+        ('predictions', DatabaseConverter.prediction_to_dict(make_prediction('AAPL', 'down'))),
+        ('signals', DatabaseConverter.signal_to_dict(
+            make_signal('AAPL', SignalType.SELL, timestamp=datetime.now()),
+            'rejected', rejected_reason='Max positions'
+        )),
+        ('bot_state', {'trading_mode': 'auto'}),
+    ]
+    
+    assert db.flush_batch(writes)
+    
+    pltr = db.get_predictions_by_symbol('PLTR')
+    aapl = db.get_predictions_by_symbol('AAPL')
+    assert len(pltr) == 1 and len(aapl) == 1
+    assert pltr[0]['direction'] == 'up'
+    assert pltr[0]['predicted_price'] == pytest.approx(25.5)
+    assert aapl[0]['direction'] == 'down'
+    
+    signals = {s['symbol']: s for s in db.get_signal_history(days=1)}
+    assert set(signals) == {'PLTR', 'AAPL'}
+    assert signals['PLTR']['status'] == 'executed'
+    assert signals['PLTR']['quantity'] == 10
+    assert signals['AAPL']['status'] == 'rejected'
+    assert signals['AAPL']['rejected_reason'] == 'Max positions'
+    
+    # Later updates win, earlier fields they don't touch are kept
+    state = db.get_bot_state()
+    assert state['is_running'] is True
+    assert state['trading_mode'] == 'auto'
+
+
+def test_flush_batch_empty_is_noop(db):
+    """An empty batch commits nothing and reports success."""
+    assert db.flush_batch([])
+    assert db.get_signal_history(days=1) == []
+
+
+def test_flush_batch_skips_unknown_tables(db):
+    """Writes for unknown tables are dropped without losing the rest."""
+    writes = [
+        ('orders', {'symbol': 'PLTR'}),
+        ('predictions', DatabaseConverter.prediction_to_dict(make_prediction('PLTR'))),
+    ]
+    
+    assert db.flush_batch(writes)
+    assert len(db.get_predictions_by_symbol('PLTR')) == 1
+
+
+def test_trading_cycle_writes_reach_database(db, make_orchestrator, make_signal):
+    """Queued cycle writes are flushed by the background DB writer."""
+    orchestrator = make_orchestrator(db=db)
+    
+    orchestrator._queue_prediction(make_prediction('PLTR'))
+    orchestrator._queue_signal(make_signal('PLTR', timestamp=datetime.now()), status='pending')
+    orchestrator._queue_db_write('bot_state', {'is_running': True})
+    orchestrator._flush_db_writes()
+    
+    # Wait for the writer to apply the batch
+    orchestrator.shutdown()
+    
+    assert orchestrator._pending_db_writes == []
+    assert len(db.get_predictions_by_symbol('PLTR')) == 1
+    assert [s['status'] for s in db.get_signal_history(days=1)] == ['pending']
+    assert db.get_bot_state()['is_running'] is True
@@ -0,0 +1,131 @@
+"""
+Unit tests for the ensemble's momentum signal, momentum fast path and
+batched prediction.
+
+Momentum is scored from the real FeatureEngineer's indicator columns; the
+LSTM is a stand-in and no Random Forest is loaded, so no model files or
+TensorFlow are needed.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from src.bot_types.trading_types import ModelPrediction
+from src.data.feature_engineer import FeatureEngineer
+from src.ml.ensemble import EnsemblePredictor
+
+
+@pytest.fixture
+def make_trend(make_bars):
+    """Factory for bars drifting by `drift` per bar with a little noise."""
+    def make(drift: float, seed: int = 1) -> pd.DataFrame:
+        return make_bars(seed=seed, drift=drift, volatility=0.005)
+    
+    return make
+
+
+def make_lstm_prediction(symbol: str, df: pd.DataFrame, probability: float) -> ModelPrediction:
+    """LSTM output for the last bar of df."""
+    return ModelPrediction(
+        symbol=symbol,
+        predicted_price=float(df['close'].iat[-1]),
+        direction='up' if probability > 0.5 else 'down',
+        confidence=abs(probability - 0.5) * 2,
+        features_used=[],
+        timestamp=datetime.now(),
+        model_name='lstm',
+        metadata={'probability': probability, 'current_price': float(df['close'].iat[-1])}
+    )
+
+
+@pytest.fixture
+def lstm():
+    """Stand-in LSTM predicting up for every symbol."""
+    predictor = MagicMock()
+    predictor.predict_next_day.side_effect = (
+        lambda df, symbol, df_features: make_lstm_prediction(symbol, df, 0.8)
+    )
+    predictor.predict_next_day_many.side_effect = lambda data, features: {
+        symbol: make_lstm_prediction(symbol, df, 0.8) for symbol, df in data.items()
+    }
+    return predictor
+
+
+def momentum(ensemble: EnsemblePredictor, df: pd.DataFrame) -> float:
+    """Momentum up-probability for the last bar of df."""
+    return ensemble._momentum_component(FeatureEngineer().calculate_technical_indicators(df))
+
+
+def test_momentum_follows_the_trend(lstm, make_trend):
+    """Momentum reads the engineer's columns, so it leaves 0.5 in a trend."""
+    ensemble = EnsemblePredictor(lstm_predictor=lstm)
+    
+    up = momentum(ensemble, make_trend(0.01))
+    down = momentum(ensemble, make_trend(-0.01))
+    
+    assert up > 0.6
+    assert down < 0.5
+    assert up != pytest.approx(0.5) and down != pytest.approx(0.5)
+
+
+def test_fast_path_reuses_last_components(lstm, make_trend):
+    """Strong momentum agreeing with the last LSTM output skips the models."""
+    ensemble = EnsemblePredictor(lstm_predictor=lstm, fast_path_threshold=0.1)
+    ensemble.rf_model = None
+    df = make_trend(0.01)
+    
+    first = ensemble.ensemble_predict(df.iloc[:-1], 'PLTR')
+    reused = ensemble._reusable_components(df, 'PLTR', momentum(ensemble, df))
+    second = ensemble.ensemble_predict(df, 'PLTR')
+    
+    assert reused is not None
+    assert reused[0].metadata['probability'] == 0.8
+    assert lstm.predict_next_day.call_count == 1
+    assert first.direction == second.direction == 'UP'
+
+
+def test_fast_path_applies_to_batches(lstm, make_trend):
+    """ensemble_predict_batch records components and leaves reused symbols out of the LSTM batch."""
+    ensemble = EnsemblePredictor(lstm_predictor=lstm, fast_path_threshold=0.1)
+    ensemble.rf_model = None
+    data = {'PLTR': make_trend(0.01, seed=1), 'AAPL': make_trend(0.01, seed=2)}
+    
+    ensemble.ensemble_predict_batch({symbol: df.iloc[:-1] for symbol, df in data.items()})
+    assert sorted(ensemble._last_components) == ['AAPL', 'PLTR']
+    
+    results = ensemble.ensemble_predict_batch(data)
+    
+    assert sorted(results) == ['AAPL', 'PLTR']
+    assert lstm.predict_next_day_many.call_count == 1
+
+
+def test_fast_path_off_by_default(lstm, make_trend):
+    """Without a threshold the LSTM runs on every new bar."""
+    ensemble = EnsemblePredictor(lstm_predictor=lstm)
+    ensemble.rf_model = None
+    df = make_trend(0.01)
+    
+    ensemble.ensemble_predict(df.iloc[:-1], 'PLTR')
+    ensemble.ensemble_predict(df, 'PLTR')
+    
+    assert lstm.predict_next_day.call_count == 2
+
+
+def test_single_symbol_batch_omits_failed_prediction(lstm, monkeypatch, make_trend):
+    """A lone symbol whose every component fails is left out, not raised."""
+    ensemble = EnsemblePredictor(lstm_predictor=lstm)
+    ensemble.rf_model = MagicMock()
+    lstm.predict_next_day.side_effect = RuntimeError("LSTM failed")
+    monkeypatch.setattr(
+        ensemble, '_predict_random_forest',
+        MagicMock(side_effect=RuntimeError("Random Forest failed"))
+    )
+    monkeypatch.setattr(
+        'src.ml.ensemble._momentum_probabilities',
+        MagicMock(side_effect=RuntimeError("momentum failed"))
+    )
+    
+    assert ensemble.ensemble_predict_batch({'PLTR': make_trend(0.01)}) == {}
@@ -0,0 +1,230 @@
+"""
+Unit tests for TradingCycleOrchestrator.
+
+Covers duplicate-order suppression (the in-flight signal keys, their
+dedup window and release on broker failure), resuming trading after a
+circuit breaker reset, the guard that skips overlapping cycle runs,
+growing the symbol pool after a config reload, prepared symbols
+reaching the batched ensemble prediction, reusing indicators for
+unchanged bars and draining queued DB writes on shutdown.
+Modules are stand-ins (apart from the FeatureEngineer in the batched
+prediction case), so no broker, data feed or database is touched.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from src.bot_types.trading_types import RiskMetrics, SignalType, TradingSignal
+from src.orchestrators import trading_cycle
+from src.orchestrators.risk_monitor import RiskMonitorOrchestrator
+from src.orchestrators.trading_cycle import TradingCycleOrchestrator
+
+
+@pytest.fixture
+def orchestrator(make_orchestrator):
+    """Trading cycle orchestrator over the stand-in modules."""
+    return make_orchestrator()
+
+
+def make_risk_metrics() -> RiskMetrics:
+    """Risk snapshot for an empty $10,000 portfolio."""
+    return RiskMetrics(
+        portfolio_value=10000.0,
+        cash_available=10000.0,
+        total_exposure=0.0,
+        total_exposure_percent=0.0,
+        daily_pnl=0.0,
+        daily_pnl_percent=0.0,
+        max_position_size=2000.0,
+        available_positions=5,
+        positions_used=0,
+        daily_loss_limit_reached=False,
+        portfolio_risk_percent=0.0
+    )
+
+
+def execute(orch: TradingCycleOrchestrator, signal: TradingSignal) -> bool:
+    """Execute a signal the way the cycle does, under the execution lock."""
+    with orch._execution_lock:
+        return orch._execute_signal(signal, make_risk_metrics(), {})
+
+
+def test_duplicate_signal_within_ttl_is_dropped(orchestrator, modules, make_signal):
+    """A second submit of the same (symbol, type, bar date) is not sent."""
+    assert execute(orchestrator, make_signal())
+    assert not execute(orchestrator, make_signal())
+    
+    assert modules['order_manager'].submit_order.call_count == 1
+
+
+def test_different_signals_are_not_deduplicated(orchestrator, modules, make_signal):
+    """Keys differ by symbol and signal type."""
+    assert execute(orchestrator, make_signal('PLTR', SignalType.BUY))
+    assert execute(orchestrator, make_signal('PLTR', SignalType.SELL))
+    assert execute(orchestrator, make_signal('AAPL', SignalType.BUY))
+    
+    assert modules['order_manager'].submit_order.call_count == 3
+
+
+def test_signal_allowed_again_after_ttl(orchestrator, modules, monkeypatch, make_signal):
+    """Once the dedup window has passed the same signal may be resubmitted."""
+    clock = [1000.0]
+    monkeypatch.setattr(trading_cycle.time, 'monotonic', lambda: clock[0])
+    
+    assert execute(orchestrator, make_signal())
+    
+    clock[0] += trading_cycle._DEDUP_TTL_SECONDS - 1
+    assert not execute(orchestrator, make_signal())
+    
+    clock[0] += 2
+    assert execute(orchestrator, make_signal())
+    assert modules['order_manager'].submit_order.call_count == 2
+
+
+def test_key_released_after_broker_failure(orchestrator, modules, make_signal):
+    """A rejected order frees its key so a retry is submitted."""
+    modules['order_manager'].submit_order.side_effect = [False, True]
+    
+    assert not execute(orchestrator, make_signal())
+    assert orchestrator._inflight == {}
+    
+    assert execute(orchestrator, make_signal())
+    assert modules['order_manager'].submit_order.call_count == 2
+
+
+def test_trading_resumes_after_circuit_breaker_reset(make_orchestrator, modules, make_signal):
+    """A tripped breaker blocks orders until it is reset."""
+    risk_monitor = RiskMonitorOrchestrator(modules['portfolio_monitor'], MagicMock(), MagicMock())
+    orch = make_orchestrator(risk_monitor=risk_monitor)
+    
+    risk_monitor.activate_circuit_breaker()
+    assert not execute(orch, make_signal())
+    
+    risk_monitor.reset_circuit_breaker()
+    assert execute(orch, make_signal())
+    assert modules['order_manager'].submit_order.call_count == 1
+    
+    risk_monitor.shutdown()
+    risk_monitor.db.update_bot_state.assert_called_with({'circuit_breaker_triggered': False})
+
+
+def test_overlapping_run_returns_early(orchestrator, modules):
+    """A run started while another is in progress skips without fetching."""
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+    
+    def slow_fetch(symbols, start_date, end_date):
+        fetch_started.set()
+        release_fetch.wait(timeout=5)
+        return {}
+    
+    modules['data_fetcher'].fetch_historical_data_multi.side_effect = slow_fetch
+    modules['data_fetcher'].fetch_latest_prices.return_value = {}
+    modules['portfolio_monitor'].get_risk_metrics.return_value = make_risk_metrics()
+    
+    first = threading.Thread(target=orchestrator.run)
+    first.start()
+    try:
+        assert fetch_started.wait(timeout=5)
+        
+        orchestrator.run()
+        
+        assert modules['data_fetcher'].fetch_historical_data_multi.call_count == 1
+    finally:
+        release_fetch.set()
+        first.join(timeout=5)
+    
+    # The guard is released once the first run finishes
+    modules['data_fetcher'].fetch_historical_data_multi.side_effect = None
+    modules['data_fetcher'].fetch_historical_data_multi.return_value = {
+        'PLTR': pd.DataFrame()
+    }
+    orchestrator.run()
+    assert modules['data_fetcher'].fetch_historical_data_multi.call_count == 2
+
+
+def test_pool_grows_when_reload_adds_symbols(orchestrator, modules):
+    """Symbols added by a config reload each get a worker from the next cycle."""
+    modules['data_fetcher'].fetch_historical_data_multi.return_value = {}
+    modules['data_fetcher'].fetch_latest_prices.return_value = {}
+    modules['portfolio_monitor'].get_risk_metrics.return_value = make_risk_metrics()
+    old_pool = orchestrator._pool
+    
+    config = MagicMock()
+    config.symbols = ['PLTR', 'AAPL', 'MSFT']
+    orchestrator.update_config(config)
+    
+    # The running pool is left alone until a cycle starts
+    assert orchestrator._pool is old_pool
+    
+    orchestrator.run()
+    
+    assert orchestrator._pool is not old_pool
+    assert orchestrator._pool._max_workers == 3
+    
+    # Removing symbols keeps the larger pool
+    config.symbols = ['PLTR']
+    orchestrator.update_config(config)
+    orchestrator.run()
+    assert orchestrator._pool._max_workers == 3
+
+
+def test_run_reaches_batched_prediction_with_real_features(make_orchestrator, make_bars, modules):
+    """Symbols prepared by the real FeatureEngineer reach ensemble_predict_batch."""
+    from src.data.feature_engineer import FeatureEngineer
+    
+    bars = make_bars()
+    
+    modules['feature_engineer'] = FeatureEngineer()
+    modules['data_validator'].validate_price_data.return_value = (True, [])
+    modules['data_fetcher'].fetch_historical_data_multi.return_value = {'PLTR': bars}
+    modules['data_fetcher'].fetch_latest_prices.return_value = {'PLTR': float(bars['close'].iat[-1])}
+    modules['portfolio_monitor'].get_risk_metrics.return_value = make_risk_metrics()
+    modules['ensemble'].ensemble_predict_batch.return_value = {}
+    
+    # Built after the real FeatureEngineer is in place, so prepare binds it
+    make_orchestrator().run()
+    
+    modules['ensemble'].ensemble_predict_batch.assert_called_once()
+    call = modules['ensemble'].ensemble_predict_batch.call_args
+    prepared = call.args[0]
+    assert list(prepared) == ['PLTR']
+    assert 'rsi' in prepared['PLTR'].columns
+    # The indicators calculated in prepare are handed over, not recalculated
+    assert call.kwargs['features'] is prepared
+
+
+def test_prepare_reuses_indicators_for_unchanged_bars(orchestrator, modules):
+    """Indicators are recalculated only when the fetched window changes."""
+    modules['data_validator'].validate_price_data.return_value = (True, [])
+    calculate = modules['feature_engineer'].calculate_technical_indicators
+    bars = pd.DataFrame(
+        {'close': [25.0, 25.5, 26.0], 'volume': [1e6, 1.1e6, 1.2e6]},
+        index=pd.bdate_range('2024-03-01', periods=3)
+    )
+    prepare, _ = orchestrator._build_pipeline('PLTR')
+    
+    first = prepare(bars)
+    assert prepare(bars.copy()) is first
+    assert calculate.call_count == 1
+    
+    # A rewritten partial last bar changes the window
+    rewritten = bars.copy()
+    rewritten.iloc[-1, 0] = 26.2
+    prepare(rewritten)
+    assert calculate.call_count == 2
+
+
+def test_shutdown_persists_queued_writes(orchestrator):
+    """shutdown() flushes queued writes and leaves usable pools behind."""
+    orchestrator._queue_db_write('bot_state', {'is_running': False})
+    old_writer = orchestrator._db_writer
+    
+    orchestrator.shutdown()
+    
+    orchestrator.db.flush_batch.assert_called_once_with([('bot_state', {'is_running': False})])
+    assert old_writer._shutdown
+    assert orchestrator._db_writer.submit(lambda: 1).result() == 1